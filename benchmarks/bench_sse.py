@@ -0,0 +1,120 @@
+"""
+Micro-benchmark: legacy line-based SSE parsing vs the byte-level SSEParser path.
+
+Both parsers read the same token-by-token stream through a real requests.Response,
+one SSE event per network read, like /chat/fast streams a reply.
+
+Run:
+  python benchmarks/bench_sse.py [--tokens 400] [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from phase1_tester.client.chat_client import SSEAccumulator  # noqa: E402
+
+
+class PacketRaw:
+    """Stand-in for urllib3's raw stream: every read returns the next network packet."""
+
+    def __init__(self, packets: list[bytes]):
+        self._packets = iter(packets)
+
+    def read(self, amt: Optional[int] = None, **kwargs) -> bytes:
+        return next(self._packets, b"")
+
+
+def make_packets(tokens: int) -> list[bytes]:
+    events = [{"session_id": "bench-session"}]
+    events += [{"type": "content", "delta": f"word{i} "} for i in range(tokens)]
+    events.append({"type": "done"})
+    packets = [f"data: {json.dumps(e)}\n\n".encode("utf-8") for e in events]
+    packets.append(b"data: [DONE]\n\n")
+    return packets
+
+
+def make_response(packets: list[bytes]) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.encoding = "utf-8"
+    resp.raw = PacketRaw(packets)
+    return resp
+
+
+def legacy_parse(response: requests.Response) -> str:
+    """The parser ChatClient used before SSEParser (iter_lines + strip + json.loads per line)."""
+    assistant_parts: list[str] = []
+    session_id = None
+    for line in response.iter_lines(decode_unicode=True):
+        if line is None:
+            continue
+        line = line.strip()
+        if not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]" or payload == "":
+            continue
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        if data.get("type") == "done":
+            break
+        if "session_id" in data:
+            session_id = data["session_id"] or session_id
+        if data.get("type") == "content":
+            delta = data.get("delta") or data.get("text") or ""
+        else:
+            delta = data.get("delta") or ""
+        if delta:
+            assistant_parts.append(delta if isinstance(delta, str) else str(delta))
+    return "".join(assistant_parts)
+
+
+def bytes_parse(response: requests.Response) -> str:
+    state = SSEAccumulator()
+    for chunk in response.iter_content(chunk_size=None):
+        if state.feed(chunk):
+            break
+    return state.result().assistant_text
+
+
+def bench(name: str, fn, packets: list[bytes], repeat: int) -> float:
+    expected = fn(make_response(packets))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        assert fn(make_response(packets)) == expected
+    elapsed = time.perf_counter() - start
+    per_event = elapsed / (repeat * len(packets)) * 1e6
+    print(f"{name:<10} {elapsed:8.3f}s total   {per_event:6.2f} us/event")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    packets = make_packets(args.tokens)
+    assert legacy_parse(make_response(packets)) == bytes_parse(make_response(packets))
+
+    print(f"{len(packets)} events x {args.repeat} streams")
+    legacy = bench("legacy", legacy_parse, packets, args.repeat)
+    new = bench("bytes", bytes_parse, packets, args.repeat)
+    print(f"speedup: {legacy / new:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+from .cassette import Cassette, CassetteExhausted, open_cassette
+
+__all__ = ["Cassette", "CassetteExhausted", "open_cassette"]
@@ -0,0 +1,99 @@
+"""JSONL record/replay cassettes for SSE streams, driver completions and logs payloads."""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Iterable, Iterator, Literal, Optional
+
+CassetteMode = Literal["record", "replay"]
+
+
+class CassetteExhausted(LookupError):
+    """Replay asked for more interactions of a kind than the cassette holds."""
+
+
+class Cassette:
+    """
+    One JSON object per line: {"kind": "chat"|"driver"|"logs"|"log_poll", ...}.
+      - record: every interaction is appended (and flushed) as it happens
+      - replay: interactions are served back FIFO per kind, so a run replays
+        correctly as long as it makes the same calls in the same order.
+    Recorded runs should be single-session (or serial): concurrent sessions
+    interleave their interactions on the tape.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode, realtime: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        # replay only: sleep the recorded inter-event gaps instead of running at full speed
+        self.realtime = realtime
+        self._lock = threading.Lock()
+        self._file = None
+        self._tape: dict[str, deque] = defaultdict(deque)
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8")
+        else:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self._tape[entry["kind"]].append(entry)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, kind: str, **data: Any) -> None:
+        if not self.recording:
+            return
+        line = json.dumps({"kind": kind, **data}, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def next(self, kind: str) -> dict[str, Any]:
+        with self._lock:
+            tape = self._tape.get(kind)
+            if not tape:
+                raise CassetteExhausted(f"No more recorded '{kind}' interactions in {self.path}")
+            return tape.popleft()
+
+    def play_events(self, events: Iterable[list]) -> Iterator[str]:
+        """Yield recorded SSE lines; events are [seconds_since_request, line] pairs."""
+        started = time.perf_counter()
+        for offset, line in events:
+            if self.realtime:
+                wait = started + offset - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            yield line
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_cassette(mode: Optional[str], path: str, realtime: bool = False) -> Optional[Cassette]:
+    """Cassette for the configured mode, or None when record/replay is off."""
+    if not mode:
+        return None
+    return Cassette(path, mode, realtime=realtime)
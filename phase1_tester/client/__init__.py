@@ -1,3 +1,4 @@
 from .chat_client import ChatClient
+from .async_chat_client import AsyncChatClient
 
-__all__ = ["ChatClient"]
+__all__ = ["ChatClient", "AsyncChatClient"]
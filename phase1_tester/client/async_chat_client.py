@@ -0,0 +1,168 @@
+"""Asyncio SSE chat client: many concurrent chat streams on one event loop."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+import aiohttp
+
+from phase1_tester.client.chat_client import DRAIN_MAX_BYTES, SSEAccumulator
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded, call_timeout
+from phase1_tester.client.rate_limit import CHAT, RateLimiter, get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.config.config import (
+    HTTP_POOL_MAXSIZE,
+    HTTP_KEEP_ALIVE,
+    HTTP_KEEPALIVE_TIMEOUT_SEC,
+)
+from phase1_tester.config.types import StreamEvent
+
+if TYPE_CHECKING:
+    from phase1_tester.config.types import ChatResult
+
+
+class AsyncChatClient:
+    """Async counterpart of ChatClient with the same ChatResult contract and retry semantics."""
+
+    def __init__(
+        self,
+        api_url: str,
+        user_id: str,
+        timeout_sec: int,
+        retry_count: int,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.api_url = api_url
+        self.user_id = user_id
+        self.timeout_sec = timeout_sec
+        self.retry_count = retry_count
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=retry_count)
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the loop that actually runs the requests.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=HTTP_POOL_MAXSIZE,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SEC if HTTP_KEEP_ALIVE else None,
+                force_close=not HTTP_KEEP_ALIVE,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncChatClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def send_message(
+        self,
+        content: str,
+        session_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> "ChatResult":
+        """Send a message and stream the response. Retries on failure."""
+        async for event in self.stream_message(content, session_id, deadline=deadline):
+            if event.kind == "error":
+                raise event.exc or RuntimeError(event.error)
+            if event.kind == "done":
+                return event.result
+        raise RuntimeError("send_message: stream ended without a result")
+
+    async def stream_message(
+        self,
+        content: str,
+        session_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Async-iterator twin of ChatClient.stream_message (same events, same retry rules)."""
+        last_error: Optional[Exception] = None
+        waited = 0.0
+        for attempt in range(self.retry_policy.max_attempts):
+            state: Optional[SSEAccumulator] = None
+            try:
+                body = {
+                    "userId": self.user_id,
+                    "content": content,
+                    "stream": True,
+                }
+                if session_id is not None:
+                    body["session_id"] = session_id
+                waited += await self.rate_limiter.acquire_async(CHAT, deadline=deadline)
+                # Like requests' timeout=, this bounds connect and each read; with a
+                # deadline, `total` also caps the whole stream at the time left.
+                per_call = call_timeout(deadline, self.timeout_sec)
+                timeout = aiohttp.ClientTimeout(
+                    total=deadline.remaining() if deadline is not None else None,
+                    sock_connect=per_call,
+                    sock_read=per_call,
+                )
+                started = time.perf_counter()
+                async with self._get_session().post(
+                    self.api_url,
+                    json=body,
+                    timeout=timeout,
+                    headers={"Accept": "text/event-stream"},
+                ) as resp:
+                    resp.raise_for_status()
+                    state = SSEAccumulator(started)
+                    state.rate_limit_wait_sec = waited
+                    async for event in self._parse_sse(resp, state, deadline):
+                        yield event
+                return
+            except Exception as e:
+                last_error = e
+                if isinstance(e, asyncio.TimeoutError) and deadline is not None and deadline.expired():
+                    last_error = DeadlineExceeded("deadline exceeded mid-stream")
+                received = state is not None and state.first_byte_at is not None
+                delay = self.retry_policy.next_delay(last_error, attempt, bytes_received=received, deadline=deadline)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        yield StreamEvent(
+            kind="error",
+            error=str(last_error or "send_message failed after retries"),
+            exc=last_error,
+        )
+
+    @staticmethod
+    async def _drain_tail(response: aiohttp.ClientResponse, deadline: Optional[Deadline]) -> None:
+        """Read what follows `done` (see ChatClient._drain_tail), so the connection goes back to the pool."""
+        drained = 0
+        async for chunk in response.content.iter_any():
+            drained += len(chunk)
+            if drained > DRAIN_MAX_BYTES or (deadline is not None and deadline.expired()):
+                response.close()
+                return
+        response.release()
+
+    async def _parse_sse(
+        self,
+        response: aiohttp.ClientResponse,
+        state: SSEAccumulator,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Parse SSE stream into `state` and yield events; the final `done` event carries the ChatResult."""
+        async for chunk in response.content.iter_any():
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded("deadline exceeded mid-stream")
+            done = state.feed(chunk)
+            for event in state.drain():
+                yield event
+            if done:
+                await self._drain_tail(response, deadline)
+                break
+        else:
+            state.finish()
+            for event in state.drain():
+                yield event
+        yield state.done_event()
@@ -1,26 +1,91 @@
 """SSE chat client for the production real-estate agent endpoint."""
 
 import json
-from typing import TYPE_CHECKING, Optional , Any
+import time
+from typing import TYPE_CHECKING, Iterator, Optional , Any
 import requests
 
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded, call_timeout
+from phase1_tester.client.http_pool import get_shared_session
+from phase1_tester.client.rate_limit import CHAT, RateLimiter, get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.client.sse import SSEEvent, SSEParser, fast_content_chunk, fast_content_delta
+from phase1_tester.config.types import StreamEvent
+
 if TYPE_CHECKING:
-    from phase1_tester.config.types import ChatResult
+    from phase1_tester.cassette.cassette import Cassette
+    from phase1_tester.config.types import ChatResult, StreamTiming
+
+# After `done` only the [DONE] frame and the chunked terminator should follow;
+# a server that keeps sending past this gets its connection closed instead.
+DRAIN_MAX_BYTES = 64 * 1024
 
 
 class ChatClient:
     """Client for the production chat SSE endpoint."""
 
-    def __init__(self, api_url: str, user_id: str, timeout_sec: int, retry_count: int):
+    def __init__(
+        self,
+        api_url: str,
+        user_id: str,
+        timeout_sec: int,
+        retry_count: int,
+        session: Optional[requests.Session] = None,
+        cassette: Optional["Cassette"] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.api_url = api_url
         self.user_id = user_id
         self.timeout_sec = timeout_sec
         self.retry_count = retry_count
+        # Also shared with the LogsApiClient the orchestrator builds, so both spend one budget.
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=retry_count)
+        # Keep-alive pool shared with LogsApiClient unless a session is passed in.
+        self.session = session or get_shared_session()
+        self.cassette = cassette
+        # Also handed to the LogsApiClient; the process-wide limiter by default.
+        self.rate_limiter = rate_limiter or get_shared_limiter()
 
-    def send_message(self, content: str, session_id: Optional[str] ) -> "ChatResult":
+    def send_message(
+        self,
+        content: str,
+        session_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> "ChatResult":
         """Send a message and stream the response. Retries on failure."""
-        last_error = None
-        for attempt in range(self.retry_count):
+        for event in self.stream_message(content, session_id, deadline=deadline):
+            if event.kind == "error":
+                raise event.exc or RuntimeError(event.error)
+            if event.kind == "done":
+                return event.result
+        raise RuntimeError("send_message: stream ended without a result")
+
+    def stream_message(
+        self,
+        content: str,
+        session_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[StreamEvent]:
+        """
+        Send a message and yield typed events as they arrive:
+          session_id -> delta ... -> done (carries the ChatResult), or error.
+        Failed attempts are retried per `retry_policy`, but never once any SSE
+        bytes were received: the agent may already have stored the user turn, and
+        the consumer would see deltas twice. Errors end the stream with an `error`
+        event instead of raising.
+        With a `deadline`, connect/read timeouts shrink to the time left and the
+        stream is aborted (DeadlineExceeded) as soon as the deadline passes.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            yield from self._replay()
+            return
+
+        recording = self.cassette is not None and self.cassette.recording
+        last_error: Optional[Exception] = None
+        waited = 0.0
+        for attempt in range(self.retry_policy.max_attempts):
+            state: Optional[SSEAccumulator] = None
             try:
                 body = {
                     "userId": self.user_id,
@@ -30,65 +95,257 @@ class ChatClient:
                 }
                 if session_id is not None:
                     body["session_id"] = session_id
-                resp = requests.post(
+                # Limiter waits are ours, not the agent's: keep them out of the timings.
+                waited += self.rate_limiter.acquire(CHAT, deadline=deadline)
+                started = time.perf_counter()
+                resp = self.session.post(
                     self.api_url,
                     json=body,
                     stream=True,
-                    timeout=self.timeout_sec,
+                    timeout=call_timeout(deadline, self.timeout_sec),
                     headers={"Accept": "text/event-stream"},
                 )
                 resp.raise_for_status()
-                return self._parse_sse(resp)
+                state = SSEAccumulator(started, keep_events=recording)
+                state.rate_limit_wait_sec = waited
+                yield from self._parse_sse(resp, state, request=body, deadline=deadline)
+                return
             except Exception as e:
                 last_error = e
-                continue
-        raise last_error or RuntimeError("send_message failed after retries")
+                received = state is not None and state.first_byte_at is not None
+                delay = self.retry_policy.next_delay(e, attempt, bytes_received=received, deadline=deadline)
+                if delay is None:
+                    break
+                time.sleep(delay)
+        error = str(last_error or "send_message failed after retries")
+        if self.cassette is not None:
+            self.cassette.record("chat", error=error)
+        yield StreamEvent(kind="error", error=error, exc=last_error)
 
-    def _parse_sse(self, response: requests.Response) -> "ChatResult":
-        """Parse SSE stream and accumulate assistant text and session_id."""
-        from phase1_tester.config.types import ChatResult
+    def _parse_sse(
+        self,
+        response: requests.Response,
+        state: "SSEAccumulator",
+        request: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[StreamEvent]:
+        """Parse SSE stream into `state` and yield events; the final `done` event carries the ChatResult."""
+        # Raw bytes as they arrive: no per-line decode/strip, chunk boundaries handled by SSEParser.
+        chunks = response.iter_content(chunk_size=None)
+        completed = False
+        try:
+            for chunk in chunks:
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded("deadline exceeded mid-stream")
+                done = state.feed(chunk)
+                yield from state.drain()
+                if done:
+                    self._drain_tail(response, chunks, deadline)
+                    break
+            else:
+                state.finish()
+                yield from state.drain()
+                response.close()
+            completed = True
+        finally:
+            # The deadline, a parse error, or a consumer that stopped reading left the
+            # body half-read: close the connection rather than leave it open.
+            if not completed:
+                response.close()
+        if state.events is not None:
+            self.cassette.record("chat", request=request, events=state.events)
+        yield state.done_event()
 
-        assistant_parts: list[str] = []
-        session_id: Optional[str] = None
-        raw_events_count = 0
-        done = False
-
-        for line in response.iter_lines(decode_unicode=True):
-            if line is None:
-                continue
-            line = line.strip()
-            if not line.startswith("data:"):
-                continue
-            raw_events_count += 1
-            payload = line[5:].strip()
-            if payload == "[DONE]" or payload == "":
-                continue
-            try:
-                data = json.loads(payload)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(data, dict):
-                continue
-            if data.get("type") == "done":
-                done = True
+    @staticmethod
+    def _drain_tail(response: requests.Response, chunks: Iterator[bytes], deadline: Optional[Deadline]) -> None:
+        """
+        Read what follows `done` to the end of the body, so urllib3 can hand the
+        connection back to the keep-alive pool instead of dropping it.
+        """
+        drained = 0
+        for chunk in chunks:
+            drained += len(chunk)
+            if drained > DRAIN_MAX_BYTES or (deadline is not None and deadline.expired()):
                 break
-            if "session_id" in data:
-                session_id = data["session_id"] or session_id
-            delta = ""
-            if data.get("type") == "content":
-                delta = data.get("delta") or data.get("text") or ""
-            else:
-                delta = data.get("delta") or ""
-            if delta:
-                assistant_parts.append(delta if isinstance(delta, str) else str(delta))
+        # Body fully read: this only releases the connection; otherwise it closes it.
+        response.close()
 
-        assistant_text = "".join(assistant_parts)
-        return ChatResult(
-            assistant_text=assistant_text,
-            session_id=session_id,
-            raw_events_count=raw_events_count,
+    def _replay(self) -> Iterator[StreamEvent]:
+        """Serve the next recorded SSE stream through the same parser, without the network."""
+        entry = self.cassette.next("chat")
+        if entry.get("error") is not None:
+            yield StreamEvent(kind="error", error=entry["error"])
+            return
+        state = SSEAccumulator()
+        for line in self.cassette.play_events(entry["events"]):
+            done = state.feed(line.encode("utf-8") + b"\n\n")
+            yield from state.drain()
+            if done:
+                break
+        else:
+            state.finish()
+            yield from state.drain()
+        yield state.done_event()
+
+
+class SSEAccumulator:
+    """Incremental state for one SSE reply: fed raw byte chunks by the sync and async clients."""
+
+    def __init__(self, started: Optional[float] = None, keep_events: bool = False) -> None:
+        self.assistant_parts: list[str] = []
+        # [seconds_since_request, "data: ..."] pairs, kept only for cassette recording
+        self.events: Optional[list[list]] = [] if keep_events else None
+        self.session_id: Optional[str] = None
+        self.raw_events_count = 0
+        self.done = False
+        self._parser = SSEParser()
+        # typed events produced since the last drain()
+        self._out: list["StreamEvent"] = []
+        # timings (perf_counter, seconds)
+        self.started = time.perf_counter() if started is None else started
+        self.first_byte_at: Optional[float] = None
+        self.first_delta_at: Optional[float] = None
+        self.last_delta_at: Optional[float] = None
+        # when `done` arrived, or the body ended without it: the end of stream_sec
+        self.ended_at: Optional[float] = None
+        self.max_gap = 0.0
+        self.gap_total = 0.0
+        self.deltas = 0
+        self.rate_limit_wait_sec = 0.0
+
+    def _add_delta(self, delta: str, now: Optional[float] = None) -> None:
+        self._mark_delta(now)
+        self.assistant_parts.append(delta)
+        self._out.append(StreamEvent(kind="delta", text=delta))
+
+    def drain(self) -> list["StreamEvent"]:
+        """Typed events produced since the previous call."""
+        out, self._out = self._out, []
+        return out
+
+    def _mark_delta(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.perf_counter()
+        if self.first_delta_at is None:
+            self.first_delta_at = now
+        else:
+            gap = now - self.last_delta_at
+            self.gap_total += gap
+            self.max_gap = max(self.max_gap, gap)
+        self.last_delta_at = now
+        self.deltas += 1
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume one raw chunk of the body. Returns True once the `done` event is seen."""
+        if not chunk:
+            return False
+        now = time.perf_counter()
+        if self.first_byte_at is None:
+            self.first_byte_at = now
+        if self.events is None:
+            # Hot path: the chunk is one plain content event, no parser or json.loads needed.
+            delta = fast_content_chunk(self._parser, chunk)
+            if delta is not None:
+                self.raw_events_count += 1
+                if delta:
+                    self._add_delta(delta, now)
+                return False
+        for event in self._parser.feed(chunk):
+            if self.events is not None:
+                self._keep_event(event)
+            self.raw_events_count += event.lines
+            delta = fast_content_delta(event.data)
+            if delta is None:
+                if self._on_data(event.data, split_lines=event.lines > 1):
+                    return True
+            elif delta:
+                self._add_delta(delta, now)
+        return False
+
+    def finish(self) -> None:
+        """Stream ended: handle an event left without its trailing blank line."""
+        for event in self._parser.flush():
+            if self._on_event(event):
+                break
+        self._mark_end()
+
+    def _mark_end(self) -> None:
+        if self.ended_at is None:
+            self.ended_at = time.perf_counter()
+
+    def _on_event(self, event: SSEEvent) -> bool:
+        if self.events is not None:
+            self._keep_event(event)
+        self.raw_events_count += event.lines
+        return self._on_data(event.data, split_lines=event.lines > 1)
+
+    def _keep_event(self, event: SSEEvent) -> None:
+        text = event.data.decode("utf-8", errors="replace")
+        self.events.append(
+            [round(time.perf_counter() - self.started, 4), "\n".join("data: " + l for l in text.split("\n"))]
         )
 
+    def _on_data(self, payload: bytes, split_lines: bool = False) -> bool:
+        payload = payload.strip()
+        if payload == b"[DONE]" or payload == b"":
+            return False
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            # Servers that omit the blank line between events send several JSON
+            # documents as one multi-line event: handle them one line at a time.
+            if split_lines:
+                return any(self._on_data(line) for line in payload.split(b"\n"))
+            return False
+        if not isinstance(data, dict):
+            return False
+        if data.get("type") == "done":
+            self.done = True
+            self._mark_end()
+            return True
+        if "session_id" in data:
+            new_session_id = data["session_id"] or self.session_id
+            if new_session_id != self.session_id:
+                self.session_id = new_session_id
+                self._out.append(StreamEvent(kind="session_id", session_id=new_session_id))
+        delta = ""
+        if data.get("type") == "content":
+            delta = data.get("delta") or data.get("text") or ""
+        else:
+            delta = data.get("delta") or ""
+        if delta:
+            self._add_delta(delta if isinstance(delta, str) else str(delta))
+        return False
+
+    def timing(self) -> "StreamTiming":
+        from phase1_tester.config.types import StreamTiming
+
+        def since_start(t: Optional[float]) -> Optional[float]:
+            return None if t is None else t - self.started
+
+        return StreamTiming(
+            ttfb_sec=since_start(self.first_byte_at),
+            ttft_sec=since_start(self.first_delta_at),
+            # not result() time: draining the tail after `done` is not part of the stream
+            stream_sec=(self.ended_at if self.ended_at is not None else time.perf_counter()) - self.started,
+            max_gap_sec=self.max_gap,
+            mean_gap_sec=self.gap_total / (self.deltas - 1) if self.deltas > 1 else 0.0,
+            deltas=self.deltas,
+        )
+
+    def done_event(self) -> "StreamEvent":
+        return StreamEvent(kind="done", session_id=self.session_id, result=self.result())
+
+    def result(self) -> "ChatResult":
+        from phase1_tester.config.types import ChatResult
+
+        return ChatResult(
+            assistant_text="".join(self.assistant_parts),
+            session_id=self.session_id,
+            raw_events_count=self.raw_events_count,
+            timing=self.timing(),
+            rate_limit_wait_sec=self.rate_limit_wait_sec,
+        )
 
 """
     def fetch_logs(
@@ -0,0 +1,48 @@
+"""End-to-end deadline carried from the orchestrator into every HTTP/OpenAI call."""
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """The run's time budget ran out (before or during a call)."""
+
+
+class Deadline:
+    """
+    A fixed point on the monotonic clock. Clients use timeout() to shrink their
+    per-call timeout to what is left, and check() to abort work in progress.
+    Deadline(None) never expires.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: Optional[float]):
+        self.expires_at: Optional[float] = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        if self.expired():
+            raise DeadlineExceeded("deadline exceeded")
+
+    def timeout(self, default: float) -> float:
+        """`default` shrunk to the remaining budget; raises once nothing is left."""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline exceeded")
+        return min(default, remaining)
+
+
+def call_timeout(deadline: Optional[Deadline], default: float) -> float:
+    """Per-call timeout: `default`, shrunk to the deadline when there is one."""
+    return default if deadline is None else deadline.timeout(default)
@@ -0,0 +1,47 @@
+"""Shared keep-alive HTTP connection pool for the chat and logs clients."""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from phase1_tester.config.config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_KEEP_ALIVE,
+)
+
+
+def build_session(
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    keep_alive: bool = HTTP_KEEP_ALIVE,
+) -> requests.Session:
+    """
+    Build a requests.Session backed by a sized urllib3 pool.
+      - pool_connections: number of per-host pools kept
+      - pool_maxsize: max connections kept alive per host
+      - keep_alive: False sends `Connection: close` (fresh TCP + TLS every request)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Process-wide session reused by every ChatClient/LogsApiClient that is not given its own."""
+    global _shared_session
+
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = build_session()
+        return _shared_session
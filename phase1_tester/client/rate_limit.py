@@ -0,0 +1,196 @@
+"""
+Token-bucket rate limits shared by every client in the process (and optionally
+by every process on the host), so a load run stays under OpenAI's RPM/TPM and
+does not overload the agent.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # not POSIX: cross-process buckets are unavailable
+    fcntl = None  # type: ignore[assignment]
+
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded
+from phase1_tester.config.config import (
+    CHAT_RATE_PER_SEC,
+    CHAT_BURST,
+    LOGS_RATE_PER_SEC,
+    LOGS_BURST,
+    OPENAI_REQUESTS_PER_MIN,
+    OPENAI_TOKENS_PER_MIN,
+    RATE_LIMIT_DIR,
+)
+from phase1_tester.metrics.histogram import HistogramSet
+
+# Bucket names used by the clients.
+CHAT = "chat"
+LOGS = "logs"
+OPENAI_REQUESTS = "openai_requests"
+OPENAI_TOKENS = "openai_tokens"
+
+
+class TokenBucket:
+    """
+    `rate` tokens per second, at most `burst` stored. acquire() reserves its tokens
+    immediately (the balance may go negative) and then sleeps outside the lock, so
+    waiters are served in arrival order and never spin.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be > 0")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take `n` tokens and return how long to wait before using them, or None
+        (nothing taken) when that wait would be longer than `max_wait`.
+        """
+        n = min(n, self.burst)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (n - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= n
+            return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    TokenBucket whose balance lives in a small JSON file guarded by flock(), so
+    several load processes on one host share the same limit.
+    """
+
+    def __init__(self, path: str, rate: float, burst: float):
+        if fcntl is None:
+            raise RuntimeError("cross-process rate limiting needs fcntl (POSIX)")
+        super().__init__(rate, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def reserve(self, n: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        n = min(n, self.burst)
+        # The thread lock keeps flock() (which is per open file) from being re-entered.
+        with self._lock, open(self.path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+                # Wall clock: monotonic time is not comparable across processes.
+                now = time.time()
+                tokens = float(state.get("tokens", self.burst))
+                updated = float(state.get("updated", now))
+                tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+                wait = max(0.0, (n - tokens) / self.rate)
+                if max_wait is not None and wait > max_wait:
+                    return None
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": tokens - n, "updated": now}))
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """
+    Named buckets plus wait-time metrics. A name without a bucket is unlimited, so
+    clients can always acquire() and the limits are switched on from config.
+    Waits land in `histograms` as "ratelimit_<name>" (seconds, zero waits included).
+    """
+
+    def __init__(self, buckets: Optional[dict[str, TokenBucket]] = None):
+        self.buckets: dict[str, TokenBucket] = dict(buckets or {})
+        self.histograms = HistogramSet()
+        self.waited: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, name: str, n: float, deadline: Optional[Deadline]) -> float:
+        bucket = self.buckets.get(name)
+        if bucket is None:
+            return 0.0
+        max_wait = deadline.remaining() if deadline is not None else None
+        wait = bucket.reserve(n, max_wait)
+        if wait is None:
+            raise DeadlineExceeded(f"rate limit wait for {name} exceeds the deadline")
+        self.histograms.record(f"ratelimit_{name}", wait)
+        if wait > 0:
+            with self._lock:
+                self.waited[name] = self.waited.get(name, 0) + 1
+        return wait
+
+    def acquire(self, name: str, n: float = 1.0, deadline: Optional[Deadline] = None) -> float:
+        """Block until `n` tokens of `name` are available; returns the time waited."""
+        wait = self._reserve(name, n, deadline)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, name: str, n: float = 1.0, deadline: Optional[Deadline] = None) -> float:
+        wait = self._reserve(name, n, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def build_limiter(
+    chat_rate: Optional[float] = CHAT_RATE_PER_SEC,
+    chat_burst: float = CHAT_BURST,
+    logs_rate: Optional[float] = LOGS_RATE_PER_SEC,
+    logs_burst: float = LOGS_BURST,
+    openai_rpm: Optional[float] = OPENAI_REQUESTS_PER_MIN,
+    openai_tpm: Optional[float] = OPENAI_TOKENS_PER_MIN,
+    shared_dir: Optional[str] = RATE_LIMIT_DIR,
+) -> RateLimiter:
+    """
+    Limiter with one bucket per configured limit (None = unlimited). OpenAI limits
+    are per minute with a one-minute burst, like the API's own accounting.
+    With `shared_dir`, buckets are files in that directory shared across processes.
+    """
+
+    def make(name: str, rate: float, burst: float) -> TokenBucket:
+        if shared_dir:
+            return FileTokenBucket(os.path.join(shared_dir, f"{name}.bucket"), rate, burst)
+        return TokenBucket(rate, burst)
+
+    buckets: dict[str, TokenBucket] = {}
+    if chat_rate:
+        buckets[CHAT] = make(CHAT, chat_rate, chat_burst)
+    if logs_rate:
+        buckets[LOGS] = make(LOGS, logs_rate, logs_burst)
+    if openai_rpm:
+        buckets[OPENAI_REQUESTS] = make(OPENAI_REQUESTS, openai_rpm / 60.0, openai_rpm)
+    if openai_tpm:
+        buckets[OPENAI_TOKENS] = make(OPENAI_TOKENS, openai_tpm / 60.0, openai_tpm)
+    return RateLimiter(buckets)
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter() -> RateLimiter:
+    """Process-wide limiter used by every client that is not given its own."""
+    global _shared_limiter
+
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = build_limiter()
+        return _shared_limiter
@@ -0,0 +1,154 @@
+"""Shared retry policy: error classification, exponential backoff with jitter, retry budget."""
+
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+import aiohttp
+import openai
+import requests
+
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded
+from phase1_tester.config.config import (
+    RETRY_BASE_DELAY_SEC,
+    RETRY_MAX_DELAY_SEC,
+    RETRY_MAX_RETRY_AFTER_SEC,
+    RETRY_BUDGET,
+)
+
+RETRYABLE_STATUS: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Caps the number of retries across everything that shares it (one run, all sessions),
+    so an agent hiccup cannot turn into a retry storm.
+    """
+
+    def __init__(self, max_retries: int = RETRY_BUDGET):
+        self.max_retries = max_retries
+        self.spent = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.spent >= self.max_retries:
+                self.denied += 1
+                return False
+            self.spent += 1
+            return True
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delay-seconds or an HTTP-date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def classify(exc: BaseException) -> tuple[bool, Optional[float]]:
+    """
+    (retryable, retry_after_sec) for an exception raised by requests, aiohttp or openai.
+    Retryable: connect errors, timeouts, 429 and 5xx. Everything else (4xx,
+    invalid JSON, bugs) fails fast.
+    """
+    status: Optional[int] = None
+    headers: Any = None
+
+    if isinstance(exc, DeadlineExceeded):
+        return False, None
+    if isinstance(exc, requests.HTTPError):
+        if exc.response is not None:
+            status = exc.response.status_code
+            headers = exc.response.headers
+    elif isinstance(exc, aiohttp.ClientResponseError):
+        status = exc.status
+        headers = exc.headers
+    elif isinstance(exc, openai.APIStatusError):
+        status = exc.status_code
+        headers = exc.response.headers
+    elif isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True, None
+    elif isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError, TimeoutError)):
+        return True, None
+    elif isinstance(exc, openai.APIConnectionError):  # includes APITimeoutError
+        return True, None
+
+    if status is None or status not in RETRYABLE_STATUS:
+        return False, None
+    retry_after = _parse_retry_after(headers.get("Retry-After")) if headers is not None else None
+    return True, retry_after
+
+
+class RetryPolicy:
+    """
+    Decides whether (and after how long) a failed attempt is retried.
+      - max_attempts: total attempts, first try included (the old RETRY_COUNT)
+      - backoff: full jitter, uniform(0, min(max_delay, base * 2**retry))
+      - Retry-After from 429/503 is honoured (capped at max_retry_after)
+      - each retry spends one unit of the shared RetryBudget
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay_sec: float = RETRY_BASE_DELAY_SEC,
+        max_delay_sec: float = RETRY_MAX_DELAY_SEC,
+        max_retry_after_sec: float = RETRY_MAX_RETRY_AFTER_SEC,
+        budget: Optional[RetryBudget] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.max_retry_after_sec = max_retry_after_sec
+        self.budget = budget if budget is not None else RetryBudget()
+        self._rng = rng or random.Random()
+
+    def backoff(self, retry_index: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number retry_index (0-based)."""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after_sec)
+        cap = min(self.max_delay_sec, self.base_delay_sec * (2 ** retry_index))
+        return self._rng.uniform(0, cap)
+
+    def next_delay(
+        self,
+        exc: BaseException,
+        attempt: int,
+        bytes_received: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """
+        Delay before the next attempt, or None to give up. `attempt` is the 0-based
+        index of the attempt that just failed. Once any response bytes were received
+        the request is never retried: the agent may already have stored the user turn.
+        No retry is started that could not begin before the deadline.
+        """
+        if bytes_received or attempt + 1 >= self.max_attempts:
+            return None
+        retryable, retry_after = classify(exc)
+        if not retryable:
+            return None
+        delay = self.backoff(attempt, retry_after)
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and delay >= remaining:
+            return None
+        if not self.budget.try_spend():
+            return None
+        return delay
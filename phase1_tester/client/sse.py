@@ -0,0 +1,128 @@
+"""Incremental Server-Sent Events parser over raw bytes."""
+
+import re
+from typing import NamedTuple, Optional
+
+
+class SSEEvent(NamedTuple):
+    data: bytes               # data: lines joined with b"\n" (still raw UTF-8)
+    event: Optional[bytes]    # event: field, if any
+    id: Optional[bytes]       # id: field, if any
+    lines: int                # number of data: lines in the event
+
+
+class SSEParser:
+    """
+    Feed raw chunks as they arrive; get back complete events.
+
+    - lines may end in \\n, \\r\\n or \\r, and chunks may split anywhere:
+      mid-line, between \\r and \\n, or inside a multi-byte UTF-8 sequence
+      (nothing is decoded here, so that is safe by construction)
+    - multi-line data: fields are joined with \\n, event:/id: are kept,
+      comment lines (":...") and unknown fields are ignored
+    - lines are split in C (bytes.split) and only data values are sliced;
+      nothing is decoded or stripped per line
+    """
+
+    __slots__ = ("_buf", "_data", "_event", "_id", "_after_cr")
+
+    def __init__(self) -> None:
+        self._buf = b""
+        self._data: list[bytes] = []
+        self._event: Optional[bytes] = None
+        self._id: Optional[bytes] = None
+        # last chunk ended in \r: a leading \n in the next chunk belongs to that line break
+        self._after_cr = False
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        if not chunk:
+            return []
+        if self._after_cr:
+            self._after_cr = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        buf = self._buf + chunk if self._buf else chunk
+        if b"\r" in buf:
+            # Rare: normalise \r\n and bare \r to \n. A trailing \r may be the
+            # first half of a \r\n split across chunks.
+            self._after_cr = buf.endswith(b"\r")
+            buf = buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        lines = buf.split(b"\n")
+        self._buf = lines.pop()  # incomplete tail (b"" when buf ended with a newline)
+        events: list[SSEEvent] = []
+        data = self._data
+        for line in lines:
+            if not line:
+                # blank line: dispatch
+                if data:
+                    events.append(SSEEvent(b"\n".join(data), self._event, self._id, len(data)))
+                    data = self._data = []
+                    self._event = None
+            elif line.startswith(b"data:"):
+                data.append(line[6:] if line[5:6] == b" " else line[5:])
+            else:
+                self._field(line)
+        return events
+
+    @property
+    def pending(self) -> bool:
+        """True while a partial line or an undispatched event is buffered."""
+        return bool(self._buf or self._data or self._after_cr)
+
+    def _field(self, line: bytes) -> None:
+        if line[:1] == b":":  # comment
+            return
+        name, sep, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value
+        elif name == b"id":
+            self._id = value
+
+    def flush(self) -> list[SSEEvent]:
+        """Dispatch whatever is pending when the stream ends without a final blank line."""
+        tail, self._buf = self._buf, b""
+        return self.feed(tail + b"\n\n") if tail or self._data else []
+
+
+_CONTENT_PREFIXES: tuple[bytes, ...] = (
+    b'{"type": "content", "delta": "',
+    b'{"type":"content","delta":"',
+)
+# A whole "data: <content event>\n\n" chunk, as token streams usually arrive.
+_CONTENT_CHUNK_PREFIXES: tuple[bytes, ...] = tuple(b"data: " + p for p in _CONTENT_PREFIXES)
+# Anything that needs real JSON unescaping (or would span lines) disables the fast path.
+_NEEDS_JSON = re.compile(rb'["\\\r\n]')
+
+
+def _plain_delta(body: bytes) -> Optional[str]:
+    if _NEEDS_JSON.search(body) is not None:
+        return None
+    return body.decode("utf-8", "replace")
+
+
+def fast_content_delta(data: bytes) -> Optional[str]:
+    """
+    The delta of a plain {"type": "content", "delta": "..."} event without running
+    json.loads, or None when the payload is anything else (or needs unescaping).
+    """
+    if not data.startswith(_CONTENT_PREFIXES) or not data.endswith(b'"}'):
+        return None
+    # byte 8 is the space after the first colon in the spaced form
+    prefix = len(_CONTENT_PREFIXES[0]) if data[8:9] == b" " else len(_CONTENT_PREFIXES[1])
+    return _plain_delta(data[prefix:-2])
+
+
+def fast_content_chunk(parser: SSEParser, chunk: bytes) -> Optional[str]:
+    """
+    Like fast_content_delta, for a raw chunk that is exactly one content event and
+    arrives while the parser holds nothing: skips the parser entirely.
+    """
+    if not chunk.endswith(b'"}\n\n') or not chunk.startswith(_CONTENT_CHUNK_PREFIXES) or parser.pending:
+        return None
+    prefix = len(_CONTENT_CHUNK_PREFIXES[0]) if chunk[14:15] == b" " else len(_CONTENT_CHUNK_PREFIXES[1])
+    return _plain_delta(chunk[prefix:-4])
@@ -7,8 +7,10 @@ from .config import (
     MAX_TURNS,
     MAX_TOTAL_SECONDS,
     INITIAL_USER_MESSAGE,
+    LOAD_SESSIONS,
+    LOAD_CONCURRENCY,
 )
-from .types import Turn, ChatResult, RunReport
+from .types import Turn, ChatResult, StreamEvent, StreamTiming, TurnTiming, LogCheckResult, RunReport, LoadReport, OpenLoopReport
 
 __all__ = [
     "API_URL",
@@ -19,7 +21,15 @@ __all__ = [
     "MAX_TURNS",
     "MAX_TOTAL_SECONDS",
     "INITIAL_USER_MESSAGE",
+    "LOAD_SESSIONS",
+    "LOAD_CONCURRENCY",
     "Turn",
     "ChatResult",
+    "StreamEvent",
+    "StreamTiming",
+    "TurnTiming",
+    "LogCheckResult",
     "RunReport",
+    "LoadReport",
+    "OpenLoopReport",
 ]
@@ -8,6 +8,7 @@ API_URL: str = "https://ai-class-production-01cd.up.railway.app/chat/fast"
 
 USER_ID: str = "541b6e88-b314-4d66-9fd6-2406d87a8039"
 OPENAI_MODEL: str = "gpt-4o"
+DRIVER_BACKEND: str = "llm"  # "llm" (GPT-4o persona) or "rules" (local, deterministic, no OpenAI)
 TIMEOUT_SEC: int = 40
 RETRY_COUNT: int = 3
 MAX_TURNS: int = 3
@@ -17,3 +18,89 @@ INITIAL_USER_MESSAGE: str = "hello i need to buy a new property for stability"
 
 LOGS_API_URL: str = "https://ai-class-production-01cd.up.railway.app/logs/api"
 LOGS_LIMIT: int = 50
+LOGS_MAX_PAGES: int = 20  # cap on since_id pages fetched per poll
+
+# load runner
+LOAD_SESSIONS: int = 20
+LOAD_CONCURRENCY: int = 20
+
+# shared HTTP connection pool (chat + logs hit the same host)
+HTTP_POOL_CONNECTIONS: int = 4
+HTTP_POOL_MAXSIZE: int = 64
+HTTP_KEEP_ALIVE: bool = True
+HTTP_KEEPALIVE_TIMEOUT_SEC: int = 30
+
+# open-loop load (sessions started at a fixed/ramping arrival rate)
+OPEN_LOOP_MAX_IN_FLIGHT: int = 200
+OPEN_LOOP_LATE_SEC: float = 0.1
+
+# record/replay cassette: None (live), "record" or "replay"
+CASSETTE_MODE: str | None = None
+CASSETTE_PATH: str = "cassettes/session.jsonl"
+CASSETTE_REALTIME: bool = False
+
+# retry policy (RETRY_COUNT above = max attempts per request)
+RETRY_BASE_DELAY_SEC: float = 0.25
+RETRY_MAX_DELAY_SEC: float = 8.0
+RETRY_MAX_RETRY_AFTER_SEC: float = 30.0
+RETRY_BUDGET: int = 100  # max retries per run, shared by all sessions and clients
+
+OPENAI_TIMEOUT_SEC: int = 60
+
+# LLM driver prompt: whole-prompt token budget; turns that don't fit are summarized
+DRIVER_CONTEXT_MAX_TOKENS: int = 1500
+DRIVER_SUMMARY_MAX_TOKENS: int = 200
+# stream driver completions and stop once the reply is complete
+DRIVER_STREAM: bool = False
+DRIVER_STREAM_MEASURE_EVERY: int = 10  # every Nth streamed call reads to the end to measure the time saved (0 = never)
+# hedged driver calls: a second identical request once the first is slower than
+# the DRIVER_HEDGE_PERCENTILE of the last DRIVER_HEDGE_WINDOW calls
+DRIVER_HEDGE: bool = False
+DRIVER_HEDGE_PERCENTILE: float = 95.0
+DRIVER_HEDGE_WINDOW: int = 200
+DRIVER_HEDGE_MIN_SAMPLES: int = 20
+DRIVER_HEDGE_INITIAL_DELAY_SEC: float = 3.0  # until MIN_SAMPLES calls were seen
+DRIVER_HEDGE_MIN_DELAY_SEC: float = 0.5
+DRIVER_HEDGE_MAX_WORKERS: int = 64  # default pool size; load runs size it to 2x their sessions
+
+# LLM driver: reuse earlier replies to the same agent question (per persona)
+ANSWER_INDEX_ENABLED: bool = False
+ANSWER_INDEX_PATH: str | None = None  # e.g. "cache/answer_index.json" to keep it across runs; None = in-memory only
+ANSWER_INDEX_MAX_ENTRIES: int = 2000
+# difflib ratio for questions with the same content words and numbers; None = exact matches only
+ANSWER_INDEX_FUZZY_THRESHOLD: float | None = None
+
+# rate limits shared by all sessions (None = unlimited)
+CHAT_RATE_PER_SEC: float | None = None
+CHAT_BURST: float = 5
+LOGS_RATE_PER_SEC: float | None = None
+LOGS_BURST: float = 5
+OPENAI_REQUESTS_PER_MIN: float | None = None
+OPENAI_TOKENS_PER_MIN: float | None = None
+RATE_LIMIT_DIR: str | None = None  # directory for buckets shared across processes
+
+# per-turn log polling (logs are written asynchronously after the reply)
+LOG_EXPECTED_TYPES: tuple[str, ...] = ("intent_classifier", "main_model")
+LOG_POLL_INITIAL_SEC: float = 0.1
+LOG_POLL_MAX_INTERVAL_SEC: float = 1.0
+LOG_POLL_GROWTH: float = 2.0
+LOG_POLL_TIMEOUT_SEC: float = 10.0
+# keep polling this long after the expected types appear (and after any later log),
+# so a late log of the turn (e.g. extraction_model) is not attributed to the next one
+LOG_POLL_SETTLE_SEC: float = 0.5
+
+# phase-2 log checker (runs in a background worker pool)
+LOG_CHECKER_ENABLED: bool = False
+LOG_CHECKER_MODEL: str = "gpt-4o"
+LOG_CHECKER_WORKERS: int = 4
+LOG_CHECKER_QUEUE_SIZE: int = 64
+LOG_CHECKER_SUBMIT_TIMEOUT_SEC: float = 0.5  # how long a full queue may block a turn before the check is dropped
+LOG_CHECKER_CHECK_TIMEOUT_SEC: float = 60.0  # one check: limiter waits, attempts and backoff
+LOG_CHECKER_JOIN_TIMEOUT_SEC: float = 120.0  # after the load: wait this long for all pending checks
+LOG_CHECKER_MAX_FIELD_CHARS: int = 300  # longer log fields are truncated in the checker prompt
+
+# log check sampling: anomalous turns are always checked, normal ones at this rate
+LOG_CHECK_SAMPLE_RATE: float = 0.1
+LOG_CHECK_SLOW_TURN_SEC: float = 20.0
+LOG_CHECK_SLOW_PERCENTILE: float = 95.0  # ... or slower than this percentile of the run so far
+LOG_CHECK_MIN_SAMPLES: int = 20
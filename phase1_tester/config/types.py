@@ -1,8 +1,11 @@
 """Data types for Phase 1 tester."""
 
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
+
+from phase1_tester.metrics.histogram import HistogramSet
 
 
 @dataclass
@@ -12,11 +15,70 @@ class Turn:
     ts: datetime
 
 
+@dataclass
+class StreamTiming:
+    """SSE stream timings in seconds, measured on a monotonic clock from the request send."""
+
+    ttfb_sec: Optional[float]
+    ttft_sec: Optional[float]
+    stream_sec: float
+    max_gap_sec: float
+    mean_gap_sec: float
+    deltas: int
+
+
 @dataclass
 class ChatResult:
     assistant_text: str
     session_id: Optional[str]
     raw_events_count: int
+    timing: Optional[StreamTiming] = None
+    rate_limit_wait_sec: float = 0.0   # our limiter's waits before the attempts (not the agent's time)
+
+
+@dataclass
+class StreamEvent:
+    """One typed event from ChatClient.stream_message."""
+
+    kind: Literal["session_id", "delta", "done", "error"]
+    text: str = ""
+    session_id: Optional[str] = None
+    result: Optional[ChatResult] = None        # done only
+    error: Optional[str] = None                # error only
+    exc: Optional[BaseException] = None        # error only, the exception behind it (if any)
+
+
+@dataclass
+class TurnTiming:
+    """
+    Where one turn's wall time went. chat_sec includes retries but not rate-limit
+    waits (nor does turn_sec); chat is the successful attempt.
+    """
+
+    turn_index: int
+    chat_sec: float
+    chat: Optional[StreamTiming]
+    logs_sec: Optional[float] = None
+    driver_sec: Optional[float] = None
+    # reply end -> the turn's expected log types were visible (None if they never were)
+    log_lag_sec: Optional[float] = None
+    # whole turn, send to next message ready (logs and driver overlap inside it)
+    turn_sec: Optional[float] = None
+
+
+@dataclass
+class LogCheckResult:
+    """Phase-2 verdict on one turn's backend logs (from the checker worker pool)."""
+
+    turn_index: int
+    normal_path: Optional[bool]
+    verdict: Optional[dict[str, Any]] = None   # the checker's JSON answer
+    error: Optional[str] = None
+    reason: Optional[str] = None               # why it was checked: "error", "slow", ..., "sampled"
+    queued_sec: Optional[float] = None         # submit -> picked up by a worker
+    check_sec: Optional[float] = None          # LLM call
+    logs_tokens_raw: Optional[int] = None      # logs in the prompt before compaction
+    logs_tokens: Optional[int] = None          # ... and after
 
 
 @dataclass
@@ -27,3 +89,43 @@ class RunReport:
     started_at: datetime
     ended_at: datetime
     error: Optional[str]
+    session_id: Optional[str] = None
+    timings: list["TurnTiming"] = field(default_factory=list)
+    histograms: HistogramSet = field(default_factory=HistogramSet)
+    checks: list[LogCheckResult] = field(default_factory=list)
+    # (turn_index, future) of queued checks; CheckerPool.join_checks() moves them into `checks`
+    pending_checks: list[tuple[int, "Future[LogCheckResult]"]] = field(default_factory=list)
+    checks_dropped: int = 0   # turns not checked because the checker queue stayed full
+    checks_skipped: int = 0   # normal turns the sampler left out
+
+
+@dataclass
+class LoadReport:
+    sessions: int
+    concurrency: int
+    succeeded: int
+    failed: int
+    reports: list["RunReport"]
+    errors: dict[str, int]
+    started_at: datetime
+    ended_at: datetime
+    histograms: HistogramSet = field(default_factory=HistogramSet)
+
+
+@dataclass
+class OpenLoopReport:
+    target_rate: float
+    ramp_to_rate: Optional[float]
+    duration_sec: float
+    scheduled: int
+    started: int
+    dropped: int
+    late: int
+    max_backlog: int
+    succeeded: int
+    failed: int
+    reports: list["RunReport"]
+    errors: dict[str, int]
+    started_at: datetime
+    ended_at: datetime
+    histograms: HistogramSet = field(default_factory=HistogramSet)
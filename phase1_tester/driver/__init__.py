@@ -1,3 +1,7 @@
+from .answer_index import AnswerIndex
+from .base import Driver
 from .llm_driver import LLMDriver
+from .rule_driver import RuleDriver
+from .factory import DRIVER_BACKENDS, build_driver
 
-__all__ = ["LLMDriver"]
+__all__ = ["AnswerIndex", "Driver", "LLMDriver", "RuleDriver", "DRIVER_BACKENDS", "build_driver"]
@@ -0,0 +1,172 @@
+"""Persistent per-persona index of agent question -> driver reply, consulted before GPT-4o."""
+
+import difflib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from phase1_tester.config.config import (
+    ANSWER_INDEX_FUZZY_THRESHOLD,
+    ANSWER_INDEX_MAX_ENTRIES,
+    ANSWER_INDEX_PATH,
+)
+from phase1_tester.persona.persona import persona_key
+
+# a question is the text since the previous sentence end ("." inside a number is not one)
+_QUESTION = re.compile(r"(?:[^?.!\n]|(?<=\d)\.(?=\d))*\?")
+_THOUSANDS = re.compile(r"(?<=\d),(?=\d{3}\b)")
+# punctuation, except a "." inside a number
+_NON_WORD = re.compile(r"[^a-z0-9.\s]+|(?<!\d)\.|\.(?!\d)")
+_SPACE = re.compile(r"\s+")
+
+# Words that never tell two questions apart; everything else must match for a fuzzy hit.
+_FILLER_WORDS = frozenset(
+    {"a", "an", "the", "and", "or", "of", "to", "for", "in", "on", "at", "with", "about", "is", "are",
+     "be", "do", "does", "did", "you", "your", "yours", "s", "re", "what", "which", "would", "could",
+     "can", "will", "there", "that", "this", "any", "have", "has", "me", "tell", "please", "so", "ok",
+     "okay", "great", "thanks", "thank", "now", "also", "like", "currently"}
+)
+
+
+def normalize_question(text: str) -> str:
+    """
+    Index key for an agent message: its questions only (the "Great, thanks!"
+    preamble varies), lowercased, punctuation and thousands separators dropped.
+    Numbers are kept: "3 bedrooms" and "5 bedrooms" are different questions.
+    """
+    questions = _QUESTION.findall(text)
+    text = " ".join(questions) if questions else text
+    text = _THOUSANDS.sub("", text.lower())
+    text = _NON_WORD.sub(" ", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def content_words(question: str) -> frozenset[str]:
+    """The words of a normalized question that carry its meaning (numbers included)."""
+    return frozenset(w for w in question.split() if w not in _FILLER_WORDS)
+
+
+class AnswerIndex:
+    """
+    question -> reply per persona, LRU-evicted at max_entries (over all personas).
+    Exact lookups by normalize_question(). With fuzzy_threshold set, a miss falls
+    back to the closest indexed question of the same persona with exactly the
+    same content words (only filler words and their order may differ) if its
+    difflib ratio is at least the threshold. Thread-safe; save() writes the
+    index to `path` (atomically), and it is loaded from there on construction.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = ANSWER_INDEX_PATH,
+        max_entries: int = ANSWER_INDEX_MAX_ENTRIES,
+        fuzzy_threshold: Optional[float] = ANSWER_INDEX_FUZZY_THRESHOLD,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.fuzzy_threshold = fuzzy_threshold
+        self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        # (persona, content words) -> its indexed questions: the fuzzy candidates
+        self._buckets: dict[tuple[str, frozenset[str]], set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.fuzzy_hits = 0   # included in hits
+        self.misses = 0
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        # Saved oldest first, so the LRU order survives a restart.
+        for entry in data.get("entries", [])[-self.max_entries:]:
+            self._store((entry["persona"], entry["question"]), entry["reply"])
+
+    def _store(self, key: tuple[str, str], reply: str) -> None:
+        """Insert or refresh under the lock, evicting the least recently used entries."""
+        self._entries[key] = reply
+        self._entries.move_to_end(key)
+        self._buckets.setdefault((key[0], content_words(key[1])), set()).add(key[1])
+        while len(self._entries) > self.max_entries:
+            (pkey, question), _ = self._entries.popitem(last=False)
+            bucket_key = (pkey, content_words(question))
+            bucket = self._buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.discard(question)
+                if not bucket:
+                    del self._buckets[bucket_key]
+
+    def _closest(self, question: str, candidates: list[str]) -> Optional[str]:
+        best: Optional[str] = None
+        best_ratio = self.fuzzy_threshold or 0.0
+        matcher = difflib.SequenceMatcher(b=question, autojunk=False)
+        for candidate in candidates:
+            matcher.set_seq1(candidate)
+            # real_quick_ratio/quick_ratio are upper bounds: skip the full ratio when they can't win
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        return best
+
+    def get(self, persona: dict, last_assistant: str) -> Optional[str]:
+        """The indexed reply for this question, or None (counted as a miss)."""
+        question = normalize_question(last_assistant)
+        if not question:
+            return None
+        pkey = persona_key(persona)
+        key = (pkey, question)
+        with self._lock:
+            reply = self._entries.get(key)
+            if reply is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return reply
+            candidates = (
+                list(self._buckets.get((pkey, content_words(question)), ()))
+                if self.fuzzy_threshold is not None
+                else []
+            )
+
+        # The similarity scan runs without the lock; the winner is re-read under it.
+        closest = self._closest(question, candidates) if candidates else None
+        with self._lock:
+            reply = self._entries.get((pkey, closest)) if closest is not None else None
+            if reply is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((pkey, closest))
+            self.hits += 1
+            self.fuzzy_hits += 1
+            return reply
+
+    def put(self, persona: dict, last_assistant: str, reply: str) -> None:
+        question = normalize_question(last_assistant)
+        if not question or not reply:
+            return
+        key = (persona_key(persona), question)
+        with self._lock:
+            self._store(key, reply)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            entries = [{"persona": p, "question": q, "reply": r} for (p, q), r in self._entries.items()]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
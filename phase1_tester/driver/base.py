@@ -0,0 +1,20 @@
+"""Driver interface: anything that writes the buyer's next message."""
+
+from typing import TYPE_CHECKING, Optional, Protocol
+
+if TYPE_CHECKING:
+    from phase1_tester.client.deadline import Deadline
+    from phase1_tester.config.types import Turn
+
+
+class Driver(Protocol):
+    """Implemented by LLMDriver (GPT-4o) and RuleDriver (local, deterministic)."""
+
+    def generate_reply(
+        self,
+        persona: dict,
+        last_assistant: str,
+        recent_turns: list["Turn"],
+        deadline: Optional["Deadline"] = None,
+    ) -> str:
+        ...
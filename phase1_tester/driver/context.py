@@ -0,0 +1,103 @@
+"""Token-budgeted driver prompt: newest turns verbatim, older ones folded into a short summary."""
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from phase1_tester.config.config import DRIVER_CONTEXT_MAX_TOKENS, DRIVER_SUMMARY_MAX_TOKENS
+from phase1_tester.driver.tokens import MESSAGE_OVERHEAD_TOKENS, count_message_tokens, count_tokens
+from phase1_tester.persona.prompts import persona_messages, without_trailing_assistant
+
+if TYPE_CHECKING:
+    from phase1_tester.config.types import Turn
+
+SUMMARY_HEADER = "Earlier in this conversation (summary):"
+_QUESTION = re.compile(r"[^?.!\n]*\?")
+_SUMMARY_QUESTION_CHARS = 80
+_SUMMARY_ANSWER_CHARS = 60
+
+
+@dataclass
+class DriverPrompt:
+    messages: list[dict]
+    prompt_tokens: int
+    turns_kept: int         # earlier turns sent verbatim
+    turns_summarized: int   # earlier turns folded into the summary (0 = no summary message)
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
+
+
+def _summary_lines(turns: list["Turn"]) -> list[str]:
+    """One line per agent question and the buyer's answer to it, oldest first."""
+    lines: list[str] = []
+    for t in turns:
+        if t.role == "assistant":
+            questions = " ".join(q.strip() for q in _QUESTION.findall(t.content)) or t.content
+            lines.append(f"- agent: {_clip(questions, _SUMMARY_QUESTION_CHARS)}")
+        else:
+            lines.append(f"- me: {_clip(t.content, _SUMMARY_ANSWER_CHARS)}")
+    return lines
+
+
+def _summary(turns: list["Turn"], max_tokens: int, model: str) -> str:
+    """The newest lines of the older turns that fit in max_tokens (older ones are dropped)."""
+    budget = max_tokens - count_tokens(SUMMARY_HEADER, model) - MESSAGE_OVERHEAD_TOKENS
+    kept: list[str] = []
+    for line in reversed(_summary_lines(turns)):
+        cost = count_tokens(line, model) + 1
+        if cost > budget:
+            break
+        kept.append(line)
+        budget -= cost
+    return "\n".join([SUMMARY_HEADER, *reversed(kept)]) if kept else ""
+
+
+def build_driver_context(
+    persona: dict,
+    last_assistant: str,
+    turns: list["Turn"],
+    model: str = "gpt-4o",
+    max_tokens: int = DRIVER_CONTEXT_MAX_TOKENS,
+    summary_max_tokens: int = DRIVER_SUMMARY_MAX_TOKENS,
+) -> DriverPrompt:
+    """
+    persona prefix + [summary of older turns] + newest turns + last_assistant,
+    kept under max_tokens. The prefix and last_assistant are always sent; the
+    remaining budget goes to the newest turns, and once a turn no longer fits
+    it and everything before it are summarized (at most summary_max_tokens).
+    The trailing copy of last_assistant in `turns` is dropped.
+    """
+    head = persona_messages(persona)
+    tail = [{"role": "assistant", "content": last_assistant}]
+    turns = without_trailing_assistant(turns, last_assistant)
+    budget = max_tokens - count_message_tokens(head, model) - count_message_tokens(tail, model)
+
+    # Newest first, until a turn does not fit next to a summary of what is left.
+    reserve = summary_max_tokens if turns else 0
+    kept: list[dict] = []
+    split = len(turns)
+    for t in reversed(turns):
+        cost = count_tokens(t.content, model) + MESSAGE_OVERHEAD_TOKENS
+        if cost > budget - (reserve if split > 1 else 0):
+            break
+        kept.append({"role": t.role, "content": t.content})
+        budget -= cost
+        split -= 1
+    kept.reverse()
+
+    middle: list[dict] = []
+    if split:
+        summary = _summary(turns[:split], min(summary_max_tokens, budget), model)
+        if summary:
+            middle.append({"role": "system", "content": summary})
+
+    messages = head + middle + kept + tail
+    return DriverPrompt(
+        messages=messages,
+        prompt_tokens=count_message_tokens(messages, model),
+        turns_kept=len(kept),
+        turns_summarized=split if middle else 0,
+    )
@@ -0,0 +1,47 @@
+"""Pick the driver backend from config."""
+
+from typing import TYPE_CHECKING, Optional
+
+from phase1_tester.config.config import ANSWER_INDEX_ENABLED, DRIVER_BACKEND, DRIVER_HEDGE_MAX_WORKERS, OPENAI_MODEL
+from phase1_tester.driver.answer_index import AnswerIndex
+from phase1_tester.driver.base import Driver
+from phase1_tester.driver.llm_driver import LLMDriver
+from phase1_tester.driver.rule_driver import RuleDriver
+
+if TYPE_CHECKING:
+    from phase1_tester.cassette.cassette import Cassette
+    from phase1_tester.client.retry import RetryPolicy
+
+DRIVER_BACKENDS: tuple[str, ...] = ("llm", "rules")
+
+
+def build_driver(
+    backend: str = DRIVER_BACKEND,
+    model: str = OPENAI_MODEL,
+    cassette: Optional["Cassette"] = None,
+    answer_index: Optional[AnswerIndex] = None,
+    hedge_workers: int = DRIVER_HEDGE_MAX_WORKERS,
+    retry_policy: Optional["RetryPolicy"] = None,
+) -> Driver:
+    """
+    "llm": GPT-4o persona replies (needs OPENAI_API_KEY, or a replay cassette);
+    with ANSWER_INDEX_ENABLED, repeated agent questions are answered from an
+    AnswerIndex (the one passed in, else a new one on ANSWER_INDEX_PATH).
+    hedge_workers sizes the LLM driver's hedging pool: two per concurrent session.
+    retry_policy: the run's policy, so OpenAI retries spend the run's retry budget.
+    "rules": RuleDriver, local and deterministic, for high session rates.
+    """
+    if backend == "llm":
+        if answer_index is None and ANSWER_INDEX_ENABLED:
+            answer_index = AnswerIndex()
+        return LLMDriver(
+            model,
+            api_key_env="OPENAI_API_KEY",
+            cassette=cassette,
+            answer_index=answer_index,
+            hedge_workers=hedge_workers,
+            retry_policy=retry_policy,
+        )
+    if backend == "rules":
+        return RuleDriver()
+    raise ValueError(f"Unknown driver backend: {backend} (expected one of {', '.join(DRIVER_BACKENDS)})")
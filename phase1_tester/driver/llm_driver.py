@@ -1,42 +1,359 @@
 """GPT-4o driver for generating buyer persona replies."""
 
+import itertools
+import math
 import os
-from typing import TYPE_CHECKING
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Iterator, Optional
  
 from dotenv import load_dotenv
 from openai import OpenAI
 
 load_dotenv()
 
-from phase1_tester.persona.prompts import build_driver_messages
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded, call_timeout
+from phase1_tester.client.rate_limit import OPENAI_REQUESTS, OPENAI_TOKENS, RateLimiter, get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.config.config import (
+    DRIVER_HEDGE,
+    DRIVER_HEDGE_INITIAL_DELAY_SEC,
+    DRIVER_HEDGE_MAX_WORKERS,
+    DRIVER_HEDGE_MIN_DELAY_SEC,
+    DRIVER_HEDGE_MIN_SAMPLES,
+    DRIVER_HEDGE_PERCENTILE,
+    DRIVER_HEDGE_WINDOW,
+    DRIVER_STREAM,
+    DRIVER_STREAM_MEASURE_EVERY,
+    OPENAI_TIMEOUT_SEC,
+    RETRY_COUNT,
+)
+from phase1_tester.driver.answer_index import AnswerIndex
+from phase1_tester.driver.context import build_driver_context
+from phase1_tester.metrics.histogram import HistogramSet, LatencyHistogram
 
 if TYPE_CHECKING:
+    from phase1_tester.cassette.cassette import Cassette
     from phase1_tester.config.types import Turn
 
+MAX_REPLY_TOKENS = 100
+
+# End of an answer: a line break, or . ! ? before whitespace or at the end of the
+# text unless it follows a digit (the "." of "$200.5" may still be streaming in).
+_ANSWER_END = re.compile(r"\n|[.!?](?=\s)|(?<!\d)[.!?]$")
+
+
+def reply_cutoff(text: str, questions: int) -> Optional[int]:
+    """
+    Where a streamed reply is complete, or None to keep reading: the persona
+    answers each question in a short sentence or line, so the reply ends once
+    `questions` answers have ended. A line break right after a sentence end
+    ("Yes.\n") closes the same answer.
+    """
+    ends = 0
+    last = 0
+    for m in _ANSWER_END.finditer(text):
+        if not text[last:m.start()].strip():
+            last = m.end()
+            continue
+        ends += 1
+        last = m.end()
+        if ends >= questions:
+            return m.start() if m.group() == "\n" else m.end()
+    return None
+
 
 class LLMDriver:
     """Uses OpenAI GPT-4o to generate persona replies."""
 
-    def __init__(self, model: str, api_key_env: str = "OPENAI_API_KEY"):
+    def __init__(
+        self,
+        model: str,
+        api_key_env: str = "OPENAI_API_KEY",
+        cassette: Optional["Cassette"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        answer_index: Optional[AnswerIndex] = None,
+        stream: bool = DRIVER_STREAM,
+        measure_every: int = DRIVER_STREAM_MEASURE_EVERY,
+        hedge: bool = DRIVER_HEDGE,
+        hedge_percentile: float = DRIVER_HEDGE_PERCENTILE,
+        hedge_workers: int = DRIVER_HEDGE_MAX_WORKERS,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         self.model = model
+        # Retries are ours, not the SDK's: backoff, Retry-After, no retry started past
+        # the deadline, and the policy's retry budget (pass the run's policy to share
+        # it with the chat clients; by default the driver has a budget of its own).
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=RETRY_COUNT)
+        self.cassette = cassette
+        # Off with a cassette: a reply served from the index would never reach the tape.
+        self.answer_index = answer_index if cassette is None else None
+        # Prompt size per OpenAI call, in tokens (values are counts, not seconds).
+        self.prompt_tokens = LatencyHistogram(lowest=1.0)
+        # stream=True: read the completion as it is generated and stop once the
+        # reply is complete (reply_cutoff). Every measure_every-th streamed call
+        # still returns at the cutoff, but a background thread reads the stream
+        # to its end and records the time after the cutoff as "driver_saved":
+        # what the blocking call would have waited longer.
+        self.stream = stream
+        self.measure_every = measure_every
+        self._streamed = itertools.count()
+        self.histograms = HistogramSet()
+        self.cutoffs = 0   # streams closed before the model finished
+        # hedge=True: when a call is slower than hedge_percentile of the recent
+        # calls, an identical second request is sent; the first reply wins and
+        # the other attempt is cancelled (a stream is closed at its next chunk,
+        # a blocking call's result is dropped). Both attempts run on a pool of
+        # hedge_workers threads: two per concurrent session, so an attempt does
+        # not queue behind other sessions' calls.
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_workers = hedge_workers
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self._latencies: deque[float] = deque(maxlen=DRIVER_HEDGE_WINDOW)
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        if cassette is not None and cassette.replaying:
+            # Replies come from the tape: no key, no client.
+            self._client = None
+            return
         api_key = os.environ.get(api_key_env)
         if not api_key:
             raise ValueError(f"Missing {api_key_env} environment variable")
-        self._client = OpenAI(api_key=api_key)
+        self._client = OpenAI(api_key=api_key, max_retries=0)
 
     def generate_reply(
         self,
         persona: dict,
         last_assistant: str,
         recent_turns: list["Turn"],
+        deadline: Optional[Deadline] = None,
     ) -> str:
         """Generate the next user (buyer) message given persona and conversation."""
-        messages = build_driver_messages(persona, last_assistant, recent_turns)
-        resp = self._client.chat.completions.create(
+        if self.answer_index is not None:
+            indexed = self.answer_index.get(persona, last_assistant)
+            if indexed is not None:
+                return indexed
+
+        prompt = build_driver_context(persona, last_assistant, recent_turns, model=self.model)
+        messages = prompt.messages
+        if self.cassette is not None and self.cassette.replaying:
+            return self.cassette.next("driver")["reply"]
+
+        self.prompt_tokens.record(prompt.prompt_tokens)
+        questions = max(1, last_assistant.count("?"))
+        for attempt in itertools.count():
+            # TPM counts prompt + completion; every attempt is a request of its own.
+            self.rate_limiter.acquire(OPENAI_REQUESTS, deadline=deadline)
+            self.rate_limiter.acquire(OPENAI_TOKENS, prompt.prompt_tokens + MAX_REPLY_TOKENS, deadline=deadline)
+            client = self._client
+            if deadline is not None:
+                # Each attempt gets at most what is left of the deadline.
+                client = client.with_options(timeout=call_timeout(deadline, OPENAI_TIMEOUT_SEC))
+            try:
+                if self.hedge:
+                    reply = self._hedged_reply(client, messages, questions, prompt.prompt_tokens, deadline)
+                else:
+                    reply = self._complete(client, messages, questions, deadline)
+                break
+            except Exception as e:
+                delay = self.retry_policy.next_delay(e, attempt, deadline=deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+        if self.cassette is not None:
+            self.cassette.record("driver", model=self.model, messages=messages, reply=reply)
+        if self.answer_index is not None:
+            self.answer_index.put(persona, last_assistant, reply)
+        return reply
+
+    def _complete(
+        self,
+        client: OpenAI,
+        messages: list[dict],
+        questions: int,
+        deadline: Optional[Deadline],
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
+        if self.stream:
+            return self._stream_reply(client, messages, questions, deadline, cancel)
+        resp = client.chat.completions.create(
             model=self.model,
             messages=messages,
-            max_tokens=100,
+            max_tokens=MAX_REPLY_TOKENS,
             temperature=0.4,
         )
         content = resp.choices[0].message.content
         return (content or "").strip()
+
+    def _hedge_delay(self) -> float:
+        """hedge_percentile of the recent call latencies (a fixed delay until there are enough)."""
+        with self._lock:
+            recent = sorted(self._latencies)
+        if len(recent) < DRIVER_HEDGE_MIN_SAMPLES:
+            return DRIVER_HEDGE_INITIAL_DELAY_SEC
+        rank = max(1, math.ceil(self.hedge_percentile / 100.0 * len(recent)))
+        return max(DRIVER_HEDGE_MIN_DELAY_SEC, recent[rank - 1])
+
+    def _first_attempt(self, started: threading.Event, *args: Any) -> str:
+        started.set()
+        return self._complete(*args)
+
+    def _hedge_attempt(
+        self,
+        client: OpenAI,
+        messages: list[dict],
+        questions: int,
+        prompt_tokens: int,
+        deadline: Optional[Deadline],
+        cancel: threading.Event,
+    ) -> str:
+        # A hedge is a real request: it pays for its own rate-limit tokens.
+        self.rate_limiter.acquire(OPENAI_REQUESTS, deadline=deadline)
+        self.rate_limiter.acquire(OPENAI_TOKENS, prompt_tokens + MAX_REPLY_TOKENS, deadline=deadline)
+        if cancel.is_set():
+            return ""
+        return self._complete(client, messages, questions, deadline, cancel)
+
+    def _hedged_reply(
+        self,
+        client: OpenAI,
+        messages: list[dict],
+        questions: int,
+        prompt_tokens: int,
+        deadline: Optional[Deadline],
+    ) -> str:
+        """First of the call and (if it is slow) its hedge to succeed; the loser is cancelled."""
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self.hedge_workers, thread_name_prefix="driver-hedge")
+            pool = self._hedge_pool
+
+        cancels = [threading.Event(), threading.Event()]
+        first_started = threading.Event()
+        first = pool.submit(self._first_attempt, first_started, client, messages, questions, deadline, cancels[0])
+        first.add_done_callback(lambda _: first_started.set())
+        # The delay (and the latency sample) run from when the first attempt starts:
+        # time spent waiting for a worker must not fire a hedge.
+        if not first_started.wait(deadline.remaining() if deadline is not None else None):
+            if first.cancel():
+                raise DeadlineExceeded("deadline exceeded waiting for a driver worker")
+            # it started just now: carry on as usual
+            first_started.wait()
+        started = time.perf_counter()
+        delay = self._hedge_delay()
+        if deadline is not None:
+            delay = min(delay, deadline.remaining())
+        attempts: dict[Future, int] = {first: 0}
+        if not wait([first], timeout=delay).done:
+            hedge = pool.submit(
+                self._hedge_attempt, client, messages, questions, prompt_tokens, deadline, cancels[1]
+            )
+            attempts[hedge] = 1
+            with self._lock:
+                self.hedges_issued += 1
+
+        error: Optional[BaseException] = None
+        pending = set(attempts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                for loser in pending:
+                    cancels[attempts[loser]].set()
+                    loser.cancel()
+                # A lower bound of the first request's latency when the hedge won.
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._latencies.append(elapsed)
+                    self.hedges_won += attempts[future]
+                self.histograms.record("driver_hedged", elapsed)
+                return future.result()
+        raise error
+
+    def close(self) -> None:
+        """Stop the hedge threads (attempts still running finish in the background)."""
+        with self._lock:
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _stream_reply(
+        self,
+        client: OpenAI,
+        messages: list[dict],
+        questions: int,
+        deadline: Optional[Deadline],
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
+        measure = self.measure_every > 0 and next(self._streamed) % self.measure_every == 0
+        started = time.perf_counter()
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=MAX_REPLY_TOKENS,
+            temperature=0.4,
+            stream=True,
+        )
+        chunks = iter(stream)
+        text = ""
+        reply: Optional[str] = None
+        cut_at: Optional[float] = None
+        handed_off = False
+        try:
+            for chunk in chunks:
+                if cancel is not None and cancel.is_set():
+                    # Lost to its hedge: nobody reads this reply.
+                    return ""
+                if deadline is not None:
+                    deadline.check()
+                if not chunk.choices:
+                    continue
+                text += chunk.choices[0].delta.content or ""
+                end = reply_cutoff(text, questions)
+                if end is not None:
+                    reply, cut_at = text[:end], time.perf_counter()
+                    break
+            if reply is not None and measure:
+                threading.Thread(
+                    target=self._measure_tail,
+                    args=(stream, chunks, text, reply, cut_at),
+                    name="driver-measure",
+                    daemon=True,
+                ).start()
+                handed_off = True
+        finally:
+            if not handed_off:
+                # Closing mid-stream drops the connection: the rest is never generated for us.
+                stream.close()
+        finished = time.perf_counter()
+
+        if reply is None:
+            reply = text
+        elif not measure:
+            with self._lock:
+                self.cutoffs += 1
+        self.histograms.record("driver_stream", (cut_at or finished) - started)
+        return reply.strip()
+
+    def _measure_tail(self, stream: Any, chunks: Iterator[Any], text: str, reply: str, cut_at: float) -> None:
+        """Off the caller's thread: read a cut-off stream to its end and record the time it still took."""
+        try:
+            for chunk in chunks:
+                if chunk.choices:
+                    text += chunk.choices[0].delta.content or ""
+        except Exception:
+            return
+        finally:
+            stream.close()
+        self.histograms.record("driver_saved", time.perf_counter() - cut_at)
+        if len(text.strip()) > len(reply.strip()):
+            with self._lock:
+                self.cutoffs += 1
@@ -0,0 +1,176 @@
+"""Rule-based persona driver: answers agent questions from the persona dict, no LLM."""
+
+import re
+from typing import TYPE_CHECKING, Any, Optional
+
+from phase1_tester.persona.prompts import fields
+
+if TYPE_CHECKING:
+    from phase1_tester.client.deadline import Deadline
+    from phase1_tester.config.types import Turn
+
+# Question fields the agent asks about (prompts.fields) plus the persona's own keys.
+FIELD_NAMES: tuple[str, ...] = tuple(f.strip() for f in fields.split(",") if f.strip())
+
+# Extra wording the agent uses for a field, beyond the words in its name.
+FIELD_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "purchase_budget_max": ("budget", "afford", "spend", "price range", "maximum purchase"),
+    "purchase_price_target": ("price", "purchase price"),
+    "monthly_payment_target": ("monthly payment", "monthly", "per month", "each month", "a month", "mortgage payment"),
+    "down_payment_available": ("down payment", "downpayment", "savings", "put down"),
+    "annual_income_usd": ("income", "salary", "earn", "household income"),
+    "pre_approval_status": ("pre-approved", "preapproved", "pre approved", "pre-approval", "approved"),
+    "financing_type": ("financing", "loan", "cash", "fha", "conventional"),
+    "bedrooms_min": ("bedroom", "bedrooms", "beds"),
+    "bedrooms_max": ("at most bedrooms",),
+    "bathrooms_min": ("bathroom", "bathrooms", "baths"),
+    "property_type": ("house", "condo", "townhouse", "type of property", "type of home", "kind of home"),
+    "state_focus": ("state",),
+    "area_focus": ("area", "city", "town", "neighborhood", "neighbourhood", "location", "where"),
+    "metro_preference": ("metro", "urban", "suburb", "suburban", "rural"),
+    "proximity_requirements": ("school", "schools", "close to", "near", "commute", "your work", "workplace", "job"),
+    "max_drive_time": ("drive", "driving", "commute time", "minutes"),
+    "outdoor_space_required": ("outdoor", "yard", "garden", "patio", "balcony"),
+    "target_buy_date": ("when", "timeline", "timeframe", "move", "buy by"),
+    "deadline_type": ("deadline", "flexible date", "hard date"),
+    "urgency_level": ("urgent", "urgency", "soon", "how quickly"),
+    "motivation": ("why", "motivat", "reason", "looking to buy"),
+    "condition_preference": ("condition", "renovat", "fixer", "move-in ready", "updates"),
+    "non_negotiables": ("non-negotiable", "must have", "must-have", "deal breaker", "dealbreaker"),
+    "avoid": ("avoid", "don't want", "do not want"),
+    "safety_importance": ("safety", "safe", "crime"),
+    "quiet_environment_preference": ("quiet", "noise", "busy"),
+    "comfort_with_process": ("comfortable with the process", "buying process"),
+    "main_stress": ("stress", "worry", "concern", "nervous"),
+}
+
+# Answers for question fields the persona does not spell out.
+FIELD_DEFAULTS: dict[str, str] = {
+    "pre_approval_status": "Not yet, working on approval",
+    "financing_type": "Conventional mortgage",
+    "readiness_state": "Ready to start looking",
+    "calculator_offered": "Sure, that would help",
+    "decision_type": "Joint decision with my family",
+    "urgency_level": "Not urgent, flexible",
+    "metro_preference": "Suburban",
+    "non_negotiables": "Good schools and safety",
+    "avoid": "Busy main roads",
+    "flexibilities": "Flexible on cosmetic condition",
+    "cost_of_living_priority": "Important, keeping costs manageable",
+}
+
+FALLBACK_ANSWER = "No strong preference"
+MAX_ANSWER_WORDS = 8
+
+# Words of a field name that say nothing about the topic.
+_NAME_STOPWORDS = frozenset(
+    {"type", "level", "mode", "min", "max", "target", "available", "required", "status", "usd",
+     "offered", "focus", "preference", "priority", "requirements", "alignment", "identity", "state",
+     "initial", "primary", "self", "sense", "of", "future", "clarity", "with", "comfort", "payment"}
+)
+_SENTENCE = re.compile(r"[^?.!\n]*\?")
+# Words of a field name left out of its label in a reply ("bedrooms_min" -> "bedrooms").
+_LABEL_STOPWORDS = frozenset({"min", "max", "usd", "target", "available", "required", "focus"})
+
+
+def _keywords(field: str) -> tuple[str, ...]:
+    words = [w for w in field.split("_") if w not in _NAME_STOPWORDS and len(w) > 2]
+    return tuple(dict.fromkeys((*FIELD_KEYWORDS.get(field, ()), *words)))
+
+
+def _format(field: str, value: Any) -> str:
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, (int, float)):
+        if any(k in field for k in ("usd", "budget", "payment", "price", "income")):
+            return f"${value:,.0f}"
+        return f"{value:g}"
+    text = str(value).strip()
+    words = text.split()
+    return " ".join(words[:MAX_ANSWER_WORDS]) if len(words) > MAX_ANSWER_WORDS else text
+
+
+def _label(field: str, answer: str) -> str:
+    """The answer with its field named, so several in one reply can be told apart."""
+    label = " ".join(w for w in field.split("_") if w not in _LABEL_STOPWORDS) or field
+    if label.endswith("s") and re.fullmatch(r"\d+(?:\.\d+)?", answer):
+        return f"{answer} {label}"   # "3 bedrooms"
+    return f"{label}: {answer}"
+
+
+class RuleDriver:
+    """
+    Deterministic, microsecond driver for load tests: each question in the agent's
+    message is matched by keywords to a persona field (field names from
+    prompts.fields and the persona's own keys) and answered with that value.
+    Same input -> same reply, no network, no API key.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: dict[str, re.Pattern] = {}
+        self._index_key: Optional[tuple[str, ...]] = None
+
+    def _index(self, persona: dict) -> dict[str, re.Pattern]:
+        """Keyword regexes per field, rebuilt only when the persona's keys change."""
+        key = tuple(persona)
+        if key != self._index_key:
+            # Built aside and swapped in: sessions share one driver across threads.
+            patterns: dict[str, re.Pattern] = {}
+            for name in dict.fromkeys((*persona, *FIELD_NAMES)):
+                words = _keywords(name)
+                if words:
+                    patterns[name] = re.compile(
+                        "|".join(r"\b" + re.escape(w) for w in sorted(words, key=len, reverse=True))
+                    )
+            self._patterns, self._index_key = patterns, key
+        return self._patterns
+
+    def fields_in(self, persona: dict, question: str) -> list[str]:
+        """Answerable fields mentioned in `question`, in order; overlapping matches go to the longest keyword."""
+        question = question.lower()
+        spans: list[tuple[int, int, str]] = []
+        for name, pattern in self._index(persona).items():
+            if name in persona or name in FIELD_DEFAULTS:
+                spans.extend((m.start(), -len(m.group(0)), name) for m in pattern.finditer(question))
+        found: list[str] = []
+        end = 0
+        for start, neg_len, name in sorted(spans):
+            if start >= end:
+                end = start - neg_len
+                if name not in found:
+                    found.append(name)
+        return found
+
+    def answer(self, persona: dict, question: str) -> list[tuple[str, str]]:
+        """(field, answer) per field the question asks about; ("", FALLBACK_ANSWER) if none."""
+        answers = []
+        for name in self.fields_in(persona, question):
+            answers.append((name, _format(name, persona[name]) if name in persona else FIELD_DEFAULTS[name]))
+        return answers or [("", FALLBACK_ANSWER)]
+
+    def generate_reply(
+        self,
+        persona: dict,
+        last_assistant: str,
+        recent_turns: list["Turn"],
+        deadline: Optional["Deadline"] = None,
+    ) -> str:
+        """
+        One short answer per question in the agent's message. A lone answer is
+        sent bare ("3"); several are labelled with their fields ("3 bedrooms,
+        2 bathrooms"), one sentence per question.
+        """
+        questions = [q.strip() for q in _SENTENCE.findall(last_assistant)] or [last_assistant]
+        seen: set[tuple[str, str]] = set()
+        per_question: list[list[tuple[str, str]]] = []
+        for q in questions:
+            fresh = [a for a in self.answer(persona, q) if a not in seen]
+            seen.update(fresh)
+            if fresh:
+                per_question.append(fresh)
+        if len(seen) == 1:
+            return next(iter(seen))[1]
+        sentences = [
+            ", ".join(_label(name, text) if name else text for name, text in answers) for answers in per_question
+        ]
+        return ". ".join(s[:1].upper() + s[1:] for s in sentences)
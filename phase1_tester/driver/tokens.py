@@ -0,0 +1,36 @@
+"""Prompt token counting: tiktoken when it is installed, a chars/4 estimate otherwise."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:  # optional: counts fall back to the estimate
+    tiktoken = None  # type: ignore[assignment]
+
+# Chat format overhead per message (role, separators), as in OpenAI's cookbook.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str) -> Optional[Any]:
+    """Encodings are expensive to build: one per model, loaded once."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Cached: the persona and earlier turns are re-counted on every driver call."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: list[dict], model: str = "gpt-4o") -> int:
+    return sum(count_tokens(str(m.get("content") or ""), model) + MESSAGE_OVERHEAD_TOKENS for m in messages)
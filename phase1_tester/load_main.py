@@ -0,0 +1,261 @@
+"""
+Phase 1 load runner: many concurrent buyer conversations against the agent.
+
+Run:
+  Put OPENAI_API_KEY in .env (or export OPENAI_API_KEY=...)
+  python -m phase1_tester.load_main --sessions 20 --concurrency 20
+  python -m phase1_tester.load_main --rate 0.5 --duration 120 [--ramp-to 2]   (open loop)
+  add --driver rules to drive the agent without OpenAI (deterministic persona answers)
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from phase1_tester.config import (
+    API_URL,
+    USER_ID,
+    OPENAI_MODEL,
+    TIMEOUT_SEC,
+    RETRY_COUNT,
+    MAX_TURNS,
+    MAX_TOTAL_SECONDS,
+    INITIAL_USER_MESSAGE,
+    LOAD_SESSIONS,
+    LOAD_CONCURRENCY,
+)
+from phase1_tester.config.config import (
+    DRIVER_BACKEND,
+    LOG_CHECKER_ENABLED,
+    LOG_CHECKER_MODEL,
+    OPEN_LOOP_MAX_IN_FLIGHT,
+)
+from phase1_tester.config.types import LoadReport, OpenLoopReport, RunReport
+from phase1_tester.client import AsyncChatClient, ChatClient
+from phase1_tester.client.rate_limit import get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.driver import DRIVER_BACKENDS, Driver, build_driver
+from phase1_tester.metrics import HistogramSet, format_summary
+from phase1_tester.orchestration import LoadRunner, OpenLoopRunner, Orchestrator
+from phase2_tester.check_sampler import CheckSampler
+from phase2_tester.log_checker import CheckerPool, LogChecker
+
+
+def _with_rate_limit_waits(histograms: HistogramSet) -> HistogramSet:
+    """Session latencies plus the shared limiter's wait times (ratelimit_*)."""
+    limiter = get_shared_limiter()
+    if limiter.waited:
+        print("rate limited: " + ", ".join(f"{name} x{n}" for name, n in sorted(limiter.waited.items())))
+    return HistogramSet().merge(histograms).merge(limiter.histograms)
+
+
+def _with_driver_timings(histograms: HistogramSet, driver: Driver) -> HistogramSet:
+    """Plus the LLM driver's streaming timings (driver_stream, driver_saved), if any."""
+    driver_histograms = getattr(driver, "histograms", None)
+    return histograms.merge(driver_histograms) if driver_histograms is not None else histograms
+
+
+def _join_checks(load: LoadReport | OpenLoopReport, checker_pool: Optional[CheckerPool]) -> None:
+    """Resolve every session's log checks once the load is over, so no session waits for its own."""
+    if checker_pool is not None:
+        checker_pool.join_checks(load.reports, load.histograms)
+
+
+def _print_checks(reports: list[RunReport], checker_pool: Optional[CheckerPool]) -> None:
+    if checker_pool is None:
+        return
+    checks = [c for r in reports for c in r.checks]
+    normal = sum(1 for c in checks if c.normal_path is True)
+    abnormal = sum(1 for c in checks if c.normal_path is False)
+    failed = sum(1 for c in checks if c.error)
+    dropped = sum(r.checks_dropped for r in reports)
+    print(f"log checks: {normal} normal, {abnormal} abnormal, {failed} failed, {dropped} dropped (queue full)")
+    sampler = checker_pool.sampler
+    if sampler is not None:
+        reasons = ", ".join(f"{reason} {n}" for reason, n in sorted(sampler.checked.items()))
+        print(f"log check sampling: {sampler.checked_total} checked ({reasons or '-'}), {sampler.skipped} skipped")
+    raw = sum(c.logs_tokens_raw or 0 for c in checks)
+    compact = sum(c.logs_tokens or 0 for c in checks)
+    if raw:
+        print(f"checker log tokens: {raw} raw -> {compact} compact ({compact / raw:.0%})")
+
+
+def _print_driver_stats(driver: Driver) -> None:
+    prompt_tokens = getattr(driver, "prompt_tokens", None)
+    if prompt_tokens is not None and prompt_tokens.count:
+        print(
+            f"driver prompt tokens: {prompt_tokens.count} calls, mean {prompt_tokens.mean():.0f}, "
+            f"p99 {prompt_tokens.percentile(99):.0f}, max {prompt_tokens.max:.0f}"
+        )
+    if getattr(driver, "stream", False):
+        print(f"driver streams cut off early: {driver.cutoffs}")
+    if getattr(driver, "hedge", False):
+        print(f"driver hedges: {driver.hedges_issued} issued, {driver.hedges_won} won")
+    index = getattr(driver, "answer_index", None)
+    if index is None or not (index.hits or index.misses):
+        return
+    print(
+        f"answer index: {index.hits} hits ({index.fuzzy_hits} fuzzy), {index.misses} misses "
+        f"({index.hit_rate:.0%} hit rate), {len(index)} entries"
+    )
+
+
+async def _run_async(
+    args: argparse.Namespace,
+    driver: Driver,
+    retry_policy: RetryPolicy,
+    checker_pool: Optional[CheckerPool],
+):
+    async with AsyncChatClient(API_URL, USER_ID, TIMEOUT_SEC, RETRY_COUNT, retry_policy=retry_policy) as chat:
+        runner = LoadRunner(
+            lambda: Orchestrator(chat, driver, MAX_TURNS, MAX_TOTAL_SECONDS, checker_pool=checker_pool),
+            concurrency=args.concurrency,
+        )
+        return await runner.run_async(args.sessions, INITIAL_USER_MESSAGE)
+
+
+def _run_open_loop(
+    args: argparse.Namespace,
+    driver: Driver,
+    retry_policy: RetryPolicy,
+    checker_pool: Optional[CheckerPool],
+) -> int:
+    chat = ChatClient(API_URL, USER_ID, TIMEOUT_SEC, RETRY_COUNT, retry_policy=retry_policy)
+    runner = OpenLoopRunner(
+        lambda: Orchestrator(chat, driver, MAX_TURNS, MAX_TOTAL_SECONDS, checker_pool=checker_pool),
+        rate=args.rate,
+        duration_sec=args.duration,
+        ramp_to_rate=args.ramp_to,
+        max_in_flight=args.max_in_flight,
+    )
+    load = runner.run(INITIAL_USER_MESSAGE)
+    _join_checks(load, checker_pool)
+
+    wall = (load.ended_at - load.started_at).total_seconds()
+    print("OPEN LOOP METRICS")
+    print("=" * 60)
+    rate = f"{load.target_rate}/s" + (f" -> {load.ramp_to_rate}/s" if load.ramp_to_rate is not None else "")
+    print(f"arrival rate: {rate} for {load.duration_sec:.0f}s")
+    print(f"scheduled: {load.scheduled}  started: {load.started}  dropped: {load.dropped}  late: {load.late}")
+    print(f"max backlog (in flight): {load.max_backlog}")
+    print(f"succeeded: {load.succeeded}  failed: {load.failed}")
+    print(f"wall time: {wall:.1f}s")
+    budget = retry_policy.budget
+    print(f"retries: {budget.spent} used, {budget.denied} denied (budget {budget.max_retries})")
+    _print_checks(load.reports, checker_pool)
+    _print_driver_stats(driver)
+    for error, count in sorted(load.errors.items(), key=lambda kv: -kv[1]):
+        print(f"error x{count}: {error}")
+    histograms = _with_driver_timings(_with_rate_limit_waits(load.histograms), driver)
+    print("-" * 60)
+    print(format_summary(histograms))
+    print("=" * 60)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(histograms.to_dict(), f)
+
+    return 0 if load.failed == 0 and load.dropped == 0 else 1
+
+
+def _run(
+    args: argparse.Namespace,
+    driver: Driver,
+    retry_policy: RetryPolicy,
+    checker_pool: Optional[CheckerPool],
+) -> int:
+    if args.rate is not None:
+        return _run_open_loop(args, driver, retry_policy, checker_pool)
+
+    if args.use_async:
+        load = asyncio.run(_run_async(args, driver, retry_policy, checker_pool))
+    else:
+        # Clients are stateless per call, so they are shared by every session.
+        chat = ChatClient(API_URL, USER_ID, TIMEOUT_SEC, RETRY_COUNT, retry_policy=retry_policy)
+        runner = LoadRunner(
+            lambda: Orchestrator(chat, driver, MAX_TURNS, MAX_TOTAL_SECONDS, checker_pool=checker_pool),
+            concurrency=args.concurrency,
+        )
+        load = runner.run(args.sessions, INITIAL_USER_MESSAGE)
+    _join_checks(load, checker_pool)
+
+    print("LOAD METRICS")
+    print("=" * 60)
+    print(f"sessions: {load.sessions} (concurrency={load.concurrency})")
+    print(f"succeeded: {load.succeeded}")
+    print(f"failed: {load.failed}")
+    print(f"wall time: {(load.ended_at - load.started_at).total_seconds():.1f}s")
+    budget = retry_policy.budget
+    print(f"retries: {budget.spent} used, {budget.denied} denied (budget {budget.max_retries})")
+    _print_checks(load.reports, checker_pool)
+    _print_driver_stats(driver)
+    for error, count in sorted(load.errors.items(), key=lambda kv: -kv[1]):
+        print(f"error x{count}: {error}")
+    histograms = _with_driver_timings(_with_rate_limit_waits(load.histograms), driver)
+    print("-" * 60)
+    print(format_summary(histograms))
+    print("=" * 60)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(histograms.to_dict(), f)
+
+    return 0 if load.failed == 0 else 1
+
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run concurrent buyer sessions against the agent.")
+    parser.add_argument("--sessions", type=int, default=LOAD_SESSIONS)
+    parser.add_argument("--concurrency", type=int, default=LOAD_CONCURRENCY)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="stream chats on one event loop")
+    parser.add_argument("--json", dest="json_path", help="write latency histograms to this file")
+    parser.add_argument("--rate", type=float, help="open loop: new sessions per second")
+    parser.add_argument("--ramp-to", type=float, help="open loop: ramp the rate linearly to this value")
+    parser.add_argument("--duration", type=float, default=60.0, help="open loop: seconds to keep arriving")
+    parser.add_argument("--max-in-flight", type=int, default=OPEN_LOOP_MAX_IN_FLIGHT)
+    parser.add_argument(
+        "--driver", choices=DRIVER_BACKENDS, default=DRIVER_BACKEND, help="rules: answer locally, no OpenAI calls"
+    )
+    args = parser.parse_args()
+    # --rate 0 --ramp-to N is an open loop that ramps up from nothing.
+    if args.rate is None and args.ramp_to is not None:
+        parser.error("--ramp-to needs --rate")
+    if args.rate is not None and (args.rate < 0 or (args.ramp_to or 0) < 0 or not (args.rate or args.ramp_to)):
+        parser.error("--rate must be > 0, or 0 with --ramp-to > 0")
+
+    # Two hedging workers per session that can be in flight: its call and its hedge.
+    sessions_in_flight = args.max_in_flight if args.rate is not None else args.concurrency
+    # One policy (and retry budget) for the whole run: every session's chat and
+    # logs calls, the driver's OpenAI calls and the log checker's.
+    retry_policy = RetryPolicy(max_attempts=RETRY_COUNT)
+    driver = build_driver(
+        args.driver, model=OPENAI_MODEL, hedge_workers=2 * sessions_in_flight, retry_policy=retry_policy
+    )
+
+    # One bounded checker pool for every session: phase-2 checks never block the turns.
+    checker_pool = (
+        CheckerPool(LogChecker(LOG_CHECKER_MODEL, retry_policy=retry_policy), sampler=CheckSampler())
+        if LOG_CHECKER_ENABLED
+        else None
+    )
+    try:
+        return _run(args, driver, retry_policy, checker_pool)
+    finally:
+        if checker_pool is not None:
+            checker_pool.close()
+        close_driver = getattr(driver, "close", None)
+        if close_driver is not None:
+            close_driver()
+        answer_index = getattr(driver, "answer_index", None)
+        if answer_index is not None:
+            answer_index.save()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,16 +20,62 @@ from phase1_tester.config import (
     MAX_TOTAL_SECONDS,
     INITIAL_USER_MESSAGE,
 )
+from phase1_tester.config.config import (
+    CASSETTE_MODE,
+    CASSETTE_PATH,
+    CASSETTE_REALTIME,
+    LOG_CHECKER_ENABLED,
+    LOG_CHECKER_MODEL,
+)
+from phase1_tester.cassette import open_cassette
 from phase1_tester.client import ChatClient
-from phase1_tester.driver import LLMDriver
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.driver import build_driver
 from phase1_tester.orchestration import Orchestrator
+from phase2_tester.log_checker import CheckerPool, LogChecker
 
 
 def main() -> int:
-    chat = ChatClient(API_URL, USER_ID, TIMEOUT_SEC, RETRY_COUNT)
-    driver = LLMDriver(OPENAI_MODEL, api_key_env="OPENAI_API_KEY")
-    orchestrator = Orchestrator(chat, driver, MAX_TURNS, MAX_TOTAL_SECONDS)
+    # CASSETTE_MODE="record" saves the run to CASSETTE_PATH; "replay" re-runs it offline.
+    cassette = open_cassette(CASSETTE_MODE, CASSETTE_PATH, realtime=CASSETTE_REALTIME)
+    # One retry budget for the chat/logs calls, the driver and the log checker.
+    retry_policy = RetryPolicy(max_attempts=RETRY_COUNT)
+    chat = ChatClient(API_URL, USER_ID, TIMEOUT_SEC, RETRY_COUNT, cassette=cassette, retry_policy=retry_policy)
+    # DRIVER_BACKEND="rules" answers from the persona locally instead of calling GPT-4o.
+    driver = build_driver(model=OPENAI_MODEL, cassette=cassette, retry_policy=retry_policy)
+    checker_pool = (
+        CheckerPool(LogChecker(LOG_CHECKER_MODEL, cassette=cassette, retry_policy=retry_policy))
+        if LOG_CHECKER_ENABLED
+        else None
+    )
+    orchestrator = Orchestrator(chat, driver, MAX_TURNS, MAX_TOTAL_SECONDS, checker_pool=checker_pool)
     report = orchestrator.run(INITIAL_USER_MESSAGE)
+    if checker_pool is not None:
+        checker_pool.join_checks([report], report.histograms)
+        checker_pool.close()
+    if cassette is not None:
+        cassette.close()
+    close_driver = getattr(driver, "close", None)
+    if close_driver is not None:
+        close_driver()
+    prompt_tokens = getattr(driver, "prompt_tokens", None)
+    if prompt_tokens is not None and prompt_tokens.count:
+        print(f"driver prompt tokens: {prompt_tokens.count} calls, max {prompt_tokens.max:.0f}")
+    answer_index = getattr(driver, "answer_index", None)
+    if answer_index is not None:
+        answer_index.save()
+        print(f"answer index: {answer_index.hits} hits, {answer_index.misses} misses, {len(answer_index)} entries")
+
+    if report.checks or report.checks_dropped:
+        print("LOG CHECKS")
+        print("=" * 60)
+        for check in report.checks:
+            verdict = "error: " + check.error if check.error else f"normal_path={check.normal_path}"
+            tokens = f" (log tokens {check.logs_tokens_raw} -> {check.logs_tokens})" if check.logs_tokens else ""
+            print(f"turn {check.turn_index + 1}: {verdict}{tokens}")
+        if report.checks_dropped:
+            print(f"dropped (checker queue full): {report.checks_dropped}")
+        print("=" * 60)
 
     
     #for t in report.turns:
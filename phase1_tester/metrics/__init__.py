@@ -0,0 +1,3 @@
+from .histogram import LatencyHistogram, HistogramSet, format_summary
+
+__all__ = ["LatencyHistogram", "HistogramSet", "format_summary"]
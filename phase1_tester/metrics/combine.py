@@ -0,0 +1,42 @@
+"""
+Combine and compare latency histograms written by `load_main --json`.
+
+Run:
+  python -m phase1_tester.metrics.combine before.json after.json [--out merged.json]
+"""
+
+import argparse
+import json
+
+from phase1_tester.metrics.histogram import HistogramSet, format_summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Print and merge saved latency histograms.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--out", help="write the merged histograms to this file")
+    args = parser.parse_args()
+
+    merged = HistogramSet()
+    for path in args.paths:
+        with open(path, encoding="utf-8") as f:
+            hs = HistogramSet.from_dict(json.load(f))
+        print(path)
+        print("=" * 60)
+        print(format_summary(hs))
+        print()
+        merged.merge(hs)
+
+    if len(args.paths) > 1:
+        print("MERGED")
+        print("=" * 60)
+        print(format_summary(merged))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(merged.to_dict(), f)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""Log-bucketed (HDR-style) latency histograms that merge across sessions and serialize to JSON."""
+
+import json
+import math
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from phase1_tester.config.types import TurnTiming
+
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+
+class LatencyHistogram:
+    """
+    Sparse histogram of latencies (seconds) with bounded relative error.
+
+    Bucket i covers [lowest * growth**i, lowest * growth**(i+1)), growth = 1 + 2*precision,
+    so any reported percentile is within `precision` of a real sample. Memory depends on
+    the value range, not the sample count: 1us..1h at 1% is < 1200 buckets worst case.
+    """
+
+    def __init__(self, precision: float = 0.01, lowest: float = 1e-6):
+        if not 0 < precision < 1:
+            raise ValueError("precision must be in (0, 1)")
+        if lowest <= 0:
+            raise ValueError("lowest must be > 0")
+        self.precision = precision
+        self.lowest = lowest
+        self._log_growth = math.log1p(2 * precision)
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        return int(math.log(value / self.lowest) / self._log_growth)
+
+    def _bucket_value(self, index: int) -> float:
+        # Midpoint of the bucket: at most `precision` away from any value inside it.
+        return self.lowest * math.exp(index * self._log_growth) * (1 + self.precision)
+
+    def record(self, value: float, count: int = 1) -> None:
+        if value is None or value < 0 or math.isnan(value):
+            return
+        index = self._bucket(value)
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + count
+            self.count += count
+            self.total += value * count
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add other's samples into self (in place) and return self."""
+        if (other.precision, other.lowest) != (self.precision, self.lowest):
+            raise ValueError("cannot merge histograms with different precision/lowest")
+        with other._lock:
+            counts = dict(other.counts)
+            count, total, lo, hi = other.count, other.total, other.min, other.max
+        with self._lock:
+            for index, n in counts.items():
+                self.counts[index] = self.counts.get(index, 0) + n
+            self.count += count
+            self.total += total
+            if lo is not None:
+                self.min = lo if self.min is None else min(self.min, lo)
+            if hi is not None:
+                self.max = hi if self.max is None else max(self.max, hi)
+        return self
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Value at percentile p (0-100), or None when empty."""
+        with self._lock:
+            if self.count == 0:
+                return None
+            if p >= 100:
+                return self.max
+            rank = max(1, math.ceil(self.count * p / 100.0))
+            seen = 0
+            for index in sorted(self.counts):
+                seen += self.counts[index]
+                if seen >= rank:
+                    return min(max(self._bucket_value(index), self.min), self.max)
+            return self.max
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, Optional[float]]:
+        out: dict[str, Optional[float]] = {"count": self.count}
+        for p in percentiles:
+            out[f"p{p:g}"] = self.percentile(p)
+        out["max"] = self.max
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "precision": self.precision,
+                "lowest": self.lowest,
+                "count": self.count,
+                "total": self.total,
+                "min": self.min,
+                "max": self.max,
+                # JSON object keys must be strings
+                "counts": {str(i): n for i, n in sorted(self.counts.items())},
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        h = cls(precision=data["precision"], lowest=data["lowest"])
+        h.counts = {int(i): int(n) for i, n in (data.get("counts") or {}).items()}
+        h.count = int(data.get("count") or sum(h.counts.values()))
+        h.total = float(data.get("total") or 0.0)
+        h.min = data.get("min")
+        h.max = data.get("max")
+        return h
+
+
+class HistogramSet:
+    """Named LatencyHistograms (chat_ttft, chat_total, driver, ...) fed per turn and merged per run."""
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> LatencyHistogram:
+        with self._lock:
+            h = self.histograms.get(name)
+            if h is None:
+                h = self.histograms[name] = LatencyHistogram(precision=self.precision)
+            return h
+
+    def record(self, name: str, value: Optional[float]) -> None:
+        if value is not None:
+            self.get(name).record(value)
+
+    def record_turn(self, timing: "TurnTiming") -> None:
+        """Feed one turn's TurnTiming into the standard metrics."""
+        self.record("turn", timing.turn_sec)
+        self.record("chat_total", timing.chat_sec)
+        if timing.chat is not None:
+            self.record("chat_ttfb", timing.chat.ttfb_sec)
+            self.record("chat_ttft", timing.chat.ttft_sec)
+            self.record("chat_stream", timing.chat.stream_sec)
+        self.record("logs", timing.logs_sec)
+        self.record("log_lag", timing.log_lag_sec)
+        self.record("driver", timing.driver_sec)
+
+    def merge(self, other: "HistogramSet") -> "HistogramSet":
+        for name, h in list(other.histograms.items()):
+            self.get(name).merge(h)
+        return self
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, dict[str, Optional[float]]]:
+        percentiles = tuple(percentiles)
+        return {name: h.summary(percentiles) for name, h in sorted(self.histograms.items())}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"precision": self.precision, "histograms": {n: h.to_dict() for n, h in self.histograms.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HistogramSet":
+        hs = cls(precision=data.get("precision", 0.01))
+        for name, h in (data.get("histograms") or {}).items():
+            hs.histograms[name] = LatencyHistogram.from_dict(h)
+        return hs
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "HistogramSet":
+        return cls.from_dict(json.loads(text))
+
+
+def format_summary(histograms: HistogramSet, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+    """Fixed-width percentile table (milliseconds) for console output."""
+    percentiles = tuple(percentiles)
+    cols = [f"p{p:g}" for p in percentiles] + ["max"]
+    lines = [f"{'metric':<24}{'count':>8}" + "".join(f"{c:>10}" for c in cols)]
+    for name, row in histograms.summary(percentiles).items():
+        cells = "".join("{:>10}".format("-" if row[c] is None else f"{row[c] * 1000:.0f}ms") for c in cols)
+        lines.append(f"{name:<24}{row['count']:>8}{cells}")
+    return "\n".join(lines)
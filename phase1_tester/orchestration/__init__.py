@@ -1,3 +1,5 @@
 from .orchestrator import Orchestrator
+from .load_runner import LoadRunner
+from .open_loop import OpenLoopRunner
 
-__all__ = ["Orchestrator"]
+__all__ = ["Orchestrator", "LoadRunner", "OpenLoopRunner"]
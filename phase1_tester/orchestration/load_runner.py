@@ -0,0 +1,102 @@
+"""Load runner: drive many independent conversations against the agent concurrently."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable
+
+from phase1_tester.config.types import LoadReport, RunReport
+from phase1_tester.metrics.histogram import HistogramSet
+
+if TYPE_CHECKING:
+    from phase1_tester.orchestration.orchestrator import Orchestrator
+
+
+class LoadRunner:
+    """Runs N independent Orchestrator sessions with bounded concurrency and aggregates their reports."""
+
+    def __init__(self, orchestrator_factory: Callable[[], "Orchestrator"], concurrency: int):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.orchestrator_factory = orchestrator_factory
+        self.concurrency = concurrency
+
+    def _run_one(self, initial_user_message: str) -> RunReport:
+        # A fresh orchestrator per session: every run starts with session_id=None
+        # and its own LogsReader cursor, so sessions never share state.
+        orchestrator = self.orchestrator_factory()
+        return orchestrator.run(initial_user_message)
+
+    def run(self, num_sessions: int, initial_user_message: str) -> LoadReport:
+        """Run num_sessions conversations, at most `concurrency` at a time."""
+        started_at = datetime.utcnow()
+        reports: list[RunReport] = []
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="session") as pool:
+            futures = [pool.submit(self._run_one, initial_user_message) for _ in range(num_sessions)]
+            for future in as_completed(futures):
+                try:
+                    reports.append(future.result())
+                except Exception as e:
+                    # Orchestrator.run reports its own failures; this only catches
+                    # errors raised while building the orchestrator itself.
+                    now = datetime.utcnow()
+                    reports.append(
+                        RunReport(
+                            success=False,
+                            turns=[],
+                            final_summary=None,
+                            started_at=now,
+                            ended_at=now,
+                            error=str(e),
+                        )
+                    )
+
+        return self.aggregate(reports, started_at=started_at, ended_at=datetime.utcnow())
+
+    async def run_async(self, num_sessions: int, initial_user_message: str) -> LoadReport:
+        """Like run(), but sessions are coroutines (Orchestrator.run_async) on one event loop."""
+        started_at = datetime.utcnow()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one() -> RunReport:
+            async with semaphore:
+                try:
+                    return await self.orchestrator_factory().run_async(initial_user_message)
+                except Exception as e:
+                    now = datetime.utcnow()
+                    return RunReport(
+                        success=False,
+                        turns=[],
+                        final_summary=None,
+                        started_at=now,
+                        ended_at=now,
+                        error=str(e),
+                    )
+
+        reports = await asyncio.gather(*(one() for _ in range(num_sessions)))
+        return self.aggregate(list(reports), started_at=started_at, ended_at=datetime.utcnow())
+
+    def aggregate(self, reports: list[RunReport], started_at: datetime, ended_at: datetime) -> LoadReport:
+        """Fold per-session reports into one LoadReport."""
+        errors: dict[str, int] = {}
+        succeeded = 0
+        histograms = HistogramSet()
+        for r in reports:
+            histograms.merge(r.histograms)
+            if r.success:
+                succeeded += 1
+            elif r.error:
+                errors[r.error] = errors.get(r.error, 0) + 1
+
+        return LoadReport(
+            sessions=len(reports),
+            concurrency=self.concurrency,
+            succeeded=succeeded,
+            failed=len(reports) - succeeded,
+            reports=reports,
+            errors=errors,
+            started_at=started_at,
+            ended_at=ended_at,
+            histograms=histograms,
+        )
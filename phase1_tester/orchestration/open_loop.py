@@ -0,0 +1,169 @@
+"""Open-loop load: start buyer sessions at a fixed or ramping arrival rate, regardless of completions."""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+from phase1_tester.config.config import OPEN_LOOP_MAX_IN_FLIGHT, OPEN_LOOP_LATE_SEC
+from phase1_tester.config.types import OpenLoopReport, RunReport
+from phase1_tester.metrics.histogram import HistogramSet
+
+if TYPE_CHECKING:
+    from phase1_tester.orchestration.orchestrator import Orchestrator
+
+
+def arrival_offsets(rate: float, duration_sec: float, ramp_to_rate: Optional[float] = None) -> list[float]:
+    """
+    Scheduled start offsets (seconds from t=0) for a rate that ramps linearly
+    from `rate` to `ramp_to_rate` over `duration_sec` (constant when ramp_to_rate is None).
+    The k-th session starts when the expected arrivals N(t) reach k.
+    """
+    end_rate = rate if ramp_to_rate is None else ramp_to_rate
+    if rate < 0 or end_rate < 0 or (rate == 0 and end_rate == 0):
+        raise ValueError("arrival rate must be > 0")
+    if duration_sec <= 0:
+        raise ValueError("duration_sec must be > 0")
+    slope = (end_rate - rate) / duration_sec
+    # N(duration_sec): a ramp-down runs out of arrivals before N(t) = k has a root.
+    total = rate * duration_sec + slope * duration_sec * duration_sec / 2
+    offsets: list[float] = []
+    k = 0
+    while k < total:
+        # N(t) = rate*t + slope*t^2/2 ; solve N(t) = k for t >= 0
+        if abs(slope) < 1e-12:
+            t = k / rate
+        else:
+            discriminant = rate * rate + 2 * slope * k
+            if discriminant < 0:
+                break
+            t = (-rate + math.sqrt(discriminant)) / slope
+        if t >= duration_sec:
+            break
+        offsets.append(t)
+        k += 1
+    return offsets
+
+
+class OpenLoopRunner:
+    """
+    Starts a new Orchestrator session at every scheduled arrival. Latency is measured
+    from the scheduled start, so time spent waiting for a free worker counts against
+    the agent instead of silently lowering the offered load (coordinated omission).
+    Arrivals that find `max_in_flight` sessions already running are dropped.
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], "Orchestrator"],
+        rate: float,
+        duration_sec: float,
+        ramp_to_rate: Optional[float] = None,
+        max_in_flight: int = OPEN_LOOP_MAX_IN_FLIGHT,
+        late_sec: float = OPEN_LOOP_LATE_SEC,
+    ):
+        self.orchestrator_factory = orchestrator_factory
+        self.rate = rate
+        self.duration_sec = duration_sec
+        self.ramp_to_rate = ramp_to_rate
+        self.max_in_flight = max_in_flight
+        self.late_sec = late_sec
+
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._in_flight = 0
+        self._late = 0
+        self._reports: list[RunReport] = []
+        self._histograms = HistogramSet()
+
+    def _run_one(self, initial_user_message: str, scheduled_at: float) -> None:
+        start_delay = time.perf_counter() - scheduled_at
+        try:
+            report = self.orchestrator_factory().run(initial_user_message)
+        except Exception as e:
+            now = datetime.utcnow()
+            report = RunReport(
+                success=False,
+                turns=[],
+                final_summary=None,
+                started_at=now,
+                ended_at=now,
+                error=str(e),
+            )
+        from_schedule = time.perf_counter() - scheduled_at
+
+        with self._lock:
+            self._in_flight -= 1
+            if start_delay > self.late_sec:
+                self._late += 1
+            self._reports.append(report)
+        self._histograms.record("start_delay", start_delay)
+        self._histograms.record("session_from_schedule", from_schedule)
+
+    def run(self, initial_user_message: str) -> OpenLoopReport:
+        self._reset()
+        offsets = arrival_offsets(self.rate, self.duration_sec, self.ramp_to_rate)
+        started_at = datetime.utcnow()
+        dropped = 0
+        started = 0
+        max_backlog = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="arrival") as pool:
+            t0 = time.perf_counter()
+            for offset in offsets:
+                scheduled_at = t0 + offset
+                wait = scheduled_at - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+
+                with self._lock:
+                    backlog = self._in_flight
+                    if backlog >= self.max_in_flight:
+                        dropped += 1
+                        continue
+                    self._in_flight += 1
+                max_backlog = max(max_backlog, backlog + 1)
+                started += 1
+                pool.submit(self._run_one, initial_user_message, scheduled_at)
+
+        return self._aggregate(len(offsets), started, dropped, max_backlog, started_at)
+
+    def _aggregate(
+        self,
+        scheduled: int,
+        started: int,
+        dropped: int,
+        max_backlog: int,
+        started_at: datetime,
+    ) -> OpenLoopReport:
+        errors: dict[str, int] = {}
+        succeeded = 0
+        histograms = HistogramSet().merge(self._histograms)
+        for r in self._reports:
+            histograms.merge(r.histograms)
+            if r.success:
+                succeeded += 1
+            elif r.error:
+                errors[r.error] = errors.get(r.error, 0) + 1
+
+        return OpenLoopReport(
+            target_rate=self.rate,
+            ramp_to_rate=self.ramp_to_rate,
+            duration_sec=self.duration_sec,
+            scheduled=scheduled,
+            started=started,
+            dropped=dropped,
+            late=self._late,
+            max_backlog=max_backlog,
+            succeeded=succeeded,
+            failed=len(self._reports) - succeeded,
+            reports=list(self._reports),
+            errors=errors,
+            started_at=started_at,
+            ended_at=datetime.utcnow(),
+            histograms=histograms,
+        )
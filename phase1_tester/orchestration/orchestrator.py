@@ -1,20 +1,29 @@
 """Orchestrator: run the conversation loop until summary or limits."""
 
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 from uuid import uuid4
 
-from phase1_tester.config.types import RunReport, Turn
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded
+from phase1_tester.config.types import ChatResult, LogCheckResult, RunReport, Turn, TurnTiming
 from phase1_tester.config.config import LOGS_API_URL, LOGS_LIMIT
+from phase1_tester.metrics.histogram import HistogramSet
 
 from phase1_tester.persona.persona import persona_context, is_question, stop_condition
 
+from phase2_tester.log_checker import CheckerPool, CheckJob
+from phase2_tester.log_poller import LogPoller, PollResult
 from phase2_tester.logs_client import LogsApiClient
 from phase2_tester.logs_reader import LogsReader
 
 if TYPE_CHECKING:
+    from phase1_tester.client.async_chat_client import AsyncChatClient
     from phase1_tester.client.chat_client import ChatClient
-    from phase1_tester.driver.llm_driver import LLMDriver
+    from phase1_tester.driver.base import Driver
 
 
 class Orchestrator:
@@ -22,26 +31,26 @@ class Orchestrator:
 
     def __init__(
         self,
-        chat: "ChatClient",
-        driver: "LLMDriver",
+        chat: "ChatClient | AsyncChatClient",
+        driver: "Driver",
         max_turns: int,
         max_total_seconds: int,
+        checker_pool: Optional[CheckerPool] = None,
     ):
         self.chat = chat
         self.driver = driver
         self.max_turns = max_turns
         self.max_total_seconds = max_total_seconds
+        # Phase-2 log checks run in the background; None disables them.
+        self.checker_pool = checker_pool
+        # The blocking work of a turn that overlaps: the logs read (run()), plus
+        # the driver call (run_async()). Per orchestrator, i.e. per session, so
+        # async sessions are not capped by the loop's shared default executor.
+        self._turn_executor: Optional[ThreadPoolExecutor] = None
 
-    def run(self, initial_user_message: str) -> RunReport:
-        """Run the conversation until stop condition or limits."""
-        started_at = datetime.utcnow()
-        turns: list[Turn] = []
-        session_id: Optional[str] = None
-        persona = persona_context()
-        current_user_message = initial_user_message
-
-        # --- NEW: init logs reader once ---
-        # reuse chat client's timeout/retry  
+    def _make_log_poller(self) -> LogPoller:
+        """One LogsReader (behind a LogPoller) per run, so every session keeps its own id cursor."""
+        # reuse chat client's timeout/retry
         timeout_sec = getattr(self.chat, "timeout_sec", 30)
         retry_count = getattr(self.chat, "retry_count", 1)
 
@@ -49,108 +58,320 @@ class Orchestrator:
             logs_api_url=LOGS_API_URL,
             timeout_sec=timeout_sec,
             retry_count=retry_count,
+            session=getattr(self.chat, "session", None),
+            cassette=getattr(self.chat, "cassette", None),
+            retry_policy=getattr(self.chat, "retry_policy", None),
+            rate_limiter=getattr(self.chat, "rate_limiter", None),
         )
-        logs_reader = LogsReader(logs_client)
+        return LogPoller(LogsReader(logs_client), cassette=logs_client.cassette)
 
+    def _read_logs(
+        self,
+        log_poller: LogPoller,
+        session_id: Optional[str],
+        turn_index: int,
+        deadline: Optional[Deadline] = None,
+        since: Optional[float] = None,
+    ) -> Optional[PollResult]:
+        """Wait for, then print, the logs written for the last message only."""
+        # We rely on cursor-by-max-id. Since session starts new (session_id=None),
+        # first call should safely return logs for first message too, so prime_if_first_time=False.
         try:
-            for turn_index in range(self.max_turns):
+            user_id = getattr(self.chat, "user_id", None)
+            if user_id and session_id:
+                polled = log_poller.poll(
+                    user_id=user_id,
+                    session_id=session_id,
+                    limit=LOGS_LIMIT,
+                    prime_if_first_time=False if turn_index == 0 else True,
+                    since=since,
+                    deadline=deadline,
+                )
+                new_logs = log_poller.reader.prepere_logs(polled.logs) if polled.logs else []
+                polled.summary = new_logs[0] if new_logs else None
+
+                if new_logs:
+                    print("  logs:")
+                    for item in new_logs:
+                        logtype = item.get("log_type")
+                        log_error = item.get("error_message")
 
-                # 1) If timeout: stop
-                elapsed = (datetime.utcnow() - started_at).total_seconds()
-                if elapsed >= self.max_total_seconds:
-                    return RunReport(
-                        success=False,
-                        turns=turns,
-                        final_summary=None,
-                        started_at=started_at,
-                        ended_at=datetime.utcnow(),
-                        error="max_total_seconds exceeded",
-                    )
-
-                turns.append(Turn(role="user", content=current_user_message, ts=datetime.utcnow()))
-                print(f"Turn {turn_index + 1}: user msg (len={len(current_user_message)})")
-
-                # 2) send message (SSE)
-                result = self.chat.send_message(current_user_message, session_id )
-                session_id = result.session_id or session_id
-                assistant_text = result.assistant_text.strip()
-                print("assistant_text: " , assistant_text)
-
-                turns.append(Turn(role="assistant", content=assistant_text, ts=datetime.utcnow()))
-
-                # --- read logs for THIS message only ---
-                # We rely on cursor-by-max-id. Since session starts new (session_id=None),
-                # first call should safely return logs for first message too, so prime_if_first_time=False.
-                try:
-                    user_id = getattr(self.chat, "user_id", None)
-                    if user_id and session_id:
-                        new_logs = logs_reader.get_logs(
-                            user_id=user_id,
-                            session_id=session_id,
-                            limit=LOGS_LIMIT,
-                            prime_if_first_time=False if turn_index == 0 else True,
-                        )
-
-                        if new_logs:
-                            print("  logs:")
-                            for item in new_logs:
-                                logtype = item.get("log_type")
-                                log_error = item.get("error_message")
-                                
-                                if log_error:
-                                    print(f"    - {logtype} | error: {log_error}")
-                                else:
-                                    print(f"    - {logtype}")
+                        if log_error:
+                            print(f"    - {logtype} | error: {log_error}")
                         else:
-                            print("  logs: (no new logs)")
-                    else:
-                        print("  logs: (missing user_id or session_id)")
-                except Exception as e:
-                    print("  logs: (failed to read logs)")
-
-                # 3) determine if response is Q or stop
-                is_q = is_question(assistant_text)
-                stopped = stop_condition(assistant_text)
-                print(
-                    f"  assistant len={len(assistant_text)}, is_question={is_q}, "
-                    f"stop_condition={stopped}, session_id={session_id}"
+                            print(f"    - {logtype}")
+                else:
+                    print("  logs: (no new logs)")
+                if polled.missing_types:
+                    print(f"  logs: still missing {sorted(polled.missing_types)} after {polled.polls} polls")
+                return polled
+            else:
+                print("  logs: (missing user_id or session_id)")
+        except Exception as e:
+            print("  logs: (failed to read logs)")
+        return None
+
+    def _read_logs_timed(
+        self,
+        log_poller: LogPoller,
+        session_id: Optional[str],
+        turn_index: int,
+        deadline: Optional[Deadline],
+        since: float,
+    ) -> tuple[Optional[PollResult], float]:
+        """_read_logs plus its own wall time, for running next to the driver."""
+        started = time.perf_counter()
+        polled = self._read_logs(log_poller, session_id, turn_index, deadline, since=since)
+        return polled, time.perf_counter() - started
+
+    def _submit_check(
+        self,
+        turn_index: int,
+        last_agent_message: str,
+        user_message: str,
+        polled: Optional[PollResult],
+        timing: TurnTiming,
+        pending: list[tuple[int, "Future[LogCheckResult]"]],
+    ) -> Literal["off", "skipped", "dropped", "queued"]:
+        """Queue this turn for the log checker, unless the pool's sampler skips it."""
+        if self.checker_pool is None or polled is None:
+            return "off"
+        reason = None
+        if self.checker_pool.sampler is not None:
+            reason = self.checker_pool.sampler.decide(polled.summary, polled.logs, polled.missing_types, timing)
+            if reason is None:
+                return "skipped"
+        job = CheckJob(turn_index, last_agent_message, user_message, polled.logs, reason=reason)
+        future = self.checker_pool.submit(job)
+        if future is None:
+            return "dropped"
+        pending.append((turn_index, future))
+        return "queued"
+
+    def _turn_pool(self) -> ThreadPoolExecutor:
+        if self._turn_executor is None:
+            # One logs read and one driver call at a time.
+            self._turn_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="turn-io")
+        return self._turn_executor
+
+    def _in_turn_pool(self, fn, *args) -> "asyncio.Future":
+        """run_async(): fn(*args) on this session's turn pool, awaitable from the loop."""
+        return asyncio.get_running_loop().run_in_executor(self._turn_pool(), fn, *args)
+
+    def _close_turn_pool(self) -> None:
+        if self._turn_executor is not None:
+            self._turn_executor.shutdown(wait=False)
+            self._turn_executor = None
+
+    def _next_user_message(
+        self,
+        persona: dict,
+        assistant_text: str,
+        turns: list[Turn],
+        is_q: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
+        """Ask the driver for the buyer's reply, or acknowledge a non-question."""
+        if not is_q:
+            return "Okay."
+        # The whole conversation: the driver fits it to its own token budget.
+        reply = self.driver.generate_reply(persona, assistant_text, turns, deadline=deadline)
+        return reply or "I'm not sure what to say."
+
+    def _next_user_message_timed(
+        self,
+        persona: dict,
+        assistant_text: str,
+        turns: list[Turn],
+        is_q: bool,
+        deadline: Optional[Deadline],
+    ) -> tuple[str, Optional[float]]:
+        """_next_user_message plus the driver's wall time (None when the driver was not asked)."""
+        started = time.perf_counter()
+        message = self._next_user_message(persona, assistant_text, turns, is_q, deadline)
+        return message, (time.perf_counter() - started if is_q else None)
+
+    @staticmethod
+    def _print_timing(timing: TurnTiming) -> None:
+        def fmt(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value:.2f}s"
+
+        chat = timing.chat
+        print(
+            f"  timing: turn={fmt(timing.turn_sec)} chat={fmt(timing.chat_sec)} "
+            f"ttfb={fmt(chat.ttfb_sec if chat else None)} ttft={fmt(chat.ttft_sec if chat else None)} "
+            f"stream={fmt(chat.stream_sec if chat else None)} max_gap={fmt(chat.max_gap_sec if chat else None)} "
+            f"logs={fmt(timing.logs_sec)} log_lag={fmt(timing.log_lag_sec)} driver={fmt(timing.driver_sec)}"
+        )
+
+    # --- the turn loop, shared by run() and run_async(): they differ only in how they wait ---
+
+    def _start_run(self, initial_user_message: str) -> "_RunState":
+        return _RunState(
+            started_at=datetime.utcnow(),
+            persona=persona_context(),
+            next_message=initial_user_message,
+            log_poller=self._make_log_poller(),
+            # One budget for the whole run, carried into every chat/logs/driver call.
+            deadline=Deadline(self.max_total_seconds),
+        )
+
+    @staticmethod
+    def _report(run: "_RunState", success: bool, error: Optional[str]) -> RunReport:
+        return RunReport(
+            success=success,
+            turns=run.turns,
+            final_summary=None,
+            started_at=run.started_at,
+            ended_at=datetime.utcnow(),
+            error=error,
+            session_id=run.session_id,
+            timings=run.timings,
+            histograms=run.histograms,
+            pending_checks=run.pending_checks,
+            checks_dropped=run.checks_dropped,
+            checks_skipped=run.checks_skipped,
+        )
+
+    def _failed_report(self, run: "_RunState", e: Exception) -> RunReport:
+        return self._report(run, False, "max_total_seconds exceeded" if isinstance(e, DeadlineExceeded) else str(e))
+
+    @staticmethod
+    def _begin_turn(run: "_RunState", turn_index: int) -> "_TurnState":
+        user_message = run.next_message
+        run.turns.append(Turn(role="user", content=user_message, ts=datetime.utcnow()))
+        print(f"Turn {turn_index + 1}: user msg (len={len(user_message)})")
+        return _TurnState(index=turn_index, user_message=user_message, chat_started=time.perf_counter())
+
+    @staticmethod
+    def _on_reply(run: "_RunState", turn: "_TurnState", result: ChatResult) -> None:
+        """Record the agent's reply; the logs read and the driver call start right after."""
+        # Limiter waits are ours, not the agent's: the turn's clock starts after them.
+        turn.chat_started += result.rate_limit_wait_sec
+        turn.timing = TurnTiming(
+            turn_index=turn.index,
+            chat_sec=time.perf_counter() - turn.chat_started,
+            chat=result.timing,
+        )
+        run.timings.append(turn.timing)
+        run.session_id = result.session_id or run.session_id
+        turn.assistant_text = result.assistant_text.strip()
+        print("assistant_text: ", turn.assistant_text)
+        run.turns.append(Turn(role="assistant", content=turn.assistant_text, ts=datetime.utcnow()))
+
+        turn.is_q = is_question(turn.assistant_text)
+        stopped = stop_condition(turn.assistant_text)
+        print(
+            f"  assistant len={len(turn.assistant_text)}, is_question={turn.is_q}, "
+            f"stop_condition={stopped}, session_id={run.session_id}"
+        )
+
+    def _end_turn(
+        self,
+        run: "_RunState",
+        turn: "_TurnState",
+        driven: tuple[str, Optional[float]],
+        logs: tuple[Optional[PollResult], float],
+    ) -> None:
+        """Fold in the driver's next message and the turn's logs, then queue the log check."""
+        timing = turn.timing
+        run.next_message, timing.driver_sec = driven
+        polled, timing.logs_sec = logs
+        timing.log_lag_sec = polled.lag_sec if polled is not None else None
+        # phase 2: these logs answer `user_message`, which replied to the previous agent message
+        outcome = self._submit_check(
+            turn.index, run.last_agent_message, turn.user_message, polled, timing, run.pending_checks
+        )
+        run.checks_dropped += outcome == "dropped"
+        run.checks_skipped += outcome == "skipped"
+        run.last_agent_message = turn.assistant_text
+        timing.turn_sec = time.perf_counter() - turn.chat_started
+        run.histograms.record_turn(timing)
+        self._print_timing(timing)
+
+        print("current_user_message: ", run.next_message)
+        print("+*+*+*+*+*+**+*+*+*+*+*+*+*+*+*+*+*+*+*+*********")
+
+    def run(self, initial_user_message: str) -> RunReport:
+        """Run the conversation until stop condition or limits."""
+        run = self._start_run(initial_user_message)
+        try:
+            for turn_index in range(self.max_turns):
+                if run.deadline.expired():
+                    return self._report(run, False, "max_total_seconds exceeded")
+                turn = self._begin_turn(run, turn_index)
+                result = self.chat.send_message(turn.user_message, run.session_id, deadline=run.deadline)
+                self._on_reply(run, turn, result)
+                # read logs for THIS message only, while the driver writes the next one
+                logs_future = self._turn_pool().submit(
+                    self._read_logs_timed, run.log_poller, run.session_id, turn.index, run.deadline,
+                    time.perf_counter(),
                 )
+                driven = self._next_user_message_timed(
+                    run.persona, turn.assistant_text, run.turns, turn.is_q, run.deadline
+                )
+                self._end_turn(run, turn, driven, logs_future.result())
+            return self._report(run, True, "max_turns exceeded")
+        except Exception as e:
+            return self._failed_report(run, e)
+        finally:
+            self._close_turn_pool()
 
-                # if stopped:
-                #     return RunReport(
-                #         success=True,
-                #         turns=turns,
-                #         final_summary=assistant_text,
-                #         started_at=started_at,
-                #         ended_at=datetime.utcnow(),
-                #         error=None,
-                #     )
-
-                if is_q:
-                    recent = turns[-10:] if len(turns) >= 10 else turns
-                    current_user_message = self.driver.generate_reply(persona, assistant_text, recent)
-                    if not current_user_message:
-                        current_user_message = "I'm not sure what to say."
-                else:
-                    current_user_message = "Okay."
-
-                print("current_user_message: ", current_user_message)
-                print("+*+*+*+*+*+**+*+*+*+*+*+*+*+*+*+*+*+*+*+*********")
-
-            return RunReport(
-                success=True,
-                turns=turns,
-                final_summary=None,
-                started_at=started_at,
-                ended_at=datetime.utcnow(),
-                error="max_turns exceeded",
-            )
+    async def run_async(self, initial_user_message: str) -> RunReport:
+        """Async variant of run() for an AsyncChatClient.
+
+        The SSE stream is awaited on the event loop; the blocking logs read and
+        driver call run on this session's own turn pool so the loop stays free
+        for other sessions.
+        """
+        run = self._start_run(initial_user_message)
+        try:
+            for turn_index in range(self.max_turns):
+                if run.deadline.expired():
+                    return self._report(run, False, "max_total_seconds exceeded")
+                turn = self._begin_turn(run, turn_index)
+                result = await self.chat.send_message(turn.user_message, run.session_id, deadline=run.deadline)
+                self._on_reply(run, turn, result)
+                logs_task = self._in_turn_pool(
+                    self._read_logs_timed, run.log_poller, run.session_id, turn.index, run.deadline,
+                    time.perf_counter(),
+                )
+                driven = await self._in_turn_pool(
+                    self._next_user_message_timed, run.persona, turn.assistant_text, list(run.turns), turn.is_q,
+                    run.deadline,
+                )
+                self._end_turn(run, turn, driven, await logs_task)
+            return self._report(run, True, "max_turns exceeded")
         except Exception as e:
-            return RunReport(
-                success=False,
-                turns=turns,
-                final_summary=None,
-                started_at=started_at,
-                ended_at=datetime.utcnow(),
-                error=str(e),
-            )
+            return self._failed_report(run, e)
+        finally:
+            self._close_turn_pool()
+
+
+@dataclass
+class _RunState:
+    """One session's state across turns."""
+
+    started_at: datetime
+    persona: dict
+    next_message: str   # the user message the next turn sends
+    log_poller: LogPoller
+    deadline: Deadline
+    turns: list[Turn] = field(default_factory=list)
+    session_id: Optional[str] = None
+    timings: list[TurnTiming] = field(default_factory=list)
+    histograms: HistogramSet = field(default_factory=HistogramSet)
+    pending_checks: list[tuple[int, "Future[LogCheckResult]"]] = field(default_factory=list)
+    checks_dropped: int = 0
+    checks_skipped: int = 0
+    last_agent_message: str = ""
+
+
+@dataclass
+class _TurnState:
+    index: int
+    user_message: str
+    chat_started: float   # perf_counter; moved past the limiter waits once the reply is in
+    timing: Optional[TurnTiming] = None
+    assistant_text: str = ""
+    is_q: bool = False
@@ -1,5 +1,7 @@
 """Persona definition and question/stop detection."""
 
+import hashlib
+import json
 import re
 
 PERSONA: dict = {
@@ -43,6 +45,12 @@ def persona_context() -> dict:
     return dict(PERSONA)
 
 
+def persona_key(persona: dict) -> str:
+    """Stable id of a persona's contents (editing the persona changes it)."""
+    blob = json.dumps(persona, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
 def is_question(text: str) -> bool:
     """Treat the assistant message as requiring a reply if it asks something."""
     if not text or not text.strip():
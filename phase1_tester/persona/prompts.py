@@ -1,7 +1,10 @@
 """System prompt and message builder for the persona driver and log checker."""
 
-import json
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from phase2_tester.log_compact import compact_logs, serialize_logs
 
 if TYPE_CHECKING:
     from phase1_tester.config.types import Turn
@@ -146,25 +149,60 @@ Rules:
 
 
 
+def _render_fields(template: str) -> str:
+    """Fill the {fields} placeholder (str.format would trip on the JSON braces in the checker prompt)."""
+    return template.replace("{fields}", " " + ", ".join(f.strip() for f in fields.split(",") if f.strip()))
+
+
+DRIVER_SYSTEM_PROMPT = _render_fields(DRIVER_SYSTEM_PROMPT)
+Logs_checker_prompt = _render_fields(Logs_checker_prompt)
+
+PRIMING_REPLY: str = "Understood. I'll answer only what the agent asks, briefly and in character."
+
+
+@lru_cache(maxsize=64)
+def _compile_prefix(items: tuple[tuple[str, str], ...]) -> tuple[Mapping[str, str], ...]:
+    persona_block = "Persona (use only this when answering):\n" + "\n".join(f"- {k}: {v}" for k, v in items)
+    # Cached and shared: read-only views, so no caller can edit every later prompt.
+    return (
+        MappingProxyType({"role": "system", "content": DRIVER_SYSTEM_PROMPT}),
+        MappingProxyType({"role": "user", "content": persona_block}),
+        MappingProxyType({"role": "assistant", "content": PRIMING_REPLY}),
+    )
+
+
+def driver_prefix(persona: dict) -> tuple[Mapping[str, str], ...]:
+    """
+    The static start of every driver prompt (system prompt, persona, priming
+    reply), built once per persona and shared by all turns and sessions, so
+    the provider sees a byte-identical prefix and its prompt cache hits.
+    Read-only (mapping proxies): persona_messages() hands out dict copies for
+    the API call.
+    """
+    # Keyed by the rendered values: the same persona always maps to the same prefix.
+    return _compile_prefix(tuple((str(k), str(v)) for k, v in persona.items()))
+
+
+def persona_messages(persona: dict) -> list[dict]:
+    """driver_prefix() as a fresh list to append the turns to (the strings are shared)."""
+    return [dict(m) for m in driver_prefix(persona)]
+
+
+def without_trailing_assistant(recent_turns: list["Turn"], last_assistant: str) -> list["Turn"]:
+    """recent_turns usually ends with last_assistant itself; it is appended once, at the end."""
+    if recent_turns and recent_turns[-1].role == "assistant" and recent_turns[-1].content.strip() == last_assistant.strip():
+        return recent_turns[:-1]
+    return recent_turns
+
+
 def build_driver_messages(
     persona: dict,
     last_assistant: str,
     recent_turns: list["Turn"],
 ) -> list[dict]:
     """Build messages for the GPT-4o driver: system + persona context + recent turns + last assistant."""
-    messages = [
-        {"role": "system", "content": DRIVER_SYSTEM_PROMPT},
-        {
-            "role": "user",
-            "content": "Persona (use only this when answering):\n"
-            + "\n".join(f"- {k}: {v}" for k, v in persona.items()),
-        },
-        {
-            "role": "assistant",
-            "content": "Understood. I'll answer only what the agent asks, briefly and in character.",
-        },
-    ]
-    for t in recent_turns:
+    messages = persona_messages(persona)
+    for t in without_trailing_assistant(recent_turns, last_assistant):
         messages.append({"role": t.role, "content": t.content})
     messages.append({"role": "assistant", "content": last_assistant})
     return messages
@@ -174,16 +212,22 @@ def build_Logs_checker_prompt(
     last_real_message: str,
     user_response: str,
     logs: list[dict[str, Any]],
+    logs_json: Optional[str] = None,
 ) -> list[dict]:
-    """Build messages for GPT-4o log checker (phase 2)."""
-    pretty_logs = json.dumps(logs, ensure_ascii=False, indent=2)
+    """
+    Build messages for GPT-4o log checker (phase 2). Logs are projected to the
+    fields the checker uses and serialized compactly, unless `logs_json` (already
+    serialized) is given.
+    """
+    if logs_json is None:
+        logs_json = serialize_logs(compact_logs(logs))
     user_content = (
         "Last real agent message:\n"
         f"{last_real_message}\n\n"
         "User response:\n"
         f"{user_response}\n\n"
         "Logs (JSON list):\n"
-        f"{pretty_logs}\n"
+        f"{logs_json}\n"
     )
     return [
         {"role": "system", "content": Logs_checker_prompt},
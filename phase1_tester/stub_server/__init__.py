@@ -0,0 +1,3 @@
+from .server import StubConfig, StubServer, start_in_thread
+
+__all__ = ["StubConfig", "StubServer", "start_in_thread"]
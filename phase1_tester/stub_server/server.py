@@ -0,0 +1,300 @@
+"""
+Local stand-in for the agent: same /chat/fast SSE and /logs/api JSON contracts, with
+configurable latency and fault injection, so the harness can be benchmarked offline.
+
+Run:
+  python -m phase1_tester.stub_server --port 8765 --ttft 0.4 --token-delay 0.02
+  (then point API_URL / LOGS_API_URL at http://127.0.0.1:8765/chat/fast and /logs/api)
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+AGENT_SCRIPT: tuple[str, ...] = (
+    "Hi! Happy to help you find a place. What is your maximum purchase budget?",
+    "Great. How many bedrooms and bathrooms do you need at minimum?",
+    "Which state and area are you focusing on?",
+    "Have you been pre-approved for a mortgage yet?",
+    "What monthly payment would feel comfortable for you?",
+    "What type of property are you looking for: house, condo or townhouse?",
+)
+
+CLOSING_MESSAGE: str = (
+    "Thanks, I've gathered all the information I need.\n\n"
+    "Based on our conversation I'll put together a shortlist of homes that fit your budget and area."
+)
+
+
+@dataclass
+class StubConfig:
+    ttft_sec: float = 0.3           # delay before the first content delta
+    token_delay_sec: float = 0.02   # delay between content deltas
+    error_rate: float = 0.0         # probability a chat POST answers 5xx
+    drop_rate: float = 0.0          # probability a stream is cut mid-reply
+    logs_error_rate: float = 0.0    # probability a logs GET answers 5xx
+    log_lag_sec: float = 0.5        # how long after the reply logs become visible
+    log_lag_jitter_sec: float = 0.2
+    legacy_logs: bool = False       # ignore since_id, like servers without cursor support
+    seed: Optional[int] = None
+
+
+class StubState:
+    """Sessions, their turn counters and the logs table, shared by all handler threads."""
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._turns: dict[str, int] = {}
+        self._ids = itertools.count(1)
+        # (user_id, session_id) -> list of (visible_at, log)
+        self._logs: dict[tuple[str, str], list[tuple[float, dict[str, Any]]]] = {}
+
+    def chance(self, p: float) -> bool:
+        with self._lock:
+            return p > 0 and self.rng.random() < p
+
+    def drop_point(self, p: float, n: int) -> Optional[int]:
+        """With probability p, the index in range(n) to cut a stream at; one draw under the lock."""
+        with self._lock:
+            return self.rng.randrange(n) if p > 0 and self.rng.random() < p else None
+
+    def next_turn(self, session_id: str) -> int:
+        with self._lock:
+            turn = self._turns.get(session_id, 0)
+            self._turns[session_id] = turn + 1
+            return turn
+
+    def write_turn_logs(self, user_id: str, session_id: str, user_content: str, reply: str) -> None:
+        """Logs the real backend writes asynchronously after each reply."""
+        now = time.time()
+        cfg = self.config
+        entries = [
+            ("intent_classifier", json.dumps({"intent_type": "answer_question"}), None),
+            ("main_model", reply, None),
+            ("extraction_model", json.dumps({"answers": [{"question": "last", "answer": user_content}]}), None),
+        ]
+        with self._lock:
+            rows = self._logs.setdefault((user_id, session_id), [])
+            for log_type, response, error in entries:
+                lag = cfg.log_lag_sec + self.rng.uniform(0, cfg.log_lag_jitter_sec)
+                # Rows become visible in id order (a sequential writer), so a
+                # since_id cursor never skips a row that shows up late.
+                visible_at = max(now + lag, rows[-1][0] if rows else 0.0)
+                log_id = next(self._ids)
+                rows.append((visible_at, {
+                    "id": log_id,
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "log_type": log_type,
+                    "response": response,
+                    "error_message": error,
+                    "created_at": visible_at,
+                }))
+
+    def visible_logs(
+        self, user_id: str, session_id: str, limit: int, since_id: Optional[int] = None
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        (logs, has_more). Newest-first visible logs, like the production endpoint;
+        with since_id, the oldest-first page of logs with id > since_id instead.
+        """
+        now = time.time()
+        with self._lock:
+            rows = [log for visible_at, log in self._logs.get((user_id, session_id), []) if visible_at <= now]
+        if since_id is None:
+            rows.sort(key=lambda log: log["id"], reverse=True)
+        else:
+            rows = sorted((log for log in rows if log["id"] > since_id), key=lambda log: log["id"])
+        return rows[:limit], len(rows) > limit
+
+
+def tokenize(text: str) -> list[str]:
+    """Split into word-sized deltas, keeping the whitespace so the reply re-joins exactly."""
+    parts = text.split(" ")
+    return [p + (" " if i < len(parts) - 1 else "") for i, p in enumerate(parts)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Each SSE event is its own small write: without TCP_NODELAY, Nagle holds it
+    # back behind the previous unacknowledged one and skews the measured TTFT.
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    # ---------- helpers ----------
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_event(self, payload: Any) -> None:
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        self._write_chunk(f"data: {data}\n\n".encode("utf-8"))
+
+    # ---------- routes ----------
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != "/chat/fast":
+            self._send_json(404, {"success": False, "error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"success": False, "error": "invalid JSON"})
+            return
+
+        state = self.server.state
+        cfg = state.config
+        if state.chance(cfg.error_rate):
+            self._send_json(503, {"success": False, "error": "injected 5xx"})
+            return
+
+        user_id = str(body.get("userId") or "")
+        session_id = body.get("session_id") or str(uuid.uuid4())
+        turn = state.next_turn(session_id)
+        reply = AGENT_SCRIPT[turn] if turn < len(AGENT_SCRIPT) else CLOSING_MESSAGE
+        tokens = tokenize(reply)
+        drop_after = state.drop_point(cfg.drop_rate, len(tokens))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            self._send_event({"session_id": session_id})
+            time.sleep(cfg.ttft_sec)
+            for i, token in enumerate(tokens):
+                if drop_after is not None and i == drop_after:
+                    # Cut the connection without the terminating chunk.
+                    self.close_connection = True
+                    return
+                if i:
+                    time.sleep(cfg.token_delay_sec)
+                self._send_event({"type": "content", "delta": token})
+            self._send_event({"type": "done"})
+            self._send_event("[DONE]")
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        finally:
+            # Like the backend, log the turn even if the client hung up after
+            # [DONE] (before the terminating chunk) or the stream was cut.
+            state.write_turn_logs(user_id, session_id, str(body.get("content") or ""), reply)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path != "/logs/api":
+            self._send_json(404, {"success": False, "error": "not found"})
+            return
+        state = self.server.state
+        if state.chance(state.config.logs_error_rate):
+            self._send_json(500, {"success": False, "error": "injected 5xx"})
+            return
+
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            limit = int(query.get("limit") or 50)
+        except ValueError:
+            limit = 50
+        since_id: Optional[int] = None
+        if query.get("since_id") and not state.config.legacy_logs:
+            try:
+                since_id = int(query["since_id"])
+            except ValueError:
+                self._send_json(400, {"success": False, "error": "invalid since_id"})
+                return
+        logs, has_more = state.visible_logs(query.get("user_id", ""), query.get("session_id", ""), limit, since_id)
+        payload: dict[str, Any] = {"success": True, "logs": logs, "count": len(logs)}
+        if since_id is not None:
+            payload.update(since_id=since_id, has_more=has_more)
+        self._send_json(200, payload)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: StubConfig):
+        super().__init__(address, StubHandler)
+        self.state = StubState(config)
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients hang up mid-stream (and we drop streams on purpose): not worth a traceback.
+        if isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            return
+        super().handle_error(request, client_address)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_thread(config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> StubServer:
+    """Start a stub on a background thread (port 0 = pick a free port). Call .shutdown() to stop."""
+    server = StubServer((host, port), config or StubConfig())
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local stand-in for /chat/fast and /logs/api.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ttft", type=float, default=0.3, help="seconds before the first delta")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="seconds between deltas")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="chat 5xx probability")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="mid-stream disconnect probability")
+    parser.add_argument("--logs-error-rate", type=float, default=0.0, help="logs 5xx probability")
+    parser.add_argument("--log-lag", type=float, default=0.5, help="seconds until logs are visible")
+    parser.add_argument("--log-lag-jitter", type=float, default=0.2)
+    parser.add_argument("--legacy-logs", action="store_true", help="ignore since_id on /logs/api")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        ttft_sec=args.ttft,
+        token_delay_sec=args.token_delay,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        logs_error_rate=args.logs_error_rate,
+        log_lag_sec=args.log_lag,
+        log_lag_jitter_sec=args.log_lag_jitter,
+        legacy_logs=args.legacy_logs,
+        seed=args.seed,
+    )
+    server = StubServer((args.host, args.port), config)
+    print(f"stub agent on {server.base_url}/chat/fast and {server.base_url}/logs/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
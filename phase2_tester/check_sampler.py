@@ -0,0 +1,105 @@
+# phase2_tester/check_sampler.py
+from __future__ import annotations
+
+import random
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+from phase1_tester.config.config import (
+    LOG_CHECK_MIN_SAMPLES,
+    LOG_CHECK_SAMPLE_RATE,
+    LOG_CHECK_SLOW_PERCENTILE,
+    LOG_CHECK_SLOW_TURN_SEC,
+)
+from phase1_tester.metrics.histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from phase1_tester.config.types import TurnTiming
+
+
+class CheckSampler:
+    """
+    Decides which turns get an LLM log check, from cheap signals:
+      - anomalous turns are always checked: no logs, an error_message, no
+        intent_classifier, an extraction_model log without answers, expected
+        log types that never showed up, or a slow reply (over slow_turn_sec, or
+        over the run's own slow_percentile once min_samples replies were seen)
+      - normal turns are checked with probability sample_rate
+    One sampler is shared by all sessions; counters are per reason.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = LOG_CHECK_SAMPLE_RATE,
+        slow_turn_sec: float = LOG_CHECK_SLOW_TURN_SEC,
+        slow_percentile: float = LOG_CHECK_SLOW_PERCENTILE,
+        min_samples: int = LOG_CHECK_MIN_SAMPLES,
+        rng: Optional[random.Random] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_turn_sec = slow_turn_sec
+        self.slow_percentile = slow_percentile
+        self.min_samples = min_samples
+        self._rng = rng or random.Random()
+        self._chat_latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self.checked: dict[str, int] = {}
+        self.skipped = 0
+
+    def _anomaly(
+        self,
+        summary: Optional[dict[str, Any]],
+        logs: list[dict[str, Any]],
+        missing_types: set[str],
+        timing: Optional["TurnTiming"],
+    ) -> Optional[str]:
+        # Before the checks below return: every turn's latency goes into the baseline.
+        slow = self._record_latency(timing)
+        if not logs or summary is None:
+            return "no_logs"
+        if summary.get("error_message"):
+            return "error"
+        if not summary.get("intent_classifier"):
+            return "no_intent"
+        if not summary.get("extraction_answers") and any(l.get("log_type") == "extraction_model" for l in logs):
+            return "empty_extraction"
+        if missing_types:
+            return "missing_logs"
+        if slow:
+            return "slow"
+        return None
+
+    def _record_latency(self, timing: Optional["TurnTiming"]) -> bool:
+        """Record the turn's chat latency; True if it is slow next to the turns seen before it."""
+        if timing is None:
+            return False
+        latency = timing.chat_sec
+        with self._lock:
+            slow = latency >= self.slow_turn_sec
+            if not slow and self._chat_latency.count >= self.min_samples:
+                threshold = self._chat_latency.percentile(self.slow_percentile)
+                slow = threshold is not None and latency > threshold
+            self._chat_latency.record(latency)
+        return slow
+
+    def decide(
+        self,
+        summary: Optional[dict[str, Any]],
+        logs: list[dict[str, Any]],
+        missing_types: set[str],
+        timing: Optional["TurnTiming"] = None,
+    ) -> Optional[str]:
+        """The reason to check this turn ("error", "slow", ..., "sampled"), or None to skip it."""
+        reason = self._anomaly(summary, logs, missing_types, timing)
+        with self._lock:
+            if reason is None and self._rng.random() < self.sample_rate:
+                reason = "sampled"
+            if reason is None:
+                self.skipped += 1
+            else:
+                self.checked[reason] = self.checked.get(reason, 0) + 1
+        return reason
+
+    @property
+    def checked_total(self) -> int:
+        return sum(self.checked.values())
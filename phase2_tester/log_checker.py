@@ -0,0 +1,243 @@
+# phase2_tester/log_checker.py
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from openai import OpenAI
+
+from phase1_tester.client.deadline import Deadline, call_timeout
+from phase1_tester.client.rate_limit import OPENAI_REQUESTS, OPENAI_TOKENS, RateLimiter, get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.config.config import (
+    LOG_CHECKER_CHECK_TIMEOUT_SEC,
+    LOG_CHECKER_JOIN_TIMEOUT_SEC,
+    LOG_CHECKER_QUEUE_SIZE,
+    LOG_CHECKER_SUBMIT_TIMEOUT_SEC,
+    LOG_CHECKER_WORKERS,
+    OPENAI_TIMEOUT_SEC,
+    RETRY_COUNT,
+)
+from phase1_tester.config.types import LogCheckResult
+from phase1_tester.driver.tokens import count_message_tokens, count_tokens
+from phase1_tester.persona.prompts import build_Logs_checker_prompt
+from phase2_tester.log_compact import compact_logs, serialize_logs
+
+if TYPE_CHECKING:
+    from phase1_tester.cassette.cassette import Cassette
+    from phase1_tester.config.types import RunReport
+    from phase1_tester.metrics.histogram import HistogramSet
+    from phase2_tester.check_sampler import CheckSampler
+
+MAX_VERDICT_TOKENS = 400
+
+
+class LogTokens(NamedTuple):
+    raw: int       # the logs as json.dumps(indent=2), as the prompt used to carry them
+    compact: int   # after projection + compact serialization
+
+
+class LogChecker:
+    """Asks the LLM whether one turn's backend logs followed the normal path (Logs_checker_prompt)."""
+
+    def __init__(
+        self,
+        model: str,
+        api_key_env: str = "OPENAI_API_KEY",
+        cassette: Optional["Cassette"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.model = model
+        self.cassette = cassette
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        # Retries go through the policy (and its budget), as for the driver, not the SDK.
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=RETRY_COUNT)
+        if cassette is not None and cassette.replaying:
+            self._client = None
+            return
+        api_key = os.environ.get(api_key_env)
+        if not api_key:
+            raise ValueError(f"Missing {api_key_env} environment variable")
+        self._client = OpenAI(api_key=api_key, max_retries=0)
+
+    def check(
+        self,
+        last_agent_message: str,
+        user_response: str,
+        logs: list[dict[str, Any]],
+        deadline: Optional[Deadline] = None,
+    ) -> tuple[dict[str, Any], LogTokens]:
+        """
+        The checker's JSON verdict ({"normal_path": ..., "Log_error": ..., ...}) and
+        the logs' token counts. `deadline` bounds the limiter waits and every attempt.
+        """
+        logs_json = serialize_logs(compact_logs(logs))
+        tokens = LogTokens(
+            raw=count_tokens(json.dumps(logs, ensure_ascii=False, indent=2), self.model),
+            compact=count_tokens(logs_json, self.model),
+        )
+        messages = build_Logs_checker_prompt(last_agent_message, user_response, logs, logs_json=logs_json)
+        if self.cassette is not None and self.cassette.replaying:
+            return self.cassette.next("checker")["verdict"], tokens
+
+        prompt_tokens = count_message_tokens(messages, self.model)
+        for attempt in itertools.count():
+            self.rate_limiter.acquire(OPENAI_REQUESTS, deadline=deadline)
+            self.rate_limiter.acquire(OPENAI_TOKENS, prompt_tokens + MAX_VERDICT_TOKENS, deadline=deadline)
+            client = self._client.with_options(timeout=call_timeout(deadline, OPENAI_TIMEOUT_SEC))
+            try:
+                resp = client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=MAX_VERDICT_TOKENS,
+                    temperature=0,
+                    response_format={"type": "json_object"},
+                )
+                break
+            except Exception as e:
+                delay = self.retry_policy.next_delay(e, attempt, deadline=deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+        content = (resp.choices[0].message.content or "").strip()
+        verdict = json.loads(content)
+        if not isinstance(verdict, dict):
+            raise ValueError("checker answer is not a JSON object")
+        if self.cassette is not None:
+            self.cassette.record("checker", model=self.model, messages=messages, verdict=verdict)
+        return verdict, tokens
+
+
+@dataclass
+class CheckJob:
+    turn_index: int
+    last_agent_message: str
+    user_response: str
+    logs: list[dict[str, Any]]
+    reason: Optional[str] = None   # why the sampler picked this turn
+    submitted_at: float = 0.0
+
+
+class CheckerPool:
+    """
+    Runs LogChecker calls on `workers` background threads, fed by a bounded queue,
+    so the conversation loop never waits on the LLM. (ThreadPoolExecutor's queue
+    is unbounded: under load it would buffer checks without limit.)
+
+    Backpressure: submit() blocks for at most `submit_timeout_sec` while the queue
+    is full, then drops the check and returns None; drops are counted.
+    One pool is shared by every session of a run; each submit() gets its own Future.
+    Sessions do not wait for their checks: their reports carry the futures, and
+    join_checks() resolves them all once the load is over.
+    With a `sampler`, the orchestrator only submits the turns it picks.
+    """
+
+    def __init__(
+        self,
+        checker: LogChecker,
+        workers: int = LOG_CHECKER_WORKERS,
+        queue_size: int = LOG_CHECKER_QUEUE_SIZE,
+        submit_timeout_sec: float = LOG_CHECKER_SUBMIT_TIMEOUT_SEC,
+        sampler: Optional["CheckSampler"] = None,
+    ):
+        self.checker = checker
+        self.sampler = sampler
+        self.submit_timeout_sec = submit_timeout_sec
+        self._queue: queue.Queue[Optional[tuple[CheckJob, Future]]] = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.dropped = 0
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"log-checker-{i}", daemon=True) for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, job: CheckJob) -> Optional["Future[LogCheckResult]"]:
+        job.submitted_at = time.perf_counter()
+        future: Future = Future()
+        try:
+            if self.submit_timeout_sec > 0:
+                self._queue.put((job, future), timeout=self.submit_timeout_sec)
+            else:
+                self._queue.put_nowait((job, future))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return None
+        with self._lock:
+            self.submitted += 1
+        return future
+
+    def join_checks(
+        self,
+        reports: list["RunReport"],
+        histograms: "HistogramSet",
+        timeout_sec: float = LOG_CHECKER_JOIN_TIMEOUT_SEC,
+    ) -> None:
+        """
+        Wait (at most timeout_sec for all of them together) for the reports'
+        pending checks, move them into each report's `checks` in turn order, and
+        record their queue and check times in `histograms`.
+        """
+        wait([future for r in reports for _, future in r.pending_checks], timeout=timeout_sec)
+        for report in reports:
+            for turn_index, future in report.pending_checks:
+                if future.done():
+                    check = future.result()
+                    histograms.record("log_check_queue", check.queued_sec)
+                    histograms.record("log_check", check.check_sec)
+                else:
+                    check = LogCheckResult(turn_index=turn_index, normal_path=None, error="log check not finished")
+                report.checks.append(check)
+            report.pending_checks = []
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            picked_up = time.perf_counter()
+            try:
+                verdict, tokens = self.checker.check(
+                    job.last_agent_message,
+                    job.user_response,
+                    job.logs,
+                    deadline=Deadline(LOG_CHECKER_CHECK_TIMEOUT_SEC),
+                )
+                normal = verdict.get("normal_path")
+                result = LogCheckResult(
+                    turn_index=job.turn_index,
+                    normal_path=normal if isinstance(normal, bool) else None,
+                    verdict=verdict,
+                    reason=job.reason,
+                    logs_tokens_raw=tokens.raw,
+                    logs_tokens=tokens.compact,
+                )
+            except Exception as e:
+                result = LogCheckResult(turn_index=job.turn_index, normal_path=None, reason=job.reason, error=str(e))
+            result.queued_sec = picked_up - job.submitted_at
+            result.check_sec = time.perf_counter() - picked_up
+            future.set_result(result)
+
+    def close(self) -> None:
+        """Finish what is queued, then stop the workers."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
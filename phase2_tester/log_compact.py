@@ -0,0 +1,78 @@
+# phase2_tester/log_compact.py
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+from phase1_tester.config.config import LOG_CHECKER_MAX_FIELD_CHARS
+
+# metadata keys the checker prompt reads (intent, extracted answers/memories)
+_METADATA_KEYS: tuple[str, ...] = ("intent_type", "extracted_answers", "extracted_memories")
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Deterministic cut: the first `limit` chars plus how much was dropped."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...(+{len(text) - limit} chars)"
+
+
+def _shrink(value: Any, limit: int) -> Any:
+    """Truncate every string inside a JSON-like value."""
+    if isinstance(value, str):
+        return _truncate(value, limit)
+    if isinstance(value, list):
+        return [_shrink(v, limit) for v in value]
+    if isinstance(value, dict):
+        return {k: _shrink(v, limit) for k, v in value.items()}
+    return value
+
+
+def _parse_json(text: Any) -> Optional[Any]:
+    if not isinstance(text, str) or not text.strip():
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def compact_log(log: dict[str, Any], limit: int = LOG_CHECKER_MAX_FIELD_CHARS) -> dict[str, Any]:
+    """
+    Only what Logs_checker_prompt uses: id/request_id (ordering), log_type, error
+    fields, the intent, extraction answers and memories. Other response bodies
+    are kept as a truncated excerpt; everything else is dropped.
+    """
+    out: dict[str, Any] = {"id": log.get("id"), "log_type": log.get("log_type")}
+    if log.get("request_id") is not None:
+        out["request_id"] = log["request_id"]
+    if log.get("error_message"):
+        out["error_message"] = _truncate(str(log["error_message"]), limit)
+
+    metadata = log.get("metadata")
+    if isinstance(metadata, str):
+        metadata = _parse_json(metadata)
+    if isinstance(metadata, dict):
+        kept = {k: _shrink(metadata[k], limit) for k in _METADATA_KEYS if metadata.get(k) is not None}
+        if kept:
+            out["metadata"] = kept
+
+    log_type = log.get("log_type")
+    response = log.get("response")
+    parsed = _parse_json(response)
+    if log_type == "intent_classifier" and isinstance(parsed, dict) and "intent_type" in parsed:
+        out["intent_type"] = parsed["intent_type"]
+    elif log_type == "extraction_model" and isinstance(parsed, dict) and isinstance(parsed.get("answers"), list):
+        out["answers"] = _shrink(parsed["answers"], limit)
+    elif isinstance(response, str) and response.strip():
+        out["response"] = _truncate(response.strip(), limit)
+    return out
+
+
+def compact_logs(logs: list[dict[str, Any]], limit: int = LOG_CHECKER_MAX_FIELD_CHARS) -> list[dict[str, Any]]:
+    return [compact_log(log, limit) for log in logs]
+
+
+def serialize_logs(logs: list[dict[str, Any]]) -> str:
+    """No whitespace between tokens: indentation alone was a large share of the prompt."""
+    return json.dumps(logs, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,137 @@
+# phase2_tester/log_poller.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from phase1_tester.client.deadline import Deadline
+from phase1_tester.config.config import (
+    LOG_EXPECTED_TYPES,
+    LOG_POLL_INITIAL_SEC,
+    LOG_POLL_MAX_INTERVAL_SEC,
+    LOG_POLL_GROWTH,
+    LOG_POLL_SETTLE_SEC,
+    LOG_POLL_TIMEOUT_SEC,
+)
+from phase2_tester.logs_reader import LogsReader
+
+if TYPE_CHECKING:
+    from phase1_tester.cassette.cassette import Cassette
+
+
+@dataclass
+class PollResult:
+    logs: list[dict[str, Any]] = field(default_factory=list)   # raw new logs, oldest first
+    found_types: set[str] = field(default_factory=set)
+    missing_types: set[str] = field(default_factory=set)
+    polls: int = 0
+    lag_sec: Optional[float] = None   # stream end -> all expected types visible (None if never)
+    summary: Optional[dict[str, Any]] = None   # LogsReader.prepere_logs() of `logs`, once printed
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing_types
+
+
+class LogPoller:
+    """
+    The backend writes a turn's logs asynchronously after the reply, so one fetch
+    right after the stream races the writer. poll() re-reads through the
+    LogsReader cursor at growing intervals (initial, *growth, capped at
+    max_interval) until every expected log type has shown up, the poll timeout
+    passes, or the run deadline does. Once they are all there it keeps polling
+    for settle_sec after the last new log, so the turn's late logs are not
+    attributed to the next turn.
+    With a cassette, each poll() records how many fetches it made; a replay
+    makes exactly that many fetches, without sleeping.
+    """
+
+    def __init__(
+        self,
+        reader: LogsReader,
+        expected_types: tuple[str, ...] = LOG_EXPECTED_TYPES,
+        initial_interval_sec: float = LOG_POLL_INITIAL_SEC,
+        max_interval_sec: float = LOG_POLL_MAX_INTERVAL_SEC,
+        growth: float = LOG_POLL_GROWTH,
+        timeout_sec: float = LOG_POLL_TIMEOUT_SEC,
+        settle_sec: float = LOG_POLL_SETTLE_SEC,
+        cassette: Optional["Cassette"] = None,
+    ):
+        self.reader = reader
+        self.expected_types = tuple(expected_types)
+        self.initial_interval_sec = initial_interval_sec
+        self.max_interval_sec = max_interval_sec
+        self.growth = growth
+        self.timeout_sec = timeout_sec
+        self.settle_sec = settle_sec
+        self.cassette = cassette
+
+    def poll(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 200,
+        prime_if_first_time: bool = True,
+        since: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> PollResult:
+        """
+        Collect the new logs of one turn. `since` is the perf_counter() time the
+        reply finished; lag is measured from it (defaults to now).
+        """
+        result = PollResult(missing_types=set(self.expected_types))
+        fetch_args = dict(
+            user_id=user_id,
+            session_id=session_id,
+            limit=limit,
+            prime_if_first_time=prime_if_first_time,
+            deadline=deadline,
+        )
+        if self.cassette is not None and self.cassette.replaying:
+            entry = self.cassette.next("log_poll")
+            for _ in range(entry["polls"]):
+                self._collect(result, self.reader.get_new_logs(**fetch_args))
+            result.lag_sec = entry.get("lag_sec")
+            return result
+
+        started = time.perf_counter()
+        since = started if since is None else since
+        give_up_at = started + self.timeout_sec
+        interval = self.initial_interval_sec
+        last_new_at = started
+
+        while True:
+            new_logs = self.reader.get_new_logs(**fetch_args)
+            now = time.perf_counter()
+            if new_logs:
+                last_new_at = now
+            self._collect(result, new_logs)
+            if result.complete and result.lag_sec is None:
+                # Upper bound: the logs appeared at some point before this poll returned.
+                result.lag_sec = now - since
+
+            stop_at = min(give_up_at, last_new_at + self.settle_sec) if result.complete else give_up_at
+            sleep = min(interval, stop_at - now)
+            if deadline is not None:
+                sleep = min(sleep, deadline.remaining())
+            if sleep <= 0:
+                break
+            time.sleep(sleep)
+            interval = min(interval * self.growth, self.max_interval_sec)
+
+        if self.cassette is not None:
+            self.cassette.record("log_poll", polls=result.polls, lag_sec=result.lag_sec)
+        return result
+
+    @staticmethod
+    def _collect(result: PollResult, new_logs: list[dict[str, Any]]) -> None:
+        result.polls += 1
+        if not new_logs:
+            return
+        result.logs.extend(new_logs)
+        for log in new_logs:
+            log_type = log.get("log_type")
+            if isinstance(log_type, str):
+                result.found_types.add(log_type)
+        result.missing_types -= result.found_types
@@ -1,11 +1,21 @@
 # phase2_tester/logs_client.py
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import requests
 
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded, call_timeout
+from phase1_tester.client.http_pool import get_shared_session
+from phase1_tester.client.rate_limit import LOGS, RateLimiter, get_shared_limiter
+from phase1_tester.client.retry import RetryPolicy
+from phase1_tester.config.config import LOGS_MAX_PAGES
+
+if TYPE_CHECKING:
+    from phase1_tester.cassette.cassette import Cassette
+
 
 @dataclass
 class LogsApiResponse:
@@ -13,18 +23,43 @@ class LogsApiResponse:
     logs: list[dict[str, Any]]
     count: int = 0
     error: Optional[str] = None
+    # The server echoed since_id: logs are id > since_id, oldest first.
+    cursor_supported: bool = False
+    # Server says more pages follow (None when it does not say).
+    has_more: Optional[bool] = None
+
+
+def _log_id(log: dict[str, Any]) -> Optional[int]:
+    try:
+        return int(str(log.get("id")))
+    except (TypeError, ValueError):
+        return None
 
 
 class LogsApiClient:
     """
     Thin client for the real_estate logs endpoint: GET /logs/api
-    Query params: user_id, session_id, limit, (optional) log_type
+    Query params: user_id, session_id, limit, (optional) log_type, (optional) since_id
     """
 
-    def __init__(self, logs_api_url: str, timeout_sec: int = 30, retry_count: int = 1):
+    def __init__(
+        self,
+        logs_api_url: str,
+        timeout_sec: int = 30,
+        retry_count: int = 1,
+        session: Optional[requests.Session] = None,
+        cassette: Optional["Cassette"] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.logs_api_url = logs_api_url
         self.timeout_sec = timeout_sec
         self.retry_count = retry_count
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=retry_count)
+        # Same host as /chat/fast: reuse the shared keep-alive pool by default.
+        self.session = session or get_shared_session()
+        self.cassette = cassette
+        self.rate_limiter = rate_limiter or get_shared_limiter()
 
     def fetch_logs(
         self,
@@ -32,34 +67,110 @@ class LogsApiClient:
         session_id: str,
         limit: int = 200,
         log_type: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        since_id: Optional[int] = None,
     ) -> LogsApiResponse:
-        
+
         params: dict[str, Any] = {"user_id": user_id, "session_id": session_id, "limit": limit}
+        if since_id is not None:
+            params["since_id"] = since_id
         #if log_type:
         #    params["log_type"] = log_type
 
+        if self.cassette is not None and self.cassette.replaying:
+            entry = self.cassette.next("logs")
+            if entry.get("error") is not None:
+                return LogsApiResponse(False, [], error=entry["error"])
+            return self._to_response(entry["payload"])
+
         last_error: Optional[Exception] = None
-        for _ in range(self.retry_count):
+        for attempt in range(self.retry_policy.max_attempts):
             try:
-                resp = requests.get(self.logs_api_url, params=params, timeout=self.timeout_sec)
+                self.rate_limiter.acquire(LOGS, deadline=deadline)
+                timeout = call_timeout(deadline, self.timeout_sec)
+                resp = self.session.get(self.logs_api_url, params=params, timeout=timeout)
                 resp.raise_for_status()
                 data = resp.json()
+                if self.cassette is not None:
+                    self.cassette.record("logs", params=params, payload=data)
+                return self._to_response(data)
+            except Exception as e:
+                last_error = e
+                if isinstance(e, DeadlineExceeded):
+                    break
+                delay = self.retry_policy.next_delay(e, attempt, deadline=deadline)
+                if delay is None:
+                    break
+                time.sleep(delay)
 
-                if not isinstance(data, dict):
-                    return LogsApiResponse(False, [], error="Invalid JSON shape (not dict).")
+        error = str(last_error) if last_error else "Unknown error"
+        if self.cassette is not None:
+            self.cassette.record("logs", params=params, payload=None, error=error)
+        return LogsApiResponse(False, [], error=error)
 
-                success = bool(data.get("success"))
-                logs = data.get("logs") or []
-                if not isinstance(logs, list):
-                    logs = []
+    def fetch_logs_since(
+        self,
+        user_id: str,
+        session_id: str,
+        since_id: int,
+        page_size: int = 200,
+        deadline: Optional[Deadline] = None,
+        max_pages: int = LOGS_MAX_PAGES,
+    ) -> LogsApiResponse:
+        """
+        Every log with id > since_id, oldest first, however many arrived.
+          - servers that support since_id are paged forward (cursor = last id seen)
+            until they report no more
+          - servers that ignore it return the newest `limit` records: those are
+            filtered client-side, and while the whole page is new (older new logs
+            may be cut off) the window is doubled and fetched again
+        Stops after max_pages requests; a failure after some pages returns what was
+        collected, so the caller's cursor only advances over logs it actually has.
+        """
+        collected: dict[int, dict[str, Any]] = {}
+        cursor = since_id
+        limit = page_size
+        for _ in range(max_pages):
+            resp = self.fetch_logs(user_id, session_id, limit=limit, deadline=deadline, since_id=cursor)
+            if not resp.success:
+                if not collected:
+                    return resp
+                break
+            fresh = 0
+            for log in resp.logs:
+                log_id = _log_id(log)
+                if log_id is not None and log_id > cursor:
+                    collected[log_id] = log
+                    fresh += 1
 
-                return LogsApiResponse(
-                    success=success,
-                    logs=logs,
-                    count=int(data.get("count") or len(logs)),
-                    error=data.get("error"),
-                )
-            except Exception as e:
-                last_error = e
+            if resp.cursor_supported:
+                more = resp.has_more if resp.has_more is not None else len(resp.logs) >= limit
+                if not more or not fresh:
+                    break
+                cursor = max(collected)
+            else:
+                if len(resp.logs) < limit or fresh < len(resp.logs):
+                    break
+                limit *= 2
+
+        logs = [collected[i] for i in sorted(collected)]
+        return LogsApiResponse(True, logs, count=len(logs))
+
+    @staticmethod
+    def _to_response(data: Any) -> LogsApiResponse:
+        if not isinstance(data, dict):
+            return LogsApiResponse(False, [], error="Invalid JSON shape (not dict).")
+
+        success = bool(data.get("success"))
+        logs = data.get("logs") or []
+        if not isinstance(logs, list):
+            logs = []
 
-        return LogsApiResponse(False, [], error=str(last_error) if last_error else "Unknown error")
+        return LogsApiResponse(
+            success=success,
+            logs=logs,
+            count=int(data.get("count") or len(logs)),
+            error=data.get("error"),
+            cursor_supported="since_id" in data,
+            has_more=data.get("has_more") if isinstance(data.get("has_more"), bool) else None,
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Optional
 import json
+from phase1_tester.client.deadline import Deadline
 from phase2_tester.logs_client import LogsApiClient
 
 
@@ -34,6 +35,7 @@ class LogsReader:
         session_id: str,
         limit: int = 200,
         prime_if_first_time: bool = True,
+        deadline: Optional[Deadline] = None,
     ) -> list[dict[str, Optional[str]]]:
         """
         Returns:
@@ -43,52 +45,56 @@ class LogsReader:
           This prevents returning historic logs.
         - Next calls return only what's new (id > last_seen_max_id).
         """
-        key = (user_id, session_id)
-
-        resp = self._client.fetch_logs(user_id=user_id, session_id=session_id, limit=limit)
-        if not resp.success or not resp.logs:
+        new_logs = self.get_new_logs(
+            user_id=user_id,
+            session_id=session_id,
+            limit=limit,
+            prime_if_first_time=prime_if_first_time,
+            deadline=deadline,
+        )
+        if not new_logs:
             return []
 
-        # Collect ids present in the payload
-        ids: list[int] = []
-        for l in resp.logs:
-            log_id = self._safe_int(l.get("id"))
-            if log_id is not None:
-                ids.append(log_id)
+        out = self.prepere_logs(new_logs)
 
-        if not ids:
-            return []
+        return out 
 
-        current_max_id = max(ids)
+    def get_new_logs(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 200,
+        prime_if_first_time: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Raw log records with id > last seen max id, oldest first (same cursor and
+        priming rules as get_logs). Used by LogPoller to accumulate across polls.
+        """
+        key = (user_id, session_id)
         prev_max_id = self._last_max_id.get(key)
 
-        # Update cursor immediately
-        self._last_max_id[key] = current_max_id
-
-        # Prime on first call (default behavior)
+        # Prime on first call (default behavior): remember the newest id, return nothing.
         if prev_max_id is None and prime_if_first_time:
+            resp = self._client.fetch_logs(user_id=user_id, session_id=session_id, limit=limit, deadline=deadline)
+            if resp.success:
+                ids = [i for i in (self._safe_int(l.get("id")) for l in resp.logs) if i is not None]
+                if ids:
+                    self._last_max_id[key] = max(ids)
             return []
 
-        # If prev_max_id is None but we don't want priming, treat it as 0
-        if prev_max_id is None:
-            prev_max_id = 0
-
-        # Filter only NEW logs
-        new_logs: list[dict[str, Any]] = []
-        for l in resp.logs:
-            log_id = self._safe_int(l.get("id"))
-            if log_id is not None and log_id > prev_max_id:
-                new_logs.append(l)
-
-        if not new_logs:
+        # If prev_max_id is None but we don't want priming, treat it as 0.
+        # Only records after the cursor, paged so no burst size loses any.
+        since_id = prev_max_id or 0
+        resp = self._client.fetch_logs_since(
+            user_id=user_id, session_id=session_id, since_id=since_id, page_size=limit, deadline=deadline
+        )
+        if not resp.success or not resp.logs:
             return []
 
-        # Sort ascending by id for stable chronological output
-        new_logs.sort(key=lambda x: self._safe_int(x.get("id")) or 0)
-        
-        out = self.prepere_logs(new_logs)
-
-        return out 
+        # Already filtered to id > since_id and sorted ascending by id.
+        self._last_max_id[key] = max(self._safe_int(l.get("id")) or since_id for l in resp.logs)
+        return resp.logs
 
     def prepere_logs(self, new_logs) -> dict[str, Any]:
 
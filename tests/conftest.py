@@ -0,0 +1,21 @@
+import pytest
+
+from phase1_tester.stub_server.server import StubConfig, start_in_thread
+
+
+@pytest.fixture
+def stub():
+    """Start a stub agent with the given StubConfig fields (fast by default); stopped after the test."""
+    servers = []
+
+    def start(**config):
+        config = {"ttft_sec": 0.0, "token_delay_sec": 0.0, "log_lag_sec": 0.0, "log_lag_jitter_sec": 0.0,
+                  "seed": 1, **config}
+        server = start_in_thread(StubConfig(**config))
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,76 @@
+from phase1_tester.driver.answer_index import AnswerIndex, normalize_question
+
+ALICE = {"name": "Alice", "budget": "$500k"}
+BOB = {"name": "Bob", "budget": "$300k"}
+
+
+def test_normalize_keeps_questions_and_numbers():
+    assert normalize_question("Great, thanks! How many bedrooms do you need?") == "how many bedrooms do you need"
+    assert normalize_question("Is $1,200,000 OK? Or 2.5 baths?") == "is 1200000 ok or 2.5 baths"
+    assert normalize_question("Do you want 3 bedrooms?") != normalize_question("Do you want 5 bedrooms?")
+    assert normalize_question("No question here.") == "no question here"
+
+
+def test_exact_hit_ignores_preamble_and_case():
+    index = AnswerIndex(path=None)
+    index.put(ALICE, "Nice! What is your budget?", "Around $500k.")
+    assert index.get(ALICE, "Thanks. WHAT is your budget?") == "Around $500k."
+    assert index.get(ALICE, "What is your timeline?") is None
+    assert (index.hits, index.misses) == (1, 1)
+
+
+def test_personas_are_kept_apart():
+    index = AnswerIndex(path=None)
+    index.put(ALICE, "What is your budget?", "Around $500k.")
+    assert index.get(BOB, "What is your budget?") is None
+    # editing a persona makes it a different persona
+    assert index.get({**ALICE, "budget": "$600k"}, "What is your budget?") is None
+
+
+def test_lru_eviction_at_max_entries():
+    index = AnswerIndex(path=None, max_entries=2)
+    index.put(ALICE, "Question one?", "1")
+    index.put(ALICE, "Question two?", "2")
+    assert index.get(ALICE, "Question one?") == "1"   # now the most recently used
+    index.put(ALICE, "Question three?", "3")
+    assert len(index) == 2
+    assert index.get(ALICE, "Question two?") is None
+    assert index.get(ALICE, "Question one?") == "1"
+    assert index.get(ALICE, "Question three?") == "3"
+
+
+def test_fuzzy_is_off_by_default():
+    index = AnswerIndex(path=None, fuzzy_threshold=None)
+    index.put(ALICE, "What is your budget?", "Around $500k.")
+    assert index.get(ALICE, "And what would your budget be?") is None
+
+
+def test_fuzzy_needs_the_same_content_words():
+    index = AnswerIndex(path=None, fuzzy_threshold=0.5)
+    index.put(ALICE, "How many bedrooms do you want, 3?", "Three.")
+    # only filler words differ: a fuzzy hit
+    assert index.get(ALICE, "So how many bedrooms would you want, 3?") == "Three."
+    assert index.fuzzy_hits == 1
+    # a different number or a different noun is a different question, however similar the text
+    assert index.get(ALICE, "How many bedrooms do you want, 5?") is None
+    assert index.get(ALICE, "How many bathrooms do you want, 3?") is None
+    assert index.get(BOB, "So how many bedrooms would you want, 3?") is None
+
+
+def test_save_and_load_keep_entries_and_lru_order(tmp_path):
+    path = str(tmp_path / "index.json")
+    index = AnswerIndex(path=path, max_entries=3)
+    for n in ("one", "two", "three"):
+        index.put(ALICE, f"Question {n}?", n)
+    index.get(ALICE, "Question one?")   # order is now two, three, one
+    index.save()
+
+    restored = AnswerIndex(path=path, max_entries=3)
+    assert len(restored) == 3
+    restored.put(ALICE, "Question four?", "four")   # evicts the least recently used: two
+    assert restored.get(ALICE, "Question two?") is None
+    assert [restored.get(ALICE, f"Question {n}?") for n in ("one", "three", "four")] == ["one", "three", "four"]
+
+    # a smaller index keeps the most recently used entries
+    small = AnswerIndex(path=path, max_entries=1)
+    assert small.get(ALICE, "Question one?") == "one" and len(small) == 1
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from phase1_tester.cassette.cassette import Cassette, CassetteExhausted
+from phase1_tester.client.chat_client import ChatClient
+from phase2_tester.logs_client import LogsApiClient
+
+UNREACHABLE = "http://127.0.0.1:9"
+
+
+def _conversation(chat, logs, replaying=False):
+    first = chat.send_message("Hi, I want to buy a house", None)
+    second = chat.send_message("My budget is $500k", first.session_id)
+    if not replaying:
+        time.sleep(0.05)   # let the stub's turn logs become visible
+    fetched = logs.fetch_logs(chat.user_id, first.session_id, limit=50)
+    return first, second, fetched
+
+
+def test_record_then_replay_without_network(stub, tmp_path):
+    server = stub()
+    path = str(tmp_path / "run.jsonl")
+    with Cassette(path, "record") as cassette:
+        chat = ChatClient(server.base_url + "/chat/fast", "u1", 5, 1, cassette=cassette)
+        logs = LogsApiClient(server.base_url + "/logs/api", cassette=cassette)
+        recorded = _conversation(chat, logs)
+
+    with Cassette(path, "replay") as cassette:
+        chat = ChatClient(UNREACHABLE + "/chat/fast", "u1", 5, 1, cassette=cassette)
+        logs = LogsApiClient(UNREACHABLE + "/logs/api", cassette=cassette)
+        replayed = _conversation(chat, logs, replaying=True)
+
+    for rec, rep in zip(recorded[:2], replayed[:2]):
+        assert rep.assistant_text == rec.assistant_text and rep.assistant_text
+        assert rep.session_id == rec.session_id
+        assert rep.raw_events_count == rec.raw_events_count
+    assert replayed[2].logs == recorded[2].logs
+    assert {log["log_type"] for log in replayed[2].logs} >= {"intent_classifier", "main_model"}
+
+
+def test_replay_serves_each_kind_in_order_and_then_runs_out(tmp_path):
+    path = str(tmp_path / "tape.jsonl")
+    with Cassette(path, "record") as cassette:
+        cassette.record("driver", reply="one")
+        cassette.record("logs", payload={"success": True, "logs": []})
+        cassette.record("driver", reply="two")
+    with Cassette(path, "replay") as cassette:
+        assert cassette.next("driver")["reply"] == "one"
+        assert cassette.next("driver")["reply"] == "two"
+        assert cassette.next("logs")["payload"]["success"] is True
+        with pytest.raises(CassetteExhausted):
+            cassette.next("driver")
+
+
+def test_recorded_errors_replay_as_errors(tmp_path):
+    path = str(tmp_path / "tape.jsonl")
+    with Cassette(path, "record") as cassette:
+        chat = ChatClient(UNREACHABLE + "/chat/fast", "u1", 1, 1, cassette=cassette)
+        with pytest.raises(Exception):
+            chat.send_message("hi", None)
+    with Cassette(path, "replay") as cassette:
+        chat = ChatClient(UNREACHABLE + "/chat/fast", "u1", 1, 1, cassette=cassette)
+        with pytest.raises(RuntimeError):
+            chat.send_message("hi", None)
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "x.jsonl"), "rewind")
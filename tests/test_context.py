@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytest
+
+from phase1_tester.config.types import Turn
+from phase1_tester.driver.context import SUMMARY_HEADER, build_driver_context
+from phase1_tester.driver.tokens import count_message_tokens, count_tokens
+from phase1_tester.persona.prompts import persona_messages
+
+PERSONA = {"name": "Alice", "budget": "$500k", "bedrooms": 3}
+NOW = datetime(2026, 1, 1)
+PREFIX_TOKENS = count_message_tokens(persona_messages(PERSONA))
+
+
+def _conversation(n):
+    turns = []
+    for i in range(n):
+        turns.append(Turn("assistant", f"Thanks for that. Question number {i}: what about detail {i}?", NOW))
+        turns.append(Turn("user", f"My answer to question {i} is a fairly long sentence about detail {i}.", NOW))
+    return turns
+
+
+def test_short_conversation_is_sent_verbatim():
+    turns = _conversation(2)
+    last = "What else should I know?"
+    prompt = build_driver_context(PERSONA, last, turns + [Turn("assistant", last, NOW)], max_tokens=10_000)
+    head = persona_messages(PERSONA)
+    assert prompt.messages[:len(head)] == head
+    assert prompt.messages[len(head):-1] == [{"role": t.role, "content": t.content} for t in turns]
+    # the trailing copy of last_assistant is dropped: it is sent once, at the end
+    assert prompt.messages[-1] == {"role": "assistant", "content": last}
+    assert (prompt.turns_kept, prompt.turns_summarized) == (4, 0)
+    assert prompt.prompt_tokens == count_message_tokens(prompt.messages)
+
+
+@pytest.mark.parametrize("room", [200, 400, 800])
+def test_long_conversation_stays_under_budget(room):
+    max_tokens = PREFIX_TOKENS + room
+    turns = _conversation(40)
+    prompt = build_driver_context(PERSONA, "Anything else?", turns, max_tokens=max_tokens, summary_max_tokens=120)
+    assert prompt.prompt_tokens == count_message_tokens(prompt.messages)
+    assert prompt.prompt_tokens <= max_tokens
+    assert prompt.turns_kept + prompt.turns_summarized == len(turns)
+    assert prompt.turns_summarized > 0 and prompt.turns_kept > 0
+
+    # the newest turns are kept verbatim, in order
+    head = len(persona_messages(PERSONA))
+    kept = prompt.messages[head + 1:-1]
+    assert kept == [{"role": t.role, "content": t.content} for t in turns[-prompt.turns_kept:]]
+
+    # the older turns are folded into one summary, newest lines first to survive
+    summary = prompt.messages[head]
+    assert summary["role"] == "system" and summary["content"].startswith(SUMMARY_HEADER)
+    assert count_tokens(summary["content"]) <= 120
+    assert "detail 0?" not in summary["content"]
+    # ... ending with the turn just before the verbatim ones
+    last_line = summary["content"].splitlines()[-1]
+    newest_summarized = turns[prompt.turns_summarized - 1]
+    assert last_line.startswith("- agent:" if newest_summarized.role == "assistant" else "- me:")
+    assert last_line.split()[-1].rstrip(".?") in newest_summarized.content
+
+
+def test_summary_lists_only_the_agents_questions():
+    turns = [
+        Turn("assistant", "Great to meet you! I can help. How many bedrooms do you need?", NOW),
+        Turn("user", "Three.", NOW),
+    ] + _conversation(30)
+    prompt = build_driver_context(PERSONA, "Anything else?", turns, max_tokens=PREFIX_TOKENS + 1200,
+                                  summary_max_tokens=1000)
+    summary = prompt.messages[len(persona_messages(PERSONA))]["content"]
+    assert "- agent: How many bedrooms do you need?" in summary
+    assert "Great to meet you" not in summary
+
+
+def test_prefix_and_last_message_are_always_sent():
+    prompt = build_driver_context(PERSONA, "Anything else?", _conversation(10), max_tokens=1)
+    head = persona_messages(PERSONA)
+    assert prompt.messages == head + [{"role": "assistant", "content": "Anything else?"}]
+    assert (prompt.turns_kept, prompt.turns_summarized) == (0, 0)
@@ -0,0 +1,81 @@
+import json
+import math
+import random
+
+import pytest
+
+from phase1_tester.metrics.histogram import HistogramSet, LatencyHistogram
+
+
+def exact_percentile(values, p):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * p / 100.0)) - 1]
+
+
+@pytest.mark.parametrize("precision", [0.01, 0.05])
+def test_percentiles_within_bucket_error(precision):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-2, 1.5) for _ in range(20000)]   # ~ms..s latencies
+    h = LatencyHistogram(precision=precision)
+    for v in values:
+        h.record(v)
+    for p in (1, 10, 50, 90, 99, 99.9):
+        exact = exact_percentile(values, p)
+        assert h.percentile(p) == pytest.approx(exact, rel=precision * 1.001)
+    assert h.percentile(100) == max(values)
+    assert h.count == len(values)
+    assert h.mean() == pytest.approx(sum(values) / len(values))
+
+
+def test_empty_and_ignored_values():
+    h = LatencyHistogram()
+    assert h.percentile(50) is None and h.mean() is None
+    for bad in (None, -1.0, float("nan")):
+        h.record(bad)
+    assert h.count == 0
+    h.record(0.0)
+    assert h.percentile(50) == 0.0   # clamped to min/max, not the bucket midpoint
+
+
+def test_merge_equals_recording_everything_in_one():
+    rng = random.Random(3)
+    a_values = [rng.uniform(0.001, 0.5) for _ in range(500)]
+    b_values = [rng.uniform(0.2, 3.0) for _ in range(700)]
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for v in a_values:
+        a.record(v)
+        both.record(v)
+    for v in b_values:
+        b.record(v)
+        both.record(v)
+    merged = a.merge(b)
+    assert merged.counts == both.counts
+    assert (merged.count, merged.min, merged.max) == (both.count, both.min, both.max)
+    assert merged.total == pytest.approx(both.total)
+    assert merged.percentile(90) == both.percentile(90)
+
+
+def test_merge_rejects_different_precision():
+    with pytest.raises(ValueError):
+        LatencyHistogram(precision=0.01).merge(LatencyHistogram(precision=0.02))
+
+
+def test_set_merge_and_json_round_trip():
+    first, second = HistogramSet(), HistogramSet()
+    for v in (0.1, 0.2, 0.3):
+        first.record("chat_ttft", v)
+    second.record("chat_ttft", 0.4)
+    second.record("driver", 1.5)
+    second.record("driver", None)
+    merged = HistogramSet().merge(first).merge(second)
+    assert merged.histograms["chat_ttft"].count == 4
+    assert merged.histograms["driver"].count == 1
+
+    text = merged.to_json()
+    json.loads(text)
+    restored = HistogramSet.from_json(text)
+    assert restored.summary() == merged.summary()
+    assert restored.histograms["chat_ttft"].counts == merged.histograms["chat_ttft"].counts
+    # a restored set keeps merging like the original
+    restored.merge(second)
+    assert restored.histograms["driver"].count == 2
@@ -0,0 +1,58 @@
+import time
+
+from phase1_tester.cassette.cassette import Cassette
+from phase2_tester.log_poller import LogPoller
+
+
+class FakeReader:
+    """Serves each log once its visible_at (seconds after creation) has passed."""
+
+    def __init__(self, logs):
+        self.created = time.perf_counter()
+        self.pending = sorted(logs, key=lambda pair: pair[0])
+        self.fetches = 0
+
+    def get_new_logs(self, **kwargs):
+        self.fetches += 1
+        now = time.perf_counter() - self.created
+        ready = [log for at, log in self.pending if at <= now]
+        self.pending = [(at, log) for at, log in self.pending if at > now]
+        return ready
+
+
+LOGS = [
+    (0.0, {"log_type": "intent_classifier"}),
+    (0.0, {"log_type": "main_model"}),
+    (0.15, {"log_type": "extraction_model"}),
+]
+
+
+def _poller(reader, cassette=None, settle_sec=0.3):
+    return LogPoller(reader, initial_interval_sec=0.05, max_interval_sec=0.1, timeout_sec=2.0,
+                     settle_sec=settle_sec, cassette=cassette)
+
+
+def test_settle_window_keeps_late_log_in_its_turn():
+    result = _poller(FakeReader(LOGS)).poll("u", "s")
+    assert result.complete
+    assert [log["log_type"] for log in result.logs][-1] == "extraction_model"
+
+
+def test_without_settle_window_stops_at_expected_types():
+    result = _poller(FakeReader(LOGS), settle_sec=0.0).poll("u", "s")
+    assert result.polls == 1
+    assert "extraction_model" not in result.found_types
+
+
+def test_replay_repeats_recorded_polls_without_sleeping(tmp_path):
+    path = str(tmp_path / "tape.jsonl")
+    with Cassette(path, "record") as cassette:
+        recorded = _poller(FakeReader(LOGS), cassette).poll("u", "s")
+
+    reader = FakeReader([])
+    with Cassette(path, "replay") as cassette:
+        started = time.perf_counter()
+        replayed = _poller(reader, cassette).poll("u", "s")
+    assert time.perf_counter() - started < 0.05
+    assert reader.fetches == replayed.polls == recorded.polls
+    assert replayed.lag_sec == recorded.lag_sec
@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+from phase2_tester.logs_client import LogsApiClient
+
+
+class CountingSession(requests.Session):
+    """Counts GETs; with fail_after set, the later ones fail like a dropped connection."""
+
+    def __init__(self, fail_after=None):
+        super().__init__()
+        self.params = []
+        self.fail_after = fail_after
+
+    def get(self, url, **kwargs):
+        self.params.append(dict(kwargs["params"]))
+        if self.fail_after is not None and len(self.params) > self.fail_after:
+            raise requests.ConnectionError("dropped")
+        return super().get(url, **kwargs)
+
+
+def _server_with_turns(stub, turns, **config):
+    """A stub with `turns` turns of logs (3 each, ids 1..3*turns) already visible."""
+    server = stub(**config)
+    for i in range(turns):
+        server.state.write_turn_logs("u1", "s1", f"answer {i}", f"reply {i}")
+    server.state.write_turn_logs("u1", "other-session", "x", "y")
+    return server
+
+
+def _client(server, session):
+    return LogsApiClient(server.base_url + "/logs/api", session=session)
+
+
+def _ids(resp):
+    return [log["id"] for log in resp.logs]
+
+
+def test_cursor_pages_forward_until_no_more(stub):
+    server = _server_with_turns(stub, 5)
+    session = CountingSession()
+    resp = _client(server, session).fetch_logs_since("u1", "s1", since_id=2, page_size=4)
+    assert resp.success
+    assert _ids(resp) == list(range(3, 16))
+    # 13 new logs in pages of 4, each starting after the last id seen
+    assert [p["since_id"] for p in session.params] == [2, 6, 10, 14]
+    assert all(p["limit"] == 4 for p in session.params)
+
+
+def test_cursor_with_nothing_new(stub):
+    server = _server_with_turns(stub, 2)
+    session = CountingSession()
+    resp = _client(server, session).fetch_logs_since("u1", "s1", since_id=6, page_size=4)
+    assert resp.success and resp.logs == []
+    assert len(session.params) == 1
+
+
+def test_legacy_server_doubles_the_window_until_it_reaches_old_logs(stub):
+    server = _server_with_turns(stub, 5, legacy_logs=True)
+    session = CountingSession()
+    resp = _client(server, session).fetch_logs_since("u1", "s1", since_id=2, page_size=4)
+    assert resp.success
+    assert _ids(resp) == list(range(3, 16))   # oldest first, old logs filtered out
+    assert [p["limit"] for p in session.params] == [4, 8, 16]
+
+
+def test_legacy_server_with_one_small_page(stub):
+    server = _server_with_turns(stub, 5, legacy_logs=True)
+    session = CountingSession()
+    resp = _client(server, session).fetch_logs_since("u1", "s1", since_id=12, page_size=4)
+    assert _ids(resp) == [13, 14, 15]
+    assert len(session.params) == 1
+
+
+@pytest.mark.parametrize("legacy_logs", [False, True])
+def test_max_pages_caps_the_requests(stub, legacy_logs):
+    server = _server_with_turns(stub, 5, legacy_logs=legacy_logs)
+    session = CountingSession()
+    resp = _client(server, session).fetch_logs_since("u1", "s1", since_id=0, page_size=2, max_pages=2)
+    assert len(session.params) == 2
+    assert resp.success and len(resp.logs) == 4 and _ids(resp) == sorted(_ids(resp))
+
+
+def test_failure_after_some_pages_returns_what_was_collected(stub):
+    server = _server_with_turns(stub, 5)
+    resp = _client(server, CountingSession(fail_after=2)).fetch_logs_since("u1", "s1", since_id=0, page_size=4)
+    assert resp.success
+    assert _ids(resp) == list(range(1, 9))
+
+
+def test_failure_on_the_first_page_is_reported(stub):
+    server = _server_with_turns(stub, 1)
+    resp = _client(server, CountingSession(fail_after=0)).fetch_logs_since("u1", "s1", since_id=0)
+    assert not resp.success and "dropped" in resp.error
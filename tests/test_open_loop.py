@@ -0,0 +1,33 @@
+import pytest
+
+from phase1_tester.orchestration.open_loop import arrival_offsets
+
+
+def test_constant_rate():
+    offsets = arrival_offsets(2, 5)
+    assert len(offsets) == 10
+    assert offsets == pytest.approx([k / 2 for k in range(10)])
+
+
+def test_ramp_up():
+    offsets = arrival_offsets(1, 10, 3)   # N(10) = (1 + 3) / 2 * 10 = 20
+    assert len(offsets) == 20
+    assert offsets == sorted(offsets) and offsets[-1] < 10
+    gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+    assert gaps[-1] < gaps[0]
+
+
+@pytest.mark.parametrize("end_rate", [0, 0.1])
+def test_ramp_down(end_rate):
+    offsets = arrival_offsets(1, 5, end_rate)
+    expected = (1 + end_rate) / 2 * 5
+    assert len(offsets) == int(expected) + (0 if expected == int(expected) else 1)
+    assert offsets == sorted(offsets) and offsets[-1] < 5
+    gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+    assert gaps[-1] > gaps[0]
+
+
+@pytest.mark.parametrize("duration", [0, -1])
+def test_rejects_empty_duration(duration):
+    with pytest.raises(ValueError):
+        arrival_offsets(1, duration)
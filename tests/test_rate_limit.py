@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded
+from phase1_tester.client.rate_limit import FileTokenBucket, RateLimiter, TokenBucket
+
+
+def test_burst_then_negative_reservations_wait_in_order():
+    bucket = TokenBucket(rate=10.0, burst=2.0)
+    waits = [bucket.reserve() for _ in range(5)]
+    assert waits[:2] == [0.0, 0.0]
+    # the balance goes negative: each waiter is one token (0.1s) behind the previous one
+    assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_reservation_over_max_wait_takes_nothing():
+    bucket = TokenBucket(rate=1.0, burst=1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(max_wait=0.5) is None
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+def test_request_larger_than_burst_is_clamped():
+    bucket = TokenBucket(rate=1.0, burst=3.0)
+    assert bucket.reserve(10) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.01)
+
+
+def test_bucket_refills_at_rate(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("phase1_tester.client.rate_limit.time.monotonic", lambda: now[0])
+    bucket = TokenBucket(rate=2.0, burst=2.0)
+    bucket.reserve(2)
+    now[0] += 0.5   # one token back
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_limiter_records_waits_and_enforces_deadline():
+    limiter = RateLimiter({"chat": TokenBucket(rate=1.0, burst=1.0)})
+    assert limiter.acquire("unlimited") == 0.0
+    assert limiter.acquire("chat", deadline=Deadline(5)) == 0.0
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("chat", deadline=Deadline(0.2))
+    assert limiter.histograms.histograms["ratelimit_chat"].count == 1
+    assert limiter.waited == {}
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = """
+import sys
+from phase1_tester.client.rate_limit import FileTokenBucket
+bucket = FileTokenBucket(sys.argv[1], rate=0.001, burst=100.0)
+print(sum(bucket.reserve() for _ in range(50)))
+"""
+
+
+def test_file_bucket_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "chat.bucket")
+    children = [
+        subprocess.Popen([sys.executable, "-c", _CHILD, path], cwd=ROOT, stdout=subprocess.PIPE, text=True)
+        for _ in range(2)
+    ]
+    waits = [float(child.communicate(timeout=60)[0]) for child in children]
+    assert all(child.returncode == 0 for child in children)
+    # 2 x 50 reservations fit the burst of 100 exactly: no waits, and no lost updates
+    assert waits == [0.0, 0.0]
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["tokens"] == pytest.approx(0.0, abs=0.01)
+    # this process sees the same (empty) bucket
+    assert FileTokenBucket(path, rate=0.001, burst=100.0).reserve() > 900
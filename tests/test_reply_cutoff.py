@@ -0,0 +1,48 @@
+import pytest
+
+from phase1_tester.driver.llm_driver import reply_cutoff
+
+
+def _cut(text, questions):
+    end = reply_cutoff(text, questions)
+    return None if end is None else text[:end]
+
+
+@pytest.mark.parametrize(
+    "text, questions, expected",
+    [
+        ("Yes. I have two kids.", 1, "Yes."),
+        ("Yes. I have two kids.", 2, "Yes. I have two kids."),
+        ("Around $500k! Three bedrooms? Maybe.", 2, "Around $500k! Three bedrooms?"),
+        # one answer per line, with or without a full stop
+        ("Budget: $200k\nBedrooms: 3\n", 2, "Budget: $200k\nBedrooms: 3"),
+        ("Budget: $200k\nBedrooms: 3\n", 1, "Budget: $200k"),
+        # a line break right after a sentence end closes the same answer, not the next one
+        ("Yes.\nNo.\n", 2, "Yes.\nNo."),
+        ("Yes.\n\nNo.", 2, "Yes.\n\nNo."),
+        # a "." inside a number is not a sentence end
+        ("About $1.5 million. Soon.", 1, "About $1.5 million."),
+    ],
+)
+def test_cutoff(text, questions, expected):
+    assert _cut(text, questions) == expected
+
+
+@pytest.mark.parametrize(
+    "text, questions",
+    [
+        ("", 1),
+        ("Yes", 1),                   # no sentence end yet
+        ("Yes. I have", 2),
+        ("Around $200.", 1),          # the "." after a digit may be "$200.5" still streaming in
+        ("Budget: $200k\n", 2),
+        ("\n\n.", 1),                 # line breaks and punctuation alone are no answer
+    ],
+)
+def test_incomplete_reply_keeps_reading(text, questions):
+    assert reply_cutoff(text, questions) is None
+
+
+def test_digit_dot_ends_the_answer_once_followed_by_whitespace():
+    assert _cut("Around $200. ", 1) == "Around $200."
+    assert _cut("Around $200.\n", 1) == "Around $200."
@@ -0,0 +1,104 @@
+import asyncio
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+import pytest
+import requests
+
+from phase1_tester.client.deadline import Deadline, DeadlineExceeded
+from phase1_tester.client.retry import RetryBudget, RetryPolicy, classify
+
+
+def http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retryable_status(status):
+    assert classify(http_error(status)) == (True, None)
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 422])
+def test_client_errors_fail_fast(status):
+    assert classify(http_error(status)) == (False, None)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [requests.ConnectionError(), requests.Timeout(), aiohttp.ClientConnectionError(), asyncio.TimeoutError()],
+)
+def test_connection_errors_and_timeouts_are_retryable(exc):
+    assert classify(exc) == (True, None)
+
+
+def test_deadline_and_bugs_are_not_retryable():
+    assert classify(DeadlineExceeded()) == (False, None)
+    assert classify(ValueError("bad json")) == (False, None)
+
+
+def test_retry_after_seconds_and_http_date():
+    assert classify(http_error(503, "2.5")) == (True, 2.5)
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    retryable, retry_after = classify(http_error(429, format_datetime(when, usegmt=True)))
+    assert retryable and 28 <= retry_after <= 30
+    assert classify(http_error(429, "soon")) == (True, None)
+
+
+def test_aiohttp_status_and_retry_after():
+    exc = aiohttp.ClientResponseError(None, (), status=429, headers={"Retry-After": "1"})
+    assert classify(exc) == (True, 1.0)
+
+
+def test_full_jitter_stays_within_bounds():
+    policy = RetryPolicy(5, base_delay_sec=0.25, max_delay_sec=1.0, rng=random.Random(1))
+    for retry in range(6):
+        cap = min(1.0, 0.25 * 2 ** retry)
+        delays = [policy.backoff(retry) for _ in range(200)]
+        assert all(0 <= d <= cap for d in delays)
+        assert max(delays) > cap / 2   # actually spread over the range
+
+
+def test_retry_after_is_honoured_and_capped():
+    policy = RetryPolicy(3, max_retry_after_sec=5.0)
+    assert policy.next_delay(http_error(503, "2"), 0) == 2.0
+    assert policy.next_delay(http_error(503, "60"), 0) == 5.0
+
+
+def test_attempts_are_capped():
+    policy = RetryPolicy(3)
+    assert policy.next_delay(requests.ConnectionError(), 0) is not None
+    assert policy.next_delay(requests.ConnectionError(), 1) is not None
+    assert policy.next_delay(requests.ConnectionError(), 2) is None
+
+
+def test_no_retry_once_bytes_were_received():
+    policy = RetryPolicy(3)
+    assert policy.next_delay(requests.ConnectionError(), 0, bytes_received=True) is None
+    assert policy.budget.spent == 0
+
+
+def test_no_retry_that_cannot_start_before_the_deadline():
+    policy = RetryPolicy(3)
+    assert policy.next_delay(http_error(503, "5"), 0, deadline=Deadline(1.0)) is None
+    assert policy.next_delay(http_error(503, "0.1"), 0, deadline=Deadline(1.0)) == 0.1
+
+
+def test_budget_is_shared_and_runs_out():
+    budget = RetryBudget(max_retries=2)
+    first, second = RetryPolicy(5, budget=budget), RetryPolicy(5, budget=budget)
+    assert first.next_delay(requests.ConnectionError(), 0) is not None
+    assert second.next_delay(requests.ConnectionError(), 0) is not None
+    assert first.next_delay(requests.ConnectionError(), 1) is None
+    assert (budget.spent, budget.denied) == (2, 1)
+
+
+def test_non_retryable_errors_do_not_spend_budget():
+    policy = RetryPolicy(3)
+    assert policy.next_delay(http_error(404), 0) is None
+    assert policy.budget.spent == 0
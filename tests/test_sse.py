@@ -0,0 +1,90 @@
+import pytest
+
+from phase1_tester.client.sse import SSEParser, fast_content_chunk, fast_content_delta
+
+STREAM = (
+    b'data: {"type": "session_id", "session_id": "s1"}\n\n'
+    b": keep-alive\n\n"
+    b'event: delta\nid: 7\ndata: {"type":"content","delta":"Hi \xc3\xa9"}\n\n'
+    b"data: line one\ndata:line two\n\n"
+)
+
+
+def _parse(chunks):
+    parser = SSEParser()
+    events = [e for chunk in chunks for e in parser.feed(chunk)]
+    return events + parser.flush()
+
+
+def _expected():
+    return _parse([STREAM])
+
+
+def test_whole_stream():
+    events = _expected()
+    assert [e.data for e in events] == [
+        b'{"type": "session_id", "session_id": "s1"}',
+        b'{"type":"content","delta":"Hi \xc3\xa9"}',
+        b"line one\nline two",
+    ]
+    assert (events[1].event, events[1].id) == (b"delta", b"7")
+    assert events[2].lines == 2
+
+
+@pytest.mark.parametrize("offset", range(1, len(STREAM)))
+def test_split_at_every_byte_offset(offset):
+    assert _parse([STREAM[:offset], STREAM[offset:]]) == _expected()
+
+
+def test_one_byte_chunks():
+    assert _parse([STREAM[i:i + 1] for i in range(len(STREAM))]) == _expected()
+
+
+@pytest.mark.parametrize("newline", [b"\r\n", b"\r", b"\n"])
+def test_line_endings(newline):
+    stream = STREAM.replace(b"\n", newline)
+    assert _parse([stream]) == _expected()
+    # ... also when the chunks split a \r\n pair
+    assert _parse([stream[i:i + 3] for i in range(0, len(stream), 3)]) == _expected()
+
+
+def test_multi_line_data_is_joined_with_newlines():
+    (event,) = _parse([b"data: a\ndata:\ndata: c\n\n"])
+    assert event.data == b"a\n\nc" and event.lines == 3
+
+
+def test_missing_blank_line_between_events_merges_them():
+    # Without the blank line there is no dispatch: the data lines form one event.
+    (event,) = _parse([b'data: {"a": 1}\ndata: {"b": 2}\n\n'])
+    assert event.data == b'{"a": 1}\n{"b": 2}'
+
+
+def test_flush_dispatches_a_final_event_without_blank_line():
+    parser = SSEParser()
+    assert parser.feed(b"data: last") == []
+    assert parser.pending
+    (event,) = parser.flush()
+    assert event.data == b"last"
+    assert not parser.pending and parser.flush() == []
+
+
+@pytest.mark.parametrize("spacing", [b'{"type": "content", "delta": "', b'{"type":"content","delta":"'])
+def test_fast_path_plain_delta(spacing):
+    assert fast_content_delta(spacing + b'caf\xc3\xa9"}') == "café"
+    assert fast_content_chunk(SSEParser(), b"data: " + spacing + b'hello"}\n\n') == "hello"
+
+
+@pytest.mark.parametrize("body", [b'say \\"hi\\"', b"back\\\\slash", b"new\\nline", b"a\nb", b"a\rb"])
+def test_fast_path_refuses_bodies_that_need_json(body):
+    data = b'{"type": "content", "delta": "' + body + b'"}'
+    assert fast_content_delta(data) is None
+    assert fast_content_chunk(SSEParser(), b"data: " + data + b"\n\n") is None
+
+
+def test_fast_path_refuses_other_events_and_partial_chunks():
+    assert fast_content_delta(b'{"type": "done", "delta": "x"}') is None
+    assert fast_content_chunk(SSEParser(), b'data: {"type": "content", "delta": "x"}\n') is None
+    parser = SSEParser()
+    parser.feed(b"data: partial")
+    # the parser holds a partial line: the chunk must go through it
+    assert fast_content_chunk(parser, b'data: {"type": "content", "delta": "x"}\n\n') is None